@@ -5,7 +5,15 @@ import os
 from flask import Flask
 from dotenv import load_dotenv
 from flask_sqlalchemy import SQLAlchemy
+from config import Config
 from models import db
+from utils.db import init_db
+from utils.log import init_logging
+from utils.metrics import init_metrics
+from utils.sqlprofile import init_sql_profiling
+from utils.versioning import init_versioning
+from utils.fragments import init_fragments
+from services.archive import ensure_archive_schema
 from utils.users import seed_users_from_env
 from services.scheduler import start_scheduler, set_send_sms_function
 from routes.history import history_bp
@@ -13,23 +21,38 @@ from routes.manage import manage_bp
 from routes.sms import sms_bp
 from routes.misc import misc_bp
 from routes.views import views_bp
+from routes.stats import stats_bp
+from routes.export import export_bp
+from routes.api import api_bp
+from routes.events import events_bp
+from routes.calendar import calendar_bp
+from routes.metrics import metrics_bp
 from twilio.rest import Client
-from services.twilio_tools import send_sms
-from utils.context.store import conversation_context
+from services.twilio_tools import send_sms, outbox
+from utils.twilio.outbox import init_outbox
+from utils.context.store import init_context
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///chores.db'
-app.config['SECRET_KEY'] = os.getenv("SECRET_KEY", "shhh")
+app.config.from_object(Config)
 
-# Initialize extensions
-db.init_app(app)
+init_logging(app)
+init_metrics(app)
+
+# Initialize extensions (WAL, busy timeout and pool settings come from Config)
+init_db(app)
+init_sql_profiling(app)
+init_versioning(app)
+init_fragments(app)
+init_outbox(app, outbox)
+init_context(app)
 
 # Create tables and seed users
 with app.app_context():
     db.create_all()
+    ensure_archive_schema()
     seed_users_from_env(db.session)
 
 # Twilio setup
@@ -42,7 +65,7 @@ twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
 
 
 set_send_sms_function(send_sms)
-start_scheduler(db, twilio_client)
+start_scheduler(db, twilio_client, app)
 
 # Register Blueprints
 app.register_blueprint(views_bp)
@@ -50,6 +73,12 @@ app.register_blueprint(history_bp)
 app.register_blueprint(manage_bp)
 app.register_blueprint(misc_bp)
 app.register_blueprint(sms_bp)
+app.register_blueprint(stats_bp)
+app.register_blueprint(export_bp)
+app.register_blueprint(api_bp)
+app.register_blueprint(events_bp)
+app.register_blueprint(calendar_bp)
+app.register_blueprint(metrics_bp)
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -6,10 +6,74 @@ load_dotenv()
 
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "shhh")
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///chores.db'
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", 'sqlite:///chores.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
     TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
     TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
 
-        
\ No newline at end of file
+    # SQLite tuning (applied on every new connection, see utils/db.py)
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", 20000))
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 128 * 1024 * 1024))
+
+    # Connection pool
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+
+    # ChoreHistory retention (see services/archive.py). Empty path disables the archive.
+    HISTORY_ARCHIVE_PATH = os.getenv("HISTORY_ARCHIVE_PATH", "chores_archive.db")
+    HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", 365))
+
+    # Marker file whose mtime is the global data version (ETags, see utils/versioning.py)
+    DATA_VERSION_PATH = os.getenv("DATA_VERSION_PATH", "data_version")
+
+    # Dashboard listings (keyset pagination, see utils/pagination.py)
+    PAGE_SIZE = int(os.getenv("PAGE_SIZE", 25))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 100))
+
+    # Rendered dashboard fragments kept in memory per worker (see utils/fragments.py)
+    FRAGMENT_CACHE_SIZE = int(os.getenv("FRAGMENT_CACHE_SIZE", 2048))
+
+    # Threads per gunicorn gthread worker (see Procfile)
+    WEB_THREADS = int(os.getenv("WEB_THREADS", 8))
+
+    # Live dashboard updates (see routes/events.py). Each open stream holds a
+    # worker thread, so by default half of every worker's threads stay free
+    # for /sms and the dashboard. Other workers' writes are picked up by
+    # polling the data version file.
+    SSE_MAX_CONNECTIONS = int(os.getenv("SSE_MAX_CONNECTIONS", max(WEB_THREADS // 2, 1)))
+    SSE_HEARTBEAT_SECONDS = int(os.getenv("SSE_HEARTBEAT_SECONDS", 15))
+    SSE_VERSION_POLL_SECONDS = float(os.getenv("SSE_VERSION_POLL_SECONDS", 2))
+
+    # Hand out unassigned chores on a timer (see services/autoassign.py); 0 turns it off
+    AUTO_ASSIGN_INTERVAL_HOURS = int(os.getenv("AUTO_ASSIGN_INTERVAL_HOURS", 24))
+
+    # Outgoing SMS (see utils/twilio/encoding.py): ASCII-only bodies stay in GSM-7,
+    # and optional asides are trimmed past this many billed segments (0 = never trim)
+    SMS_GSM7_SAFE = os.getenv("SMS_GSM7_SAFE", "1") not in ("0", "false", "False")
+    SMS_SEGMENT_BUDGET = int(os.getenv("SMS_SEGMENT_BUDGET", 2))
+    # Non-urgent texts to the same number within this many seconds go out as one (0 = off)
+    SMS_COALESCE_SECONDS = float(os.getenv("SMS_COALESCE_SECONDS", 5))
+
+    # SMS conversation context (see utils/context/backends.py): per-phone, bounded, expiring.
+    # "sqlite" shares it between all workers on the host; "memory" is per process.
+    CONTEXT_BACKEND = os.getenv("CONTEXT_BACKEND", "sqlite")
+    CONTEXT_DB_PATH = os.getenv("CONTEXT_DB_PATH", "conversation_context.db")
+    CONTEXT_MAX_ENTRIES = int(os.getenv("CONTEXT_MAX_ENTRIES", 10000))
+    CONTEXT_TTL_SECONDS = int(os.getenv("CONTEXT_TTL_SECONDS", 300))
+    CONTEXT_SWEEP_SECONDS = int(os.getenv("CONTEXT_SWEEP_SECONDS", 60))
+
+    # Structured logs, written off the request thread (see utils/log.py)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_JSON = os.getenv("LOG_JSON", "0") in ("1", "true", "True")
+
+    # In-process timings and counters, served at /metrics (see utils/metrics.py)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") in ("1", "true", "True")
+
+    # Per-request SQL counts/timings (see utils/sqlprofile.py); worst routes at /metrics/sql
+    SQL_PROFILE_ENABLED = os.getenv("SQL_PROFILE_ENABLED", "1") in ("1", "true", "True")
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 100))
+    SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", 5))
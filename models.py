@@ -39,23 +39,34 @@ class User(db.Model):
 class Chore(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    assigned_to_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    assigned_to_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     due_date = db.Column(db.Date, nullable=True)
     recurrence = db.Column(db.String(20), nullable=True)  # e.g. 'daily', 'weekly', etc.
     completed = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_chore_due_date_id', 'due_date', 'id'),
+    )
+
     def __repr__(self):
         return f"<Chore {self.name}>"
 
 class ChoreHistory(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     chore_name = db.Column(db.String(100), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     times_completed = db.Column(db.DateTime, default=datetime.utcnow)
     completed = db.Column(db.Boolean, default=True)
     completed_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
+
+    __table_args__ = (
+        db.Index('ix_chore_history_completed_at_id', 'completed_at', 'id'),
+        db.Index('ix_chore_history_user_completed_at_id', 'user_id', 'completed_at', 'id'),
+        # Archived rows keep their id, so ids must never be handed out again.
+        {'sqlite_autoincrement': True},
+    )
+
     def __repr__(self):
         return f"<ChoreHistory {self.chore_name} by {self.user.name}>"
     
@@ -63,7 +74,7 @@ class ChoreHistory(db.Model):
   
 class ChoreStats(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     chore_name = db.Column(db.String(100), nullable=False)
     times_completed = db.Column(db.Integer, default=1)
 
@@ -73,3 +84,35 @@ class ChoreStats(db.Model):
 
     def __repr__(self):
         return f"<ChoreStats {self.chore_name} by {self.user.name}: {self.completion_count}>"
+
+
+class UserDailyStats(db.Model):
+    """Completions per user per calendar day (UTC), kept in step with ChoreHistory."""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    completions = db.Column(db.Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'day', name='unique_user_day'),
+        db.Index('ix_user_daily_stats_day', 'day'),
+    )
+
+    def __repr__(self):
+        return f"<UserDailyStats user={self.user_id} {self.day}: {self.completions}>"
+
+
+class UserWeeklyStats(db.Model):
+    """Completions per user per ISO week, keyed by the week's Monday."""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    week_start = db.Column(db.Date, nullable=False)
+    completions = db.Column(db.Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'week_start', name='unique_user_week'),
+        db.Index('ix_user_weekly_stats_week_start', 'week_start'),
+    )
+
+    def __repr__(self):
+        return f"<UserWeeklyStats user={self.user_id} {self.week_start}: {self.completions}>"
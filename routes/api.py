@@ -0,0 +1,196 @@
+# routes/api.py
+
+from datetime import datetime
+from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import aliased
+from models import db, Chore, ChoreStats, User
+from services.archive import history_source, spans_archive
+from utils.pagination import keyset_paginate, page_args
+from utils.versioning import conditional
+
+api_bp = Blueprint("api", __name__, url_prefix="/api/v1")
+
+# -------------------------------
+# Read-only JSON API
+# -------------------------------
+# Every endpoint selects plain columns (never whole ORM objects), pages with
+# keyset cursors and accepts ?fields=a,b,c to return only what the client
+# needs. Responses carry the same weak ETag as the dashboard pages.
+
+assignee = aliased(User)
+
+CHORE_FIELDS = {
+    "id": Chore.id,
+    "name": Chore.name,
+    "assigned_to_id": Chore.assigned_to_id,
+    "assigned_to": assignee.name,
+    "due_date": Chore.due_date,
+    "recurrence": Chore.recurrence,
+    "completed": Chore.completed,
+    "created_at": Chore.created_at,
+}
+
+# Phone numbers stay out of the API on purpose.
+USER_FIELDS = {
+    "id": User.id,
+    "name": User.name,
+    "is_admin": User.is_admin,
+    "fatigue_level": User.fatigue_level,
+    "tone_preference": User.tone_preference,
+    "total_chores_completed": User.total_chores_completed,
+}
+
+HISTORY_FIELDS = ("id", "chore_name", "user_id", "user", "completed_at")
+
+STATS_FIELDS = {
+    "id": ChoreStats.id,
+    "user_id": ChoreStats.user_id,
+    "user": User.name,
+    "chore_name": ChoreStats.chore_name,
+    "times_completed": ChoreStats.times_completed,
+}
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+@api_bp.errorhandler(ApiError)
+def _api_error(e):
+    return jsonify({"error": e.message}), e.status
+
+
+def _fields(available) -> list:
+    """The requested ?fields= (in available order), or all of them."""
+    raw = request.args.get("fields")
+    if not raw:
+        return list(available)
+    wanted = {f.strip() for f in raw.split(",") if f.strip()}
+    unknown = wanted - set(available)
+    if unknown:
+        raise ApiError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return [f for f in available if f in wanted]
+
+
+def _flag(name):
+    value = request.args.get(name)
+    if value is None:
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    if value.lower() in ("0", "false", "no"):
+        return False
+    raise ApiError(f"{name} must be true or false")
+
+
+def _date(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise ApiError(f"{name} must be YYYY-MM-DD")
+
+
+def _assignee():
+    """?assignee=<user id> or ?assignee=none for unassigned chores."""
+    value = request.args.get("assignee")
+    if value is None:
+        return None
+    if value == "none":
+        return "none"
+    if not value.isdigit():
+        raise ApiError("assignee must be a user id or 'none'")
+    return int(value)
+
+
+def _plain(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _page_response(page, names):
+    if len(names) == 1:
+        data = [{names[0]: _plain(item)} for item in page]
+    else:
+        # Rows also carry the keyset's _sort_key/_id_key columns; zip stops before them.
+        data = [dict(zip(names, map(_plain, row))) for row in page]
+    return jsonify({"data": data, "next_cursor": page.next_cursor, "prev_cursor": page.prev_cursor})
+
+
+@api_bp.route("/chores")
+@conditional
+def chores():
+    names = _fields(CHORE_FIELDS)
+    query = db.session.query(*(CHORE_FIELDS[n].label(n) for n in names)).select_from(Chore)
+    if "assigned_to" in names:
+        query = query.outerjoin(assignee, assignee.id == Chore.assigned_to_id)
+
+    who = _assignee()
+    if who == "none":
+        query = query.filter(Chore.assigned_to_id.is_(None))
+    elif who is not None:
+        query = query.filter(Chore.assigned_to_id == who)
+    completed = _flag("completed")
+    if completed is not None:
+        query = query.filter(Chore.completed == completed)
+    due_from, due_to = _date("due_from"), _date("due_to")
+    if due_from:
+        query = query.filter(Chore.due_date >= due_from.date())
+    if due_to:
+        query = query.filter(Chore.due_date <= due_to.date())
+
+    page = keyset_paginate(query, Chore.due_date, Chore.id, nullable=True, **page_args())
+    return _page_response(page, names)
+
+
+@api_bp.route("/users")
+@conditional
+def users():
+    names = _fields(USER_FIELDS)
+    query = db.session.query(*(USER_FIELDS[n].label(n) for n in names)).select_from(User)
+    page = keyset_paginate(query, User.name, User.id, **page_args())
+    return _page_response(page, names)
+
+
+@api_bp.route("/history")
+@conditional
+def history():
+    names = _fields(HISTORY_FIELDS)
+    start, end = _date("start_date"), _date("end_date")
+    source = history_source(include_archive=spans_archive(start))
+    columns = {n: source.c[n] for n in ("id", "chore_name", "user_id", "completed_at")}
+    columns["user"] = User.name
+    query = db.session.query(*(columns[n].label(n) for n in names)).select_from(source)
+    if "user" in names:
+        query = query.join(User, User.id == source.c.user_id)
+
+    who = _assignee()
+    if who == "none":
+        raise ApiError("history is always tied to a user")
+    if who is not None:
+        query = query.filter(source.c.user_id == who)
+    if start:
+        query = query.filter(source.c.completed_at >= start)
+    if end:
+        query = query.filter(source.c.completed_at <= end)
+
+    page = keyset_paginate(query, source.c.completed_at, source.c.id, descending=True, **page_args())
+    return _page_response(page, names)
+
+
+@api_bp.route("/stats")
+@conditional
+def stats():
+    names = _fields(STATS_FIELDS)
+    query = db.session.query(*(STATS_FIELDS[n].label(n) for n in names)).select_from(ChoreStats)
+    if "user" in names:
+        query = query.join(User, User.id == ChoreStats.user_id)
+    who = _assignee()
+    if who not in (None, "none"):
+        query = query.filter(ChoreStats.user_id == who)
+    page = keyset_paginate(query, ChoreStats.id, ChoreStats.id, **page_args())
+    return _page_response(page, names)
@@ -0,0 +1,94 @@
+# routes/calendar.py
+
+import hashlib
+import hmac
+import threading
+import click
+from flask import Blueprint, Response, abort, current_app, request, url_for
+from models import db, Chore, User
+from utils.ical import build_calendar
+from utils.versioning import data_version
+
+calendar_bp = Blueprint("calendar", __name__)
+
+# -------------------------------
+# Per-user iCalendar Feeds
+# -------------------------------
+# Each user's serialized feed is cached with the global data version it was
+# checked against. While that version stands the cached bytes are served
+# without touching the database. When it moves, the user's open chores are
+# re-read (one small column query) and the feed is only re-serialized if
+# their fingerprint changed; otherwise the old bytes and ETag are kept, so
+# other people's writes still end in a 304 for this user.
+
+
+class _Feed:
+    __slots__ = ("version", "fingerprint", "body")
+
+    def __init__(self, version, fingerprint, body):
+        self.version = version
+        self.fingerprint = fingerprint
+        self.body = body
+
+
+_feeds = {}
+_feeds_lock = threading.Lock()
+
+
+def feed_token(user_id: int) -> str:
+    """Unguessable per-user token, so feed URLs can be handed to calendar apps."""
+    key = current_app.config["SECRET_KEY"].encode()
+    return hmac.new(key, f"ical:{user_id}".encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def _load_feed(user_id: int) -> _Feed | None:
+    """The user's feed, or None if there is no such user."""
+    version = data_version.current()
+    with _feeds_lock:
+        feed = _feeds.get(user_id)
+    if feed is not None and feed.version == version:
+        return feed
+
+    user = db.session.get(User, user_id)
+    if user is None:
+        return None
+    rows = (
+        db.session.query(Chore.id, Chore.name, Chore.due_date, Chore.recurrence, Chore.created_at)
+        .filter(Chore.assigned_to_id == user.id, Chore.completed.is_(False))
+        .order_by(Chore.due_date, Chore.id)
+        .all()
+    )
+    fingerprint = hashlib.sha1(repr((user.name, [tuple(r) for r in rows])).encode()).hexdigest()
+    if feed is not None and feed.fingerprint == fingerprint:
+        feed = _Feed(version, fingerprint, feed.body)
+    else:
+        feed = _Feed(version, fingerprint, build_calendar(f"{user.name}'s chores", rows))
+    with _feeds_lock:
+        _feeds[user_id] = feed
+    return feed
+
+
+@calendar_bp.route("/calendar/<int:user_id>/<token>.ics")
+def user_feed(user_id, token):
+    if not hmac.compare_digest(token, feed_token(user_id)):
+        abort(404)
+    feed = _load_feed(user_id)
+    if feed is None:
+        abort(404)
+    etag = feed.fingerprint[:20]
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(feed.body, mimetype="text/calendar")
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+@calendar_bp.cli.command("links")
+def links_command():
+    """Print every user's calendar feed path."""
+    with current_app.test_request_context():
+        for user in User.query.order_by(User.name):
+            path = url_for("calendar.user_feed", user_id=user.id, token=feed_token(user.id))
+            click.echo(f"{user.name}: {path}")
@@ -0,0 +1,40 @@
+# routes/events.py
+
+import json
+from flask import Blueprint, Response, current_app
+from utils.pubsub import broker, watch_other_workers
+
+events_bp = Blueprint("events", __name__)
+
+# -------------------------------
+# Live Dashboard Updates (Server-Sent Events)
+# -------------------------------
+
+@events_bp.route("/events")
+def stream():
+    watch_other_workers(current_app.config.get("SSE_VERSION_POLL_SECONDS", 2))
+    sub = broker.subscribe(current_app.config.get("SSE_MAX_CONNECTIONS", 50))
+    if sub is None:
+        return Response("Too many live connections", status=503, headers={"Retry-After": "30"})
+    heartbeat = current_app.config.get("SSE_HEARTBEAT_SECONDS", 15)
+
+    def generate():
+        # No database access in here: an idle client holds one worker thread
+        # blocked on a queue read (gthread workers, see Procfile).
+        yield "retry: 5000\n\n"
+        while True:
+            event = sub.get(timeout=heartbeat)
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+    response = Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # The server closes the response even if the client left before the first
+    # chunk, when a generator's own finally would never run.
+    response.call_on_close(lambda: broker.unsubscribe(sub))
+    return response
@@ -0,0 +1,122 @@
+# routes/export.py
+
+import csv
+import io
+import json
+from datetime import date, datetime
+import click
+from flask import Blueprint, Response, abort, request, stream_with_context
+from sqlalchemy.orm import aliased
+from models import db, Chore, ChoreStats, User
+from routes.history import parse_history_filters, history_query
+
+export_bp = Blueprint("export", __name__)
+
+# -------------------------------
+# Streaming Export
+# -------------------------------
+# Rows are pulled with yield_per and written out in small chunks, so an
+# export holds one batch in memory no matter how big the table is.
+
+DATASETS = ("chores", "history", "stats")
+FORMATS = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+BATCH_SIZE = 500
+
+
+def _chores(user_id=None, start_dt=None, end_dt=None):
+    assignee = aliased(User)
+    query = (
+        db.session.query(
+            Chore.id, Chore.name, assignee.name.label("assigned_to"), Chore.due_date,
+            Chore.recurrence, Chore.completed, Chore.created_at,
+        )
+        .outerjoin(assignee, assignee.id == Chore.assigned_to_id)
+        .order_by(Chore.id)
+    )
+    if user_id:
+        query = query.filter(Chore.assigned_to_id == user_id)
+    if start_dt:
+        query = query.filter(Chore.due_date >= start_dt.date())
+    if end_dt:
+        query = query.filter(Chore.due_date <= end_dt.date())
+    return query
+
+
+def _history(user_id=None, start_dt=None, end_dt=None):
+    query, source = history_query(user_id, start_dt, end_dt)
+    return query.order_by(source.c.completed_at, source.c.id)
+
+
+def _stats(user_id=None, **_dates):
+    query = (
+        db.session.query(User.name.label("user"), ChoreStats.chore_name, ChoreStats.times_completed)
+        .join(User, User.id == ChoreStats.user_id)
+        .order_by(ChoreStats.id)
+    )
+    if user_id:
+        query = query.filter(ChoreStats.user_id == user_id)
+    return query
+
+
+QUERIES = {"chores": _chores, "history": _history, "stats": _stats}
+
+
+def _plain(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def iter_export(dataset: str, fmt: str, filters: dict, batch_size: int = BATCH_SIZE):
+    """Yield the export as text chunks of roughly `batch_size` rows each."""
+    query = QUERIES[dataset](**filters)
+    columns = [c["name"] for c in query.column_descriptions]
+    rows = query.yield_per(batch_size)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer:
+        writer.writerow(columns)
+
+    pending = 0
+    for row in rows:
+        if writer:
+            writer.writerow([_plain(v) for v in row])
+        else:
+            buffer.write(json.dumps(dict(zip(columns, map(_plain, row)))) + "\n")
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@export_bp.route("/export/<dataset>.<fmt>")
+def export(dataset, fmt):
+    if dataset not in DATASETS or fmt not in FORMATS:
+        abort(404)
+    filters = parse_history_filters(request.args)
+    return Response(
+        stream_with_context(iter_export(dataset, fmt, filters)),
+        mimetype=FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename={dataset}.{fmt}"},
+    )
+
+
+@export_bp.cli.command("run")
+@click.argument("dataset", type=click.Choice(DATASETS))
+@click.option("--format", "fmt", type=click.Choice(list(FORMATS)), default="csv", show_default=True)
+@click.option("--user-id", type=int, default=None)
+@click.option("--start-date", default=None, help="YYYY-MM-DD")
+@click.option("--end-date", default=None, help="YYYY-MM-DD")
+@click.option("--output", "-o", type=click.File("w"), default="-", help="Defaults to stdout.")
+def export_command(dataset, fmt, user_id, start_date, end_date, output):
+    """Stream chores, history or stats to a CSV/JSONL file."""
+    filters = parse_history_filters({"user_id": user_id, "start_date": start_date, "end_date": end_date})
+    for chunk in iter_export(dataset, fmt, filters):
+        output.write(chunk)
@@ -1,11 +1,16 @@
 
 # routes/history.py
 
-from flask import Blueprint, redirect, url_for, flash, render_template, request
+import click
+from flask import Blueprint, redirect, url_for, flash, render_template, request, current_app
 from datetime import datetime
-from models import db, Chore, ChoreHistory, User, ChoreStats
+from models import db, Chore, User
 from utils.dusty import dusty_response
+from utils.pagination import keyset_paginate, page_args
+from utils.chores import mark_chore_completed, record_completion
+from services.archive import history_source, spans_archive, archive_history
 from services.twilio_tools import send_sms
+from utils.versioning import conditional
 
 history_bp = Blueprint("history", __name__)
 
@@ -22,69 +27,82 @@ def notify_admins(chore, user):
 
 @history_bp.route('/complete/<int:chore_id>')
 def complete_chore(chore_id):
-    chore = Chore.query.get_or_404(chore_id)
-    if not chore.completed:
-        chore.completed = True
-        chore.completed_at = datetime.utcnow()
-        db.session.add(chore)
-
-        # Track stats
-        if chore.assigned_to:
-            stat = ChoreStats.query.filter_by(user_id=chore.assigned_to.id, chore_name=chore.name).first()
-            if stat:
-                stat.times_completed += 1
-            else:
-                stat = ChoreStats(user_id=chore.assigned_to.id, chore_name=chore.name, times_completed=1)
-            db.session.add(stat)
-
-            # Add to history
-            history = ChoreHistory(chore_name=chore.name, user_id=chore.assigned_to.id, completed=True)
-            db.session.add(history)
-
-            # Update user stats
-            chore.assigned_to.total_chores_completed += 1
-            favorite = (
-                ChoreStats.query
-                .filter_by(user_id=chore.assigned_to.id)
-                .order_by(ChoreStats.times_completed.desc())
-                .first()
-            )
-            if favorite:
-                chore.assigned_to.favorite_chore = favorite.chore_name
-
-            notify_admins(chore, chore.assigned_to)
-
-        db.session.commit()
-        flash(f"Chore '{chore.name}' marked as complete.", 'success')
-    else:
+    won = mark_chore_completed(chore_id)
+    if won is None:
+        chore = db.get_or_404(Chore, chore_id)
         flash(f"Chore '{chore.name}' was already completed.", 'info')
-    return redirect(url_for('main.index'))
+        return redirect(url_for('views.index'))
+
+    name, assignee_id = won
+    assignee = db.session.get(User, assignee_id) if assignee_id else None
+    if assignee:
+        record_completion(assignee, name, datetime.utcnow())
+    db.session.commit()
+
+    if assignee:
+        notify_admins(db.session.get(Chore, chore_id), assignee)
+    flash(f"Chore '{name}' marked as complete.", 'success')
+    return redirect(url_for('views.index'))
+
+
+@history_bp.cli.command("archive")
+@click.option("--days", type=int, default=None, help="Archive history older than this many days.")
+@click.option("--batch-size", default=1000, show_default=True)
+def archive_command(days, batch_size):
+    """Move old ChoreHistory rows into the compacted archive database."""
+    days = days if days is not None else current_app.config.get("HISTORY_RETENTION_DAYS", 365)
+    moved = archive_history(days, batch_size=batch_size)
+    click.echo(f"Archived {moved} history row(s) older than {days} day(s).")
+
+
+def parse_history_filters(args):
+    """Read the user_id/start_date/end_date filters; bad dates are ignored."""
+    def _date(key):
+        value = args.get(key)
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            return None
+
+    user_id = args.get("user_id")
+    return {
+        "user_id": int(user_id) if user_id and str(user_id).isdigit() else None,
+        "start_dt": _date("start_date"),
+        "end_dt": _date("end_date"),
+    }
+
+
+def history_query(user_id=None, start_dt=None, end_dt=None):
+    """
+    Filtered history rows (id, chore_name, completed_at, user_name) plus the
+    source they come from. Only reaches into the archive when the requested
+    range goes back that far.
+    """
+    source = history_source(include_archive=spans_archive(start_dt))
+    query = (
+        db.session.query(source.c.id, source.c.chore_name, source.c.completed_at, User.name.label("user_name"))
+        .join(User, User.id == source.c.user_id)
+    )
+    if user_id:
+        query = query.filter(source.c.user_id == user_id)
+    if start_dt:
+        query = query.filter(source.c.completed_at >= start_dt)
+    if end_dt:
+        query = query.filter(source.c.completed_at <= end_dt)
+    return query, source
 
 
 @history_bp.route("/chore-history")
+@conditional
 def chore_history():
-    user_id = request.args.get("user_id", type=int)
     selected_user = request.args.get("user_id", type=int)
     start_date = request.args.get("start_date")
     end_date = request.args.get("end_date")
 
-    query = ChoreHistory.query
-    if user_id:
-        query = query.filter(ChoreHistory.user_id == user_id)
-    if start_date:
-        try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            query = query.filter(ChoreHistory.completed_at >= start_dt)
-        except ValueError:
-            pass
-    if end_date:
-        try:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            query = query.filter(ChoreHistory.completed_at <= end_dt)
-        except ValueError:
-            pass
-
-    history = query.order_by(ChoreHistory.completed_at.desc()).all()
+    query, source = history_query(**parse_history_filters(request.args))
+    history = keyset_paginate(query, source.c.completed_at, source.c.id, descending=True, **page_args())
     users = User.query.order_by(User.name).all()
     return render_template("chore_history.html", history=history, users=users,
                            selected_user=selected_user, start_date=start_date, end_date=end_date)
@@ -5,7 +5,9 @@ from utils.chores import get_completed_chores, get_unassigned_chores
 from utils.dusty import dusty_response
 from services.twilio_tools import send_sms
 from datetime import datetime, timedelta
+from sqlalchemy.orm import joinedload
 from utils.users import get_user_by_phone
+from utils.pagination import keyset_paginate, page_args
 import random
 
 main_bp = Blueprint("main", __name__)
@@ -16,7 +18,7 @@ def get_admin_user():
 @main_bp.route('/')
 def index():
     user = get_admin_user()
-    chores = Chore.query.order_by(Chore.due_date).all()
+    chores = Chore.query.options(joinedload(Chore.assigned_to)).order_by(Chore.due_date).all()
     users = User.query.order_by(User.name).all()
     return render_template('index.html', chores=chores, users=users, user=user)
 
@@ -32,7 +34,8 @@ def unassigned():
 
 @main_bp.route('/history')
 def history():
-    completed_chores = ChoreHistory.query.filter(ChoreHistory.completed == True).order_by(ChoreHistory.completed_at.desc()).all()
+    query = ChoreHistory.query.options(joinedload(ChoreHistory.user)).filter(ChoreHistory.completed == True)
+    completed_chores = keyset_paginate(query, ChoreHistory.completed_at, ChoreHistory.id, descending=True, **page_args())
     return render_template('history.html', chores=completed_chores)
 
 @main_bp.route('/unassigned')
@@ -80,7 +83,7 @@ def reassign_chore(chore_id):
 
     assignee = User.query.get(new_user_id)
     if assignee and assignee.phone:
-        sass = dusty_response("reassigned", name=assignee.name, extra=chore.name)
+        sass = dusty_response("reassigned", name=assignee.name, extra=chore.name).text
         send_sms(assignee.phone, f"[Dusty 🤖] {sass}")
     flash(f"Reassigned chore: {chore.name}", "info")
     return redirect(url_for('main.index'))
@@ -2,12 +2,17 @@
 
 from flask import Blueprint, request, render_template, redirect, url_for, flash
 from datetime import datetime
+import io
 import random
+import click
 
 from models import db, Chore, User
 from utils.users import get_user_by_phone
+from utils.chores import bulk_delete, bulk_reassign, bulk_snooze, bulk_unassign
 from utils.dusty import dusty_response
 from services.twilio_tools import send_sms
+from services.importer import import_chores, read_rows, detect_format, notify_assignees
+from services.autoassign import auto_assign
 
 manage_bp = Blueprint("manage", __name__)
 
@@ -101,4 +106,105 @@ def reassign_chore(chore_id):
         send_sms(assignee.phone, f"[Dusty 🤖] {sass}")
 
     flash(f"Reassigned chore: {chore.name}", "info")
-    return redirect(url_for('index'))
\ No newline at end of file
+    return redirect(url_for('index'))
+
+
+
+@manage_bp.route('/bulk', methods=['POST'])
+def bulk_action():
+    user = get_admin_user()
+    if not user or not user.is_admin:
+        flash("Not authorized.", "danger")
+        return redirect(url_for('views.index'))
+
+    action = request.form.get("action")
+    chore_ids = request.form.getlist("chore_ids", type=int)
+    if not chore_ids:
+        flash("No chores selected.", "warning")
+        return redirect(url_for('views.index'))
+
+    if action == "reassign":
+        assignee = db.session.get(User, request.form.get("user_id", type=int) or 0)
+        if not assignee:
+            flash("Pick someone to reassign to.", "warning")
+            return redirect(url_for('views.index'))
+        moved = bulk_reassign(chore_ids, assignee.id)
+        reply = None
+        if moved and assignee.phone:
+            reply = dusty_response("assigned", name=assignee.name, extra=", ".join(moved), user=assignee)
+            reply.apply()
+        db.session.commit()
+        if reply:
+            # One text per recipient, however many chores landed on them.
+            send_sms(assignee.phone, reply)
+        flash(f"Reassigned {len(moved)} chore(s) to {assignee.name}.", "info")
+    elif action == "snooze":
+        count = bulk_snooze(chore_ids)
+        db.session.commit()
+        flash(f"Snoozed {count} chore(s).", "info")
+    elif action == "unassign":
+        count = bulk_unassign(chore_ids)
+        db.session.commit()
+        flash(f"Unassigned {count} chore(s).", "info")
+    elif action == "delete":
+        count = bulk_delete(chore_ids)
+        db.session.commit()
+        flash(f"Deleted {count} chore(s).", "success")
+    else:
+        flash("Unknown bulk action.", "warning")
+    return redirect(url_for('views.index'))
+
+@manage_bp.route('/auto-assign', methods=['POST'])
+def auto_assign_chores():
+    user = get_admin_user()
+    if not user or not user.is_admin:
+        flash("Not authorized.", "danger")
+        return redirect(url_for('views.index'))
+
+    assigned = auto_assign()
+    db.session.commit()
+    if not assigned:
+        flash("No unassigned chores to hand out.", "info")
+        return redirect(url_for('views.index'))
+    notify_assignees(assigned, {u.name: u for u in User.query.all()})
+    total = sum(len(names) for names in assigned.values())
+    flash(f"Auto-assigned {total} chore(s) across {len(assigned)} people.", "info")
+    return redirect(url_for('views.index'))
+
+@manage_bp.route('/import', methods=['GET', 'POST'])
+def import_chores_view():
+    user = get_admin_user()
+    if not user or not user.is_admin:
+        flash("Not authorized.", "danger")
+        return redirect(url_for('views.index'))
+
+    if request.method == 'POST':
+        upload = request.files.get('file')
+        if not upload or not upload.filename:
+            flash("Pick a CSV or JSONL file to import.", "warning")
+            return redirect(url_for('manage.import_chores_view'))
+
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig')
+        result = import_chores(read_rows(stream, detect_format(upload.filename)))
+        flash(f"Imported {result.created} chore(s), notified {result.notified} assignee(s).", "success")
+        for line_no, message in result.errors[:10]:
+            flash(f"Line {line_no}: {message}", "warning")
+        if len(result.errors) > 10:
+            flash(f"...and {len(result.errors) - 10} more rejected row(s).", "warning")
+        return redirect(url_for('views.index'))
+
+    return render_template('import_chores.html')
+
+
+@manage_bp.cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(["csv", "jsonl"]), default=None,
+              help="Defaults to the file extension.")
+@click.option("--no-notify", is_flag=True, help="Skip the per-assignee summary texts.")
+def import_command(path, fmt, no_notify):
+    """Bulk-import chores from a CSV or JSONL file."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        result = import_chores(read_rows(f, fmt or detect_format(path)), notify=not no_notify)
+    click.echo(f"Imported {result.created} chore(s), notified {result.notified} assignee(s).")
+    for line_no, message in result.errors:
+        click.echo(f"  line {line_no}: {message}", err=True)
@@ -0,0 +1,82 @@
+# routes/metrics.py
+
+from flask import Blueprint, Response, abort, jsonify, request
+from utils.metrics import metrics
+from utils.sqlprofile import sql_profiler
+from utils.fragments import fragment_cache
+from utils.dusty.dusty import templates
+from utils.twilio.encoding import sms_stats
+from utils.context.store import conversation_context
+from utils.pubsub import broker
+from services.twilio_tools import outbox
+
+metrics_bp = Blueprint("metrics", __name__)
+
+# -------------------------------
+# Prometheus Scrape Endpoint
+# -------------------------------
+# Per-worker numbers: Prometheus scrapes each worker (or sums what it gets).
+
+
+@metrics_bp.route("/metrics")
+def scrape():
+    if not metrics.enabled:
+        abort(404)
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@metrics_bp.route("/metrics/sql")
+def worst_routes():
+    """Endpoints with the most SQL per request; ?by=max_queries|avg_ms|repeats, ?limit=N."""
+    if not metrics.enabled:
+        abort(404)
+    by = request.args.get("by", "avg_queries")
+    if by not in ("avg_queries", "max_queries", "avg_ms", "repeats"):
+        by = "avg_queries"
+    limit = min(request.args.get("limit", 10, type=int), 100)
+    return jsonify({"by": by, "routes": sql_profiler.worst_routes(limit=limit, by=by)})
+
+
+@metrics.collector
+def _fragment_cache():
+    stats = fragment_cache.stats()
+    return [
+        ("dusty_fragment_cache_hits_total", "counter", {}, stats["hits"]),
+        ("dusty_fragment_cache_misses_total", "counter", {}, stats["misses"]),
+        ("dusty_fragment_cache_evictions_total", "counter", {}, stats["evictions"]),
+        ("dusty_fragment_cache_entries", "gauge", {}, stats["entries"]),
+    ]
+
+
+@metrics.collector
+def _templates():
+    stats = sorted(templates.render_stats().items())
+    # Each family's samples must be contiguous in the text format.
+    renders = [("dusty_template_renders_total", "counter", {"key": key}, stat["renders"]) for key, stat in stats]
+    seconds = [
+        ("dusty_template_render_seconds_total", "counter", {"key": key}, stat["renders"] * stat["avg_us"] / 1e6)
+        for key, stat in stats
+    ]
+    return renders + seconds
+
+
+@metrics.collector
+def _sms():
+    segments = sms_stats()
+    queue = outbox.stats()
+    return [
+        ("dusty_sms_messages_total", "counter", {}, segments["messages"]),
+        ("dusty_sms_segments_total", "counter", {}, segments["segments"]),
+        ("dusty_sms_segments_saved_total", "counter", {}, segments["segments_saved"]),
+        ("dusty_sms_ucs2_messages_total", "counter", {}, segments["ucs2_messages"]),
+        ("dusty_outbox_pending", "gauge", {}, queue["pending"]),
+        ("dusty_outbox_merge_ratio", "gauge", {}, queue["merge_ratio"]),
+    ]
+
+
+@metrics.collector
+def _connections():
+    return [
+        ("dusty_conversation_contexts", "gauge", {}, len(conversation_context)),
+        ("dusty_sse_connections", "gauge", {}, broker.connections),
+    ]
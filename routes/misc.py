@@ -4,6 +4,7 @@ from flask import Blueprint, redirect, url_for, flash, render_template
 from datetime import timedelta
 from models import db, Chore, User
 from utils.chores import get_unassigned_chores
+from utils.versioning import conditional
 
 misc_bp = Blueprint("misc", __name__)
 
@@ -35,6 +36,7 @@ def snooze_chore(chore_id):
 
 
 @misc_bp.route('/unassigned')
+@conditional
 def unassigned():
     chores = get_unassigned_chores()
     return render_template('unassigned.html', chores=chores)
\ No newline at end of file
@@ -1,58 +1,74 @@
 
 # routes/sms.py
 
-from flask import Blueprint, request
+import click
+from flask import Blueprint, g, request
 from twilio.twiml.messaging_response import MessagingResponse
 from datetime import datetime
+import logging
 import random
+import time
 
-from models import db, Chore, ChoreHistory, ChoreStats, User
-from utils.chores import get_unassigned_chores, list_user_chores
+from models import db, Chore, User
+from utils.chores import get_unassigned_chores, list_user_chores, claim_chore, mark_chore_completed, record_completion
 from utils.users import get_user_by_phone, get_user_by_name, reduce_fatigue
-from utils.dusty import dusty_response, memory_based_commentary
+from utils.dusty import dusty_response, memory_based_commentary, Reply, UserUpdate, apply_replies
 from utils.nlp import parse_multiple_intents
 from services.twilio_tools import send_sms
-from utils.context import ContextTracker, ConversationContext
+from utils.twilio.encoding import prepare_sms
 from utils.context.store import conversation_context
 from utils.context.follow_up import resolve_follow_up
 from utils.dusty.commentary import generate_commentary
+from services.autoassign import auto_assign
+from services.importer import notify_assignees
+from utils.log import get_logger, log_event, phone_hash
+from utils.metrics import metrics
 
 
 sms_bp = Blueprint("sms", __name__)
-context_tracker = ConversationContext()
-conversation_context = {}
+log = get_logger("sms")
 
-def dusty_with_memory(key_or_text, **kwargs):
+# Left on the context by a "done" that named no chore; the next message names it.
+WAITING_FOR_CHORE = "mark_done_waiting_for_chore"
+
+def dusty_with_memory(key_or_text, **kwargs) -> Reply:
+    """dusty_response plus memory commentary; the user's intent/seen/list bookkeeping comes back as updates."""
     user = kwargs.get("user")
     intent = key_or_text
-    base = dusty_response(key_or_text, **kwargs)
-    if isinstance(base, list):
-        base = random.choice(base)
+    with metrics.timed("dusty_sms_phase_seconds", phase="render"):
+        reply = dusty_response(key_or_text, **kwargs)
     extra = kwargs.get("extra")
-    if extra and "{extra}" not in base and extra not in base:
-        base = f"{base}\n{extra}"
-    memory = memory_based_commentary(user, intent)
+    if extra and "{extra}" not in reply.text and extra not in reply.text:
+        reply += f"\n{extra}"
+    memory = memory_based_commentary(user, intent).text.strip()
+    if memory:
+        reply.aside(" " + memory)
     if user:
-        user.last_intent = intent
-        user.last_seen = datetime.utcnow()
+        reply.updates += [
+            UserUpdate(user, "last_intent", intent),
+            UserUpdate(user, "last_seen", datetime.utcnow()),
+        ]
         if intent == "list":
-            user.total_list_requests += 1
-    return f"{base} {memory}".strip()
+            reply.updates.append(UserUpdate(user, "total_list_requests", 1, increment=True))
+    return reply
 
 
 @sms_bp.route("/sms", methods=["POST"])
 def handle_sms():
-    print("[SMS ROUTE] Hit /sms endpoint")
+    g.sms_started = time.perf_counter()
     incoming_msg = request.form.get("Body", "").strip()
     from_number = request.form.get("From", "").strip()
-    print(f"[SMS RECEIVED] From: {from_number} | Message: '{incoming_msg}'")
-
-    user = get_user_by_phone(from_number)
+    g.sms_phone = phone_hash(from_number)
+    log_event(log, "sms.received", phone=g.sms_phone, chars=len(incoming_msg))
+    log_event(log, "sms.body", logging.DEBUG, phone=g.sms_phone, body=incoming_msg)
+
+    with metrics.timed("dusty_sms_phase_seconds", phase="lookup"):
+        user = get_user_by_phone(from_number)
+        if user:
+            context = conversation_context.get_or_create(from_number)
     if not user:
         return _twiml(dusty_with_memory("unauthorized"))
 
-    context = conversation_context.get(user.name) or ContextTracker()
-
     # Fatigue management
     reduce_fatigue(user)
     if user.fatigue_level >= 10 and not any(x in incoming_msg.lower() for x in ["help", "greetings", "list"]):
@@ -62,11 +78,17 @@ def handle_sms():
             "Dusty detected overachievement. Auto-throttling enabled.",
         ])))
 
-    parsed_intents = parse_multiple_intents(incoming_msg, sender=user.name, aliases={"me": user.name.lower()},context=context)
-    print(f"[MULTI-INTENT PARSE] {parsed_intents}")
-    if not parsed_intents or parsed_intents[0][0] == "unknown":
-        print("[FOLLOW-UP CHECK] Trying to resolve as follow-up...")
-        followup_intent, followup_entities = resolve_follow_up(incoming_msg, context_tracker, user.name)
+    with metrics.timed("dusty_sms_phase_seconds", phase="parse"):
+        parsed_intents = parse_multiple_intents(incoming_msg, sender=user.name, aliases={"me": user.name.lower()},context=context)
+    log_event(log, "sms.parsed", logging.DEBUG, phone=g.sms_phone,
+              intents=",".join(i for i, _ in parsed_intents) if parsed_intents else None)
+    nothing_parsed = not parsed_intents or parsed_intents[0][0] == "unknown"
+    if nothing_parsed and context.last_intent == WAITING_FOR_CHORE:
+        parsed_intents = [("done", {"chore": incoming_msg.strip(" .!?")})]
+    elif nothing_parsed:
+        log_event(log, "sms.follow_up", logging.DEBUG, phone=g.sms_phone)
+        with metrics.timed("dusty_sms_phase_seconds", phase="follow_up"):
+            followup_intent, followup_entities = resolve_follow_up(incoming_msg, context, user.name)
         if followup_intent != "unknown":
             parsed_intents = [(followup_intent, followup_entities)]
         else:
@@ -74,26 +96,25 @@ def handle_sms():
 
 
     final_replies = []
-    previous = context_tracker.get(from_number)
 
     # Fallback to prior context if needed
     intent, entities = parsed_intents[0]
-    if intent in ("unknown", None) and previous:
-        print("[CONTEXT] Resolving based on prior intent...")
-        intent = previous["intent"]
-        for k, v in previous["entities"].items():
+    if intent in ("unknown", None) and context.last_intent:
+        log_event(log, "sms.context_intent", logging.DEBUG, phone=g.sms_phone, intent=context.last_intent)
+        intent = context.last_intent
+        for k, v in context.last_entities.items():
             entities.setdefault(k, v)
 
-    context_tracker.set(from_number, intent, entities)
-
     # Memory injection
     if context.last_intent and intent == "unknown":
-        print("[CONTEXT FALLBACK] Using memory context.")
+        log_event(log, "sms.context_entities", logging.DEBUG, phone=g.sms_phone)
         for k in ["chore", "assignee", "due_date"]:
             if k not in entities and getattr(context, f"last_{k}"):
                 entities[k] = getattr(context, f"last_{k}")
 
     for intent, entities in parsed_intents:
+        handle_started = time.perf_counter()
+        metrics.inc("dusty_sms_intents_total", intent=intent)
         user.last_intent = intent
         user.last_seen = datetime.utcnow()
 
@@ -106,7 +127,7 @@ def handle_sms():
         if intent == "add":
             reply = _handle_add(user, entities)
         elif intent == "done":
-            reply = _handle_done(user, entities)
+            reply = _handle_done(user, entities, context)
         elif intent == "list":
             reply = _handle_list(user)
         elif intent == "claim":
@@ -117,6 +138,8 @@ def handle_sms():
             reply = _handle_unassign(user, entities)
         elif intent == "broadcast":
             reply = _handle_broadcast(user, entities)
+        elif intent == "auto_assign":
+            reply = _handle_auto_assign(user)
         elif intent == "help":
             reply = dusty_with_memory("help", name=user.name)
         elif intent == "greetings":
@@ -152,18 +175,33 @@ def handle_sms():
         # ✏️ Optional snarky comment
         if intent not in ["help", "greetings", "list"] and random.random() < 0.4:
             comment = generate_commentary(context, user, intent, entities)
-            reply += f"\n\n[Dusty 🤖] {comment}"
+            reply.aside("\n\n[Dusty 🤖] " + comment.text)
         
         context.update(intent, entities)
+        if intent == "done" and not entities.get("chore"):
+            context.last_intent = WAITING_FOR_CHORE
         final_replies.append(reply)
+        metrics.observe("dusty_sms_phase_seconds", time.perf_counter() - handle_started, phase="handle")
 
-    conversation_context[user.name] = context
-    db.session.commit()
-    return _twiml("\n\n".join(final_replies))
-
-
-def _twiml(text):
-    print(f"[Dusty Replying] {text}")
+    # Rendering only described the user-state changes; they land in this one commit.
+    with metrics.timed("dusty_sms_phase_seconds", phase="commit"):
+        apply_replies(final_replies)
+        conversation_context.put(from_number, context)
+        db.session.commit()
+    g.sms_intents = ",".join(i for i, _ in parsed_intents)
+    combined = final_replies[0]
+    for reply in final_replies[1:]:
+        combined = combined + "\n\n" + reply
+    return _twiml(combined)
+
+
+def _twiml(reply):
+    with metrics.timed("dusty_sms_phase_seconds", phase="reply"):
+        text = prepare_sms(reply)
+    started = g.get("sms_started")
+    log_event(log, "sms.replied", phone=g.get("sms_phone"), intent=g.get("sms_intents"), chars=len(text),
+              ms=round((time.perf_counter() - started) * 1000, 2) if started else None)
+    log_event(log, "sms.reply_body", logging.DEBUG, body=text)
     resp = MessagingResponse()
     resp.message(text)
     return str(resp)
@@ -185,37 +223,21 @@ def _handle_add(user, entities):
     return dusty_with_memory("add", extra=extra, user=user)
 
 
-def _handle_done(user, entities):
+def _handle_done(user, entities, context):
     name = entities.get("chore")
     if not name:
-        last_chore = context_tracker.get_last_chore(user.id)
-        if last_chore:
-            entities["chore"] = last_chore.name
-            name = last_chore.name
-        else:
-            context_tracker.set_last_intent(user.id, "mark_done_waiting_for_chore")
+        if not context.last_chore:
             return dusty_with_memory("done_invalid", user=user)
+        name = entities["chore"] = context.last_chore
     chore = Chore.query.filter(
         Chore.name.ilike(f"%{name}%"),
         Chore.assigned_to_id == user.id,
         Chore.completed == False
     ).first()
-    if not chore:
+    # A retried or concurrent "done" finds the row already flipped and gets not_found.
+    if not chore or not mark_chore_completed(chore.id):
         return dusty_with_memory("not_found", extra=name, name=user.name)
-    chore.completed = True
-    chore.completed_at = datetime.utcnow()
-    db.session.add(chore)
-    stat = ChoreStats.query.filter_by(user_id=user.id, chore_name=chore.name).first()
-    if stat:
-        stat.times_completed += 1
-    else:
-        stat = ChoreStats(user_id=user.id, chore_name=chore.name, times_completed=1)
-    db.session.add(stat)
-    db.session.add(ChoreHistory(chore_name=chore.name, user_id=user.id, completed=True))
-    user.total_chores_completed += 1
-    fav = ChoreStats.query.filter_by(user_id=user.id).order_by(ChoreStats.times_completed.desc()).first()
-    if fav:
-        user.favorite_chore = fav.chore_name
+    record_completion(user, chore.name, datetime.utcnow())
     db.session.commit()
     return dusty_with_memory("done", extra=f"{chore.name} is finally off the list. Miracles happen.", user=user)
 
@@ -236,10 +258,10 @@ def _handle_list(user):
 def _handle_claim(user, entities):
     name = entities.get("chore", "").strip().lower()
     chore = Chore.query.filter(Chore.name.ilike(f"%{name}%"), Chore.assigned_to_id == None).first()
-    if chore:
-        chore.assigned_to_id = user.id
+    claimed = claim_chore(chore.id, user.id) if chore else None
+    if claimed:
         db.session.commit()
-        return dusty_with_memory("claim", chore=chore.name, name=user.name, user=user)
+        return dusty_with_memory("claim", chore=claimed, name=user.name, user=user)
     return dusty_with_memory("claim_fail", chore=name, name=user.name, user=user)
 
 
@@ -267,6 +289,20 @@ def _handle_unassign(user, entities):
     return dusty_with_memory("unassigned", extra=chore.name, name=user.name)
 
 
+def _handle_auto_assign(user):
+    if not user.is_admin:
+        return dusty_with_memory("unauthorized", user=user)
+    assigned = auto_assign()
+    db.session.commit()
+    if not assigned:
+        return dusty_with_memory("auto_assign_empty", name=user.name, user=user)
+    users = {u.name: u for u in User.query.all()}
+    by_id = {u.id: u for u in users.values()}
+    notify_assignees({uid: names for uid, names in assigned.items() if uid != user.id}, users)
+    extra = "\n".join(f"- {by_id[uid].name}: {', '.join(names)}" for uid, names in assigned.items())
+    return dusty_with_memory("auto_assigned", extra=extra, name=user.name, user=user)
+
+
 def _handle_broadcast(user, entities):
     if not user.is_admin:
         return dusty_with_memory("unauthorized", user=user)
@@ -277,7 +313,33 @@ def _handle_broadcast(user, entities):
     for u in users:
         if u.phone and u.phone != user.phone and u.phone.startswith("+1"):
             try:
-                send_sms(u.phone, f"[Dusty 📣] {msg}")
+                send_sms(u.phone, f"[Dusty 📣] {msg}", urgent=True)
             except Exception as e:
-                print(f"[SMS ERROR] Failed to message {u.name} at {u.phone}: {e}")
-    return dusty_with_memory("broadcast_success", extra="Your message is now everyone’s problem.", user=user)
\ No newline at end of file
+                log_event(log, "sms.broadcast_failed", logging.ERROR, user=u.name, phone=phone_hash(u.phone), error=str(e))
+    return dusty_with_memory("broadcast_success", extra="Your message is now everyone’s problem.", user=user)
+
+
+# -- Load Testing --
+
+@sms_bp.cli.command("loadtest")
+@click.option("--users", default=20, show_default=True, help="Synthetic household size.")
+@click.option("--chores-per-user", default=3, show_default=True)
+@click.option("--messages", default=500, show_default=True, help="Webhook POSTs to send.")
+@click.option("--concurrency", default=8, show_default=True, help="Concurrent senders.")
+@click.option("--mix", default=None, help="Message mix, e.g. list=4,add=2,done=2 (default: a typical day).")
+@click.option("--seed", default=1, show_default=True, help="Same seed, same inbound traffic.")
+@click.option("--latency-ms", default=0.0, show_default=True, help="Simulated Twilio latency per send.")
+@click.option("--jitter-ms", default=0.0, show_default=True)
+@click.option("--failure-rate", default=0.0, show_default=True, help="Fraction of sends that fail.")
+@click.option("--coalesce", default=0.0, show_default=True, help="SMS_COALESCE_SECONDS for the run.")
+def loadtest_command(users, chores_per_user, messages, concurrency, mix, seed, latency_ms, jitter_ms,
+                     failure_rate, coalesce):
+    """Fire synthetic /sms traffic at a throwaway copy of the app (fake Twilio)."""
+    from services.loadtest import format_report, load_test, parse_mix
+
+    report = load_test(
+        users=users, chores_per_user=chores_per_user, messages=messages, concurrency=concurrency,
+        mix=parse_mix(mix), seed=seed, latency_ms=latency_ms, jitter_ms=jitter_ms,
+        failure_rate=failure_rate, SMS_COALESCE_SECONDS=coalesce,
+    )
+    click.echo(format_report(report))
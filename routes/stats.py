@@ -0,0 +1,23 @@
+# routes/stats.py
+
+import click
+from flask import Blueprint, render_template, request
+from utils.stats import leaderboard, backfill_rollups
+
+stats_bp = Blueprint("stats", __name__)
+
+@stats_bp.route("/leaderboard")
+def show_leaderboard():
+    window = request.args.get("window", "week")
+    if window not in ("day", "week"):
+        window = "week"
+    rows = leaderboard(window)
+    return render_template("leaderboard.html", rows=rows, window=window)
+
+
+@stats_bp.cli.command("backfill")
+@click.option("--batch-size", default=1000, show_default=True, help="History rows fetched per round trip.")
+def backfill_command(batch_size):
+    """Rebuild the daily/weekly completion rollups from ChoreHistory."""
+    rows = backfill_rollups(batch_size=batch_size)
+    click.echo(f"Rebuilt rollups from {rows} history row(s).")
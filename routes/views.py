@@ -1,24 +1,59 @@
 # routes/views.py
 from datetime import datetime
 from flask import Blueprint, render_template, redirect, url_for, flash, request
+from sqlalchemy.orm import joinedload
 from models import db, Chore, User
 from routes.admin import get_admin_user
 from utils.dusty import dusty_response
-from utils.chores import get_completed_chores
+from utils.pagination import keyset_paginate, page_args
+from utils.versioning import conditional
+from utils.fragments import fragment_cache
 from services.twilio_tools import send_sms
 
 views_bp = Blueprint('views', __name__)
 
 @views_bp.route('/')
+@conditional
 def index():
     user = get_admin_user()
-    chores = Chore.query.order_by(Chore.due_date).all()
+    query = Chore.query.options(joinedload(Chore.assigned_to))
+    chores = keyset_paginate(query, Chore.due_date, Chore.id, nullable=True, **page_args())
     users = User.query.order_by(User.name).all()
-    return render_template('index.html', chores=chores, users=users, user=user)
+    is_admin = bool(user and user.is_admin)
+
+    # ---- Cached fragments (see utils/fragments.py) ----
+    users_version = hash(tuple((u.id, u.name) for u in users))
+
+    def user_options(selected_id):
+        return fragment_cache.get_or_render(
+            ("user_options", selected_id), users_version,
+            lambda: render_template('_user_options.html', users=users, selected_id=selected_id),
+        )
+
+    def chore_card(chore):
+        assignee = chore.assigned_to
+        version = (
+            chore.name, chore.due_date, chore.recurrence, chore.completed,
+            chore.assigned_to_id, assignee.name if assignee else None,
+            is_admin, users_version if is_admin else None,
+        )
+        return fragment_cache.get_or_render(
+            ("chore", chore.id), version,
+            lambda: render_template(
+                '_chore_card.html', chore=chore, is_admin=is_admin,
+                user_options=user_options(chore.assigned_to_id) if is_admin else '',
+            ),
+        )
+
+    return render_template('index.html', chores=chores, users=users, user=user,
+                           chore_card=chore_card, user_options=user_options,
+                           user_names={u.id: u.name for u in users})
 
 @views_bp.route('/completed')
+@conditional
 def completed():
-    chores = get_completed_chores()
+    query = Chore.query.options(joinedload(Chore.assigned_to)).filter_by(completed=True)
+    chores = keyset_paginate(query, Chore.due_date, Chore.id, descending=True, nullable=True, **page_args())
     return render_template('completed.html', chores=chores)
 
 @views_bp.route('/add', methods=['GET', 'POST'])
@@ -39,13 +74,16 @@ def add_chore():
         )
 
         db.session.add(new_chore)
+
+        # Render before committing so the reply's user updates ride along.
+        reply = None
+        if assigned_to and assigned_to.phone:
+            reply = dusty_response("assigned", name=assigned_to.name, extra=f"{new_chore.name} (due {new_chore.due_date.strftime('%b %d') if new_chore.due_date else 'someday'})", user=assigned_to)
+            reply.apply()
         db.session.commit()
 
-        if new_chore.assigned_to and new_chore.assigned_to.phone:
-            send_sms(
-                new_chore.assigned_to.phone,
-                dusty_response("assigned", name=new_chore.assigned_to.name, extra=f"{new_chore.name} (due {new_chore.due_date.strftime('%b %d') if new_chore.due_date else 'someday'})", user=new_chore.assigned_to)
-            )
+        if reply:
+            send_sms(assigned_to.phone, reply)
 
         flash('Chore added successfully')
         return redirect(url_for('views.index'))
@@ -0,0 +1,158 @@
+# services/archive.py
+
+import weakref
+from datetime import datetime, timedelta
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, DateTime, Index,
+    select, insert, delete, func, union_all, inspect, tuple_,
+)
+from models import db, ChoreHistory
+from utils.changes import note
+
+# -------------------------------
+# ChoreHistory Archive
+# -------------------------------
+# Old history rows live in a SQLite file ATTACHed as "archive" on every
+# connection (see utils/db.py). The archive is compacted: the redundant
+# times_completed/completed columns are dropped and chore names are stored
+# once in a lookup table instead of on every row.
+
+ARCHIVE_SCHEMA = "archive"
+
+archive_metadata = MetaData(schema=ARCHIVE_SCHEMA)
+
+archived_chore_names = Table(
+    "chore_name", archive_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100), nullable=False, unique=True),
+)
+
+archived_history = Table(
+    "chore_history", archive_metadata,
+    Column("id", Integer, primary_key=True),  # original ChoreHistory.id
+    Column("name_id", Integer, nullable=False),
+    Column("user_id", Integer, nullable=False),
+    Column("completed_at", DateTime, nullable=False),
+    Index("ix_archive_history_completed_at_id", "completed_at", "id"),
+    Index("ix_archive_history_user_completed_at_id", "user_id", "completed_at", "id"),
+)
+
+
+_attached = weakref.WeakKeyDictionary()  # engine -> bool; ATTACH runs on every connection, so it never changes
+
+
+def archive_attached() -> bool:
+    engine = db.engine
+    if engine not in _attached:
+        _attached[engine] = ARCHIVE_SCHEMA in inspect(engine).get_schema_names()
+    return _attached[engine]
+
+
+def ensure_archive_schema():
+    """Create the archive tables if the archive database is attached."""
+    if archive_attached():
+        archive_metadata.create_all(db.engine)
+
+
+def archive_newest():
+    """Latest completed_at held in the archive, or None if it's empty/unavailable."""
+    if not archive_attached():
+        return None
+    return db.session.execute(select(func.max(archived_history.c.completed_at))).scalar()
+
+
+def history_source(include_archive: bool):
+    """
+    A selectable with ChoreHistory's listing columns (id, chore_name, user_id,
+    completed_at). With include_archive it also spans the archived rows.
+    """
+    hot = select(
+        ChoreHistory.id, ChoreHistory.chore_name, ChoreHistory.user_id, ChoreHistory.completed_at,
+    )
+    if not include_archive:
+        return hot.subquery("history")
+    cold = (
+        select(
+            archived_history.c.id,
+            archived_chore_names.c.name.label("chore_name"),
+            archived_history.c.user_id,
+            archived_history.c.completed_at,
+        )
+        .join(archived_chore_names, archived_chore_names.c.id == archived_history.c.name_id)
+    )
+    return union_all(hot, cold).subquery("history")
+
+
+def spans_archive(start_dt) -> bool:
+    """
+    A date range needs the archive when it reaches back into archived time:
+    an open start (whenever an archive is attached), or one at or before the
+    newest archived row. The end date cannot narrow this; any range ending
+    in archived time starts there too.
+    """
+    if start_dt is None:
+        return archive_attached()
+    newest = archive_newest()
+    return newest is not None and start_dt <= newest
+
+
+def archive_history(older_than_days: int, batch_size: int = 1000, now=None) -> int:
+    """
+    Move ChoreHistory rows older than the cutoff into the archive, batch by
+    batch. The daily/weekly rollups already count these completions, so the
+    leaderboards do not change. Returns rows moved.
+
+    Under WAL a commit spanning the main and ATTACHed files is not atomic,
+    so a crash can leave a batch in both. The copy is therefore idempotent
+    (INSERT OR IGNORE) and a hot row is deleted only once the archive holds
+    that same row; rerunning the command finishes an interrupted batch. A
+    row whose id is taken by a different archived row stays hot.
+    """
+    if not archive_attached():
+        raise RuntimeError("No archive database attached; set HISTORY_ARCHIVE_PATH.")
+    ensure_archive_schema()
+    cutoff = (now or datetime.utcnow()) - timedelta(days=older_than_days)
+    moved = 0
+    last_id = 0
+    while True:
+        ids = db.session.execute(
+            select(ChoreHistory.id)
+            .where(ChoreHistory.completed_at < cutoff, ChoreHistory.id > last_id)
+            .order_by(ChoreHistory.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        last_id = ids[-1]
+
+        batch = ChoreHistory.__table__.c.id.in_(ids)
+        db.session.execute(
+            insert(archived_chore_names)
+            .from_select(["name"], select(ChoreHistory.chore_name).where(batch).distinct())
+            .prefix_with("OR IGNORE")
+        )
+        db.session.execute(
+            insert(archived_history).from_select(
+                ["id", "name_id", "user_id", "completed_at"],
+                select(
+                    ChoreHistory.id,
+                    archived_chore_names.c.id,
+                    ChoreHistory.user_id,
+                    ChoreHistory.completed_at,
+                )
+                .join(archived_chore_names, archived_chore_names.c.name == ChoreHistory.chore_name)
+                .where(batch),
+            )
+            .prefix_with("OR IGNORE")
+        )
+        key = (ChoreHistory.id, ChoreHistory.user_id, ChoreHistory.completed_at)
+        copied = select(archived_history.c.id, archived_history.c.user_id, archived_history.c.completed_at)
+        copied = copied.where(archived_history.c.id.in_(ids))
+        deleted = db.session.execute(
+            delete(ChoreHistory).where(batch, tuple_(*key).in_(copied)).returning(ChoreHistory.id)
+        ).scalars().all()
+        for history_id in deleted:
+            note(db.session, "ChoreHistory", history_id, "delete")
+        db.session.commit()
+        moved += len(deleted)
+    return moved
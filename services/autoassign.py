@@ -0,0 +1,130 @@
+# services/autoassign.py
+
+import heapq
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import func, update
+from models import db, Chore, ChoreStats, User
+from utils.changes import note
+from utils.log import get_logger, log_event
+
+# -------------------------------
+# Balanced Auto-assignment
+# -------------------------------
+# Every unassigned open chore is handed out in one pass. Users sit in a
+# min-heap keyed on their current load: open chores (urgent ones count
+# extra) plus a fatigue penalty. Each chore, soonest first, goes to the
+# least-loaded user, except that among the few least-loaded candidates
+# someone who has done that chore before gets a discount. That is
+# O(n log u) for n chores and u users, and the whole plan is written in a
+# single transaction.
+
+FATIGUE_WEIGHT = 0.5    # load units per fatigue level (0-10)
+AFFINITY_WEIGHT = 0.25  # discount per past completion of the same chore...
+AFFINITY_CAP = 4        # ...counting at most this many
+CANDIDATES = 3          # least-loaded users considered for each chore
+
+log = get_logger("autoassign")
+
+
+def chore_weight(due_date, today) -> float:
+    """Load a chore adds: 1, up to 2 as its due date gets close or passes."""
+    if due_date is None:
+        return 1.0
+    days = max((due_date - today).days, 0)
+    return 1.0 + 1.0 / (1 + days)
+
+
+def plan_assignments(chores, users, open_load, affinity, today):
+    """
+    chores: [(id, name, due_date)] in the order to hand them out
+    users: [(id, fatigue_level)]
+    open_load: {user_id: load of the chores they already hold}
+    affinity: {(user_id, chore_name): times_completed}
+    Returns [(chore_id, user_id)].
+    """
+    if not users:
+        return []
+    heap = [(open_load.get(uid, 0.0) + FATIGUE_WEIGHT * (fatigue or 0), uid) for uid, fatigue in users]
+    heapq.heapify(heap)
+
+    plan = []
+    for chore_id, name, due_date in chores:
+        candidates = [heapq.heappop(heap) for _ in range(min(CANDIDATES, len(heap)))]
+        best = min(
+            range(len(candidates)),
+            key=lambda i: (
+                candidates[i][0] - AFFINITY_WEIGHT * min(affinity.get((candidates[i][1], name), 0), AFFINITY_CAP),
+                candidates[i][0],
+                candidates[i][1],
+            ),
+        )
+        load, user_id = candidates[best]
+        candidates[best] = (load + chore_weight(due_date, today), user_id)
+        for entry in candidates:
+            heapq.heappush(heap, entry)
+        plan.append((chore_id, user_id))
+    return plan
+
+
+def auto_assign(today=None) -> dict:
+    """
+    Assign every unassigned open chore; the caller commits. Returns
+    {user_id: [chore names]} for the chores that were actually assigned.
+    """
+    today = today or datetime.utcnow().date()
+    chores = (
+        db.session.query(Chore.id, Chore.name, Chore.due_date)
+        .filter(Chore.assigned_to_id.is_(None), Chore.completed.is_(False))
+        .order_by(Chore.due_date.is_(None), Chore.due_date, Chore.id)
+        .all()
+    )
+    if not chores:
+        return {}
+    users = db.session.query(User.id, User.fatigue_level).order_by(User.id).all()
+
+    open_load = defaultdict(float)
+    held = (
+        db.session.query(Chore.assigned_to_id, Chore.due_date)
+        .filter(Chore.assigned_to_id.isnot(None), Chore.completed.is_(False))
+    )
+    for user_id, due_date in held:
+        open_load[user_id] += chore_weight(due_date, today)
+
+    names = {name for _, name, _ in chores}
+    affinity = {
+        (user_id, name): times
+        for user_id, name, times in db.session.query(
+            ChoreStats.user_id, ChoreStats.chore_name, func.coalesce(ChoreStats.times_completed, 0)
+        ).filter(ChoreStats.chore_name.in_(names))
+    }
+
+    plan = plan_assignments(chores, users, open_load, affinity, today)
+    if not plan:
+        return {}
+
+    # ORM bulk UPDATE by primary key: one executemany. The extra criteria
+    # leave alone anything someone claimed since we read it. Loaded Chore
+    # objects are not synchronized; they refresh when the caller commits.
+    db.session.execute(
+        update(Chore).where(Chore.assigned_to_id.is_(None)).execution_options(synchronize_session=None),
+        [{"id": chore_id, "assigned_to_id": user_id} for chore_id, user_id in plan],
+    )
+
+    # Read back which rows actually moved; an executemany has no per-row rowcount.
+    chore_names = {chore_id: name for chore_id, name, _ in chores}
+    planned = dict(plan)
+    landed = (
+        db.session.query(Chore.id, Chore.assigned_to_id)
+        .filter(Chore.id.in_(planned))
+        .all()
+    )
+    assigned = defaultdict(list)
+    for chore_id, user_id in landed:
+        if user_id == planned[chore_id]:
+            assigned[user_id].append(chore_names[chore_id])
+            note(db.session, "Chore", chore_id, old={"assigned_to_id": None},
+                 new={"name": chore_names[chore_id], "assigned_to_id": user_id})
+    total = sum(len(names) for names in assigned.values())
+    log_event(log, "autoassign.done", planned=len(plan), assigned=total, users=len(assigned))
+    return dict(assigned)
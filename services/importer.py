@@ -0,0 +1,144 @@
+# services/importer.py
+
+import csv
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from models import db, Chore, User
+from utils.changes import note
+from utils.dusty import dusty_response, apply_replies
+from services.twilio_tools import send_sms
+from utils.log import get_logger, log_event, phone_hash
+
+# -------------------------------
+# Bulk Chore Import
+# -------------------------------
+# Input rows carry name, assignee (user name, optional), due_date
+# (YYYY-MM-DD, optional) and recurrence (optional). Users are resolved once
+# up front, chores go in with batched multi-row INSERTs inside a single
+# transaction (noted for the change subscribers, as Core writes skip the
+# session), and each assignee gets one summary text instead of one per chore.
+
+BATCH_SIZE = 500
+
+log = get_logger("import")
+
+_COLUMNS = Chore.__table__.c
+# The inserted rows come back whole, so they are noted without relying on RETURNING order.
+_INSERT = Chore.__table__.insert().returning(
+    _COLUMNS.id, _COLUMNS.name, _COLUMNS.assigned_to_id, _COLUMNS.due_date, _COLUMNS.recurrence, _COLUMNS.completed,
+)
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.errors = []            # [(line_number, message)]
+        self.assigned = defaultdict(list)  # user_id -> [chore label]
+        self.notified = 0
+
+
+def read_rows(stream, fmt: str):
+    """Yield (line_number, row dict) from a CSV or JSONL text stream."""
+    if fmt == "csv":
+        for line_no, row in enumerate(csv.DictReader(stream), start=2):
+            yield line_no, row
+        return
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_no, None
+
+
+def detect_format(filename: str) -> str:
+    return "jsonl" if filename.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def _clean(value):
+    return str(value).strip() if value not in (None, "") else None
+
+
+def import_chores(rows, notify=True, batch_size: int = BATCH_SIZE) -> ImportResult:
+    result = ImportResult()
+    users = {u.name.lower(): u for u in User.query.all()}
+
+    batch = []
+    for line_no, row in rows:
+        if not isinstance(row, dict):
+            result.errors.append((line_no, "not a valid row"))
+            continue
+        name = _clean(row.get("name"))
+        if not name:
+            result.errors.append((line_no, "missing chore name"))
+            continue
+
+        assignee_name = _clean(row.get("assignee"))
+        assignee = users.get(assignee_name.lower()) if assignee_name else None
+        if assignee_name and not assignee:
+            result.errors.append((line_no, f"unknown assignee '{assignee_name}'"))
+            continue
+
+        due = _clean(row.get("due_date"))
+        try:
+            due_date = datetime.strptime(due, "%Y-%m-%d").date() if due else None
+        except ValueError:
+            result.errors.append((line_no, f"bad due date '{due}' (use YYYY-MM-DD)"))
+            continue
+
+        batch.append({
+            "name": name,
+            "assigned_to_id": assignee.id if assignee else None,
+            "due_date": due_date,
+            "recurrence": _clean(row.get("recurrence")),
+        })
+        if assignee:
+            result.assigned[assignee.id].append(
+                f"{name} (due {due_date.strftime('%b %d') if due_date else 'someday'})"
+            )
+        if len(batch) >= batch_size:
+            result.created += _insert(batch)
+            batch = []
+
+    if batch:
+        result.created += _insert(batch)
+    db.session.commit()
+
+    if notify:
+        result.notified = notify_assignees(result.assigned, users)
+    return result
+
+
+def _insert(batch) -> int:
+    """Bulk-insert a batch, noting each new row since Core inserts skip the unit of work."""
+    rows = db.session.execute(_INSERT, batch).mappings().all()
+    for row in rows:
+        note(db.session, "Chore", row["id"], "insert", new=dict(row))
+    return len(rows)
+
+
+def notify_assignees(assigned: dict, users: dict) -> int:
+    """Send one summary text per assignee; returns how many were delivered."""
+    by_id = {u.id: u for u in users.values()}
+    replies = []
+    delivered = 0
+    for user_id, chores in assigned.items():
+        user = by_id.get(user_id)
+        if not user or not user.phone:
+            continue
+        extra = f"{len(chores)} new chore(s):\n" + "\n".join(f"- {c}" for c in chores)
+        reply = dusty_response("assigned", name=user.name, extra=extra, user=user)
+        replies.append(reply)
+        try:
+            # Urgent sends go out now and raise on failure, so the count is real.
+            send_sms(user.phone, reply, urgent=True)
+            delivered += 1
+        except Exception as e:
+            log_event(log, "import.notify_failed", logging.ERROR, phone=phone_hash(user.phone), error=str(e))
+    if apply_replies(replies):
+        db.session.commit()
+    return delivered
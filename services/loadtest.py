@@ -0,0 +1,234 @@
+# services/loadtest.py
+
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+from config import Config
+from models import db, Chore, User
+from services.twilio_tools import outbox
+from utils.twilio.fake import FakeTwilioTransport
+
+# -------------------------------
+# /sms Load Test Harness
+# -------------------------------
+# Builds a throwaway copy of the app on its own SQLite file and seeds a
+# synthetic household. Then it fires webhook POSTs at /sms from a thread
+# pool: a planned list of (phone, body) drawn from a message mix. Outbound
+# texts go to a FakeTwilioTransport. The users, chores and message plan all
+# derive from one seed, so two runs with the same arguments send the same
+# inbound traffic. The fake's latency/failure draws and Dusty's dice are
+# seeded too, but they come off shared RNGs in whatever order the threads
+# get there. With concurrency > 1, replies, claims and which sends fail can
+# differ between runs; only the number of failures per send is fixed. At
+# concurrency 1 requests draw in plan order, though held texts still go out
+# from outbox timer threads.
+
+CHORES = ("dishes", "laundry", "trash", "vacuum", "mow lawn", "litter box", "windows", "groceries", "bathroom")
+
+MESSAGES = {
+    "list": ("list", "show my chores"),
+    "add": ("add {chore} for tomorrow", "add {chore} for {other}"),
+    "done": ("done {chore}", "finished {chore}"),
+    "claim": ("claim {chore}",),
+    "help": ("help",),
+    "greetings": ("hi", "hey dusty"),
+    "unknown": ("blorp", "what is the meaning of dust"),
+}
+
+DEFAULT_MIX = {"list": 4, "add": 2, "done": 2, "claim": 1, "help": 1, "greetings": 1, "unknown": 1}
+
+
+def parse_mix(text: str | None) -> dict:
+    """"list=4,add=2" -> {"list": 4, "add": 2}; unknown kinds are rejected."""
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in MESSAGES:
+            raise ValueError(f"Unknown message kind {kind!r}; choose from {', '.join(MESSAGES)}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def seed_household(session, users: int, chores_per_user: int, seed: int) -> list[tuple[str, str]]:
+    """Create `users` synthetic users with chores; returns [(name, phone)]."""
+    rng = random.Random(seed)
+    population = []
+    created = []
+    for i in range(users):
+        user = User(name=f"Load{i:03d}", phone=f"+1555900{i:04d}", is_admin=(i == 0))
+        session.add(user)
+        created.append(user)
+        population.append((user.name, user.phone))
+    session.flush()
+    for user in created:
+        for _ in range(chores_per_user):
+            session.add(Chore(name=rng.choice(CHORES), assigned_to_id=user.id))
+    for _ in range(users):  # a pool of unassigned chores to claim
+        session.add(Chore(name=rng.choice(CHORES)))
+    session.commit()
+    return population
+
+
+def plan_messages(population, count: int, mix: dict, seed: int) -> list[tuple[str, str]]:
+    """`count` (phone, body) webhook payloads drawn from the mix."""
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+    plan = []
+    for _ in range(count):
+        name, phone = rng.choice(population)
+        other = rng.choice(population)[0]
+        template = rng.choice(MESSAGES[rng.choices(kinds, weights)[0]])
+        plan.append((phone, template.format(chore=rng.choice(CHORES), other=other)))
+    return plan
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _is_lock_error(error: Exception) -> bool:
+    if isinstance(error, (OperationalError, sqlite3.OperationalError)):
+        return "locked" in str(error) or "busy" in str(error)
+    return False
+
+
+def run_load(app: Flask, plan, concurrency: int = 8, transport: FakeTwilioTransport | None = None) -> dict:
+    """POST every planned message to /sms from `concurrency` threads and report."""
+    local = threading.local()
+    latencies = []
+    statuses = Counter()
+    errors = Counter()
+    lock = threading.Lock()
+
+    def send(payload):
+        phone, body = payload
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        started = time.perf_counter()
+        try:
+            status = client.post("/sms", data={"From": phone, "Body": body}).status_code
+            error = None
+        except Exception as e:  # TESTING propagates view errors; classify them here
+            status = 500
+            error = "db_locked" if _is_lock_error(e) else type(e).__name__
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] += 1
+            if error:
+                errors[error] += 1
+
+    sent_before = transport.stats() if transport else {"sent": 0, "failed": 0}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(send, plan))
+    outbox.flush()
+    duration = time.perf_counter() - started
+    sent_after = transport.stats() if transport else sent_before
+
+    latencies.sort()
+    return {
+        "requests": len(plan),
+        "concurrency": concurrency,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(plan) / duration, 2) if duration else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p90": round(percentile(latencies, 90) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        "statuses": dict(statuses),
+        "errors": dict(errors),
+        "db_lock_errors": errors.get("db_locked", 0),
+        "sms_sent": sent_after["sent"] - sent_before["sent"],
+        "sms_failed": sent_after["failed"] - sent_before["failed"],
+    }
+
+
+def build_app(workdir: str, **overrides) -> Flask:
+    """A copy of the app serving /sms on its own database under `workdir`."""
+    from utils.db import init_db
+    from utils.versioning import init_versioning
+    from utils.metrics import init_metrics
+    from utils.twilio.outbox import init_outbox
+    from utils.context.store import init_context
+    from routes.sms import sms_bp  # loads the NLP models
+
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(workdir, 'loadtest.db')}",
+        HISTORY_ARCHIVE_PATH="",
+        DATA_VERSION_PATH=os.path.join(workdir, "data_version"),
+        CONTEXT_DB_PATH=os.path.join(workdir, "context.db"),
+        CONTEXT_SWEEP_SECONDS=0,
+        AUTO_ASSIGN_INTERVAL_HOURS=0,
+    )
+    app.config.update(overrides)
+    init_db(app)
+    init_versioning(app)
+    init_metrics(app)
+    init_outbox(app, outbox)
+    init_context(app)
+    app.register_blueprint(sms_bp)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def load_test(users=20, chores_per_user=3, messages=500, concurrency=8, mix=None, seed=1,
+              latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0, workdir=None, **overrides) -> dict:
+    """
+    Seed, run and report; the real Twilio transport is restored afterwards.
+    The plan is reproducible for a seed; outcomes are not, once requests
+    run concurrently (see the module notes).
+    """
+    random.seed(seed)  # Dusty's asides and roasts
+    workdir = workdir or tempfile.mkdtemp(prefix="dusty-load-")
+    app = build_app(workdir, **overrides)
+    with app.app_context():
+        population = seed_household(db.session, users, chores_per_user, seed)
+    plan = plan_messages(population, messages, mix or DEFAULT_MIX, seed)
+
+    transport = FakeTwilioTransport(latency_ms, jitter_ms, failure_rate, seed)
+    real_transport = outbox.transport
+    outbox.transport = transport
+    try:
+        report = run_load(app, plan, concurrency, transport)
+    finally:
+        outbox.transport = real_transport
+    report.update(seed=seed, users=users, workdir=workdir)
+    return report
+
+
+def format_report(report: dict) -> str:
+    latency = report["latency_ms"]
+    lines = [
+        f"Requests:      {report['requests']} at concurrency {report['concurrency']} in {report['duration_s']}s",
+        f"Throughput:    {report['throughput_rps']} req/s",
+        f"Latency (ms):  p50 {latency['p50']}  p90 {latency['p90']}  p99 {latency['p99']}  max {latency['max']}",
+        f"Statuses:      " + ", ".join(f"{code}: {n}" for code, n in sorted(report["statuses"].items())),
+        f"DB lock errors: {report['db_lock_errors']}",
+        f"Other errors:  " + (", ".join(f"{k}: {n}" for k, n in report["errors"].items() if k != "db_locked") or "none"),
+        f"SMS sent:      {report['sms_sent']} (failed {report['sms_failed']})",
+    ]
+    if "seed" in report:
+        lines.append(f"Seed:          {report['seed']} ({report['users']} users, data in {report['workdir']})")
+    return "\n".join(lines)
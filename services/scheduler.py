@@ -1,12 +1,18 @@
 # services/scheduler.py
 
+import logging
 from apscheduler.schedulers.background import BackgroundScheduler
 from datetime import datetime
 from models import Chore, User
 from sqlalchemy.orm import joinedload
 from utils.dusty import dusty_response
+from services.autoassign import auto_assign
+from services.importer import notify_assignees
+from utils.log import get_logger, log_event
+from utils.metrics import metrics
 
 scheduler = BackgroundScheduler()
+log = get_logger("scheduler")
 send_sms_function = None  # This will be injected from the main app
 
 def set_send_sms_function(func):
@@ -15,14 +21,14 @@ def set_send_sms_function(func):
 
 def send_reminder_sms(chore, assignee):
     if not send_sms_function:
-        print("[SCHEDULER] No SMS function set. Skipping reminder.")
+        log_event(log, "scheduler.no_sms_function", logging.WARNING)
         return
 
     message = dusty_response("reminder", name=assignee.name, extra=f"{chore.name} (due {chore.due_date.strftime('%Y-%m-%d')})")
     send_sms_function(assignee.phone, message)
 
 def remind_users(db):
-    print("[SCHEDULER] Checking for chores due today...")
+    log_event(log, "scheduler.reminders")
     today = datetime.utcnow().date()
     chores_due = Chore.query.options(joinedload(Chore.assigned_to)).filter(
         Chore.due_date == today,
@@ -35,7 +41,34 @@ def remind_users(db):
         if assignee and assignee.phone:
             send_reminder_sms(chore, assignee)
 
-def start_scheduler(db, twilio_client=None):
-    print("[SCHEDULER] Starting background scheduler...")
-    scheduler.add_job(lambda: remind_users(db), "interval", hours=24)
+def auto_assign_unassigned(db):
+    """Hand out whatever is still unassigned and text each new owner once."""
+    assigned = auto_assign()
+    db.session.commit()
+    if assigned:
+        notify_assignees(assigned, {u.name: u for u in User.query.all()})
+
+def _in_app_context(app, job, name="job"):
+    """Jobs run on a scheduler thread; give them an app context when we have the app, and count the runs."""
+    def run():
+        try:
+            job()
+        except Exception:
+            metrics.inc("dusty_scheduler_runs_total", job=name, result="error")
+            raise
+        metrics.inc("dusty_scheduler_runs_total", job=name, result="ok")
+
+    if app is None:
+        return run
+    def wrapped():
+        with app.app_context():
+            run()
+    return wrapped
+
+def start_scheduler(db, twilio_client=None, app=None):
+    log_event(log, "scheduler.started")
+    scheduler.add_job(_in_app_context(app, lambda: remind_users(db), "reminders"), "interval", hours=24)
+    hours = app.config.get("AUTO_ASSIGN_INTERVAL_HOURS", 0) if app else 0
+    if hours:
+        scheduler.add_job(_in_app_context(app, lambda: auto_assign_unassigned(db), "auto_assign"), "interval", hours=hours)
     scheduler.start()
\ No newline at end of file
@@ -1,9 +1,13 @@
+import logging
 import os
 from twilio.rest import Client
 from datetime import date
 from models import Chore, User
 
 from utils.dusty.dusty import dusty_response
+from utils.twilio.encoding import prepare_sms
+from utils.twilio.outbox import Outbox
+from utils.log import get_logger, log_event, phone_hash
 
 
 
@@ -12,11 +16,29 @@ TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
 
 twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+log = get_logger("twilio")
 
-def send_sms(to, body):
+def _deliver(to, body):
     twilio_client.messages.create(to=to, from_=TWILIO_PHONE_NUMBER, body=body)
 
 
+# Coalesces notifications per recipient; configured by init_outbox() in app.py.
+outbox = Outbox(_deliver)
+
+
+def send_sms(to, body, urgent=False):
+    """
+    `body` may be a plain string or a Dusty Reply (whose asides can be
+    trimmed). Non-urgent messages may be held briefly and merged with
+    others for the same number. They are delivered later from a timer
+    thread, so a failed send is only logged and counted in outbox.stats(),
+    and anything still held when a worker is killed is lost (a normal exit
+    flushes it). Urgent messages go out now and raise on failure; use them
+    when the caller reports or acts on delivery.
+    """
+    outbox.send(to, body, urgent=urgent)
+
+
 def send_chore_reminders():
     today = date.today()
     chores_due = Chore.query.filter(
@@ -26,15 +48,15 @@ def send_chore_reminders():
     ).all()
 
     if not chores_due:
-        print("[Scheduler] No reminders to send today.")
+        log_event(log, "reminders.none")
         return
 
-    print(f"[Scheduler] Sending {len(chores_due)} reminders...")
+    log_event(log, "reminders.sending", count=len(chores_due))
 
     for chore in chores_due:
         user = User.query.get(chore.assigned_to_id)
         if user and user.phone:
-            message = dusty_response("reminder", name=user.name, chore=chore.name)
+            message = prepare_sms(dusty_response("reminder", name=user.name, chore=chore.name))
             try:
                 client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
                 client.messages.create(
@@ -42,6 +64,6 @@ def send_chore_reminders():
                     from_=TWILIO_PHONE_NUMBER,
                     to=user.phone
                 )
-                print(f"[Reminder] Sent to {user.name} ({user.phone}) for chore '{chore.name}'")
+                log_event(log, "reminders.sent", user=user.name, phone=phone_hash(user.phone), chore=chore.name)
             except Exception as e:
-                print(f"[Reminder Error] Failed to send to {user.phone}: {e}")
\ No newline at end of file
+                log_event(log, "reminders.failed", logging.ERROR, phone=phone_hash(user.phone), error=str(e))
\ No newline at end of file
@@ -0,0 +1,68 @@
+// static/js/live.js
+// Patches dashboard cards in place from the /events stream (routes/events.py).
+(function () {
+  if (!window.EventSource) return;
+
+  var namesEl = document.getElementById("user-names");
+  var names = namesEl ? JSON.parse(namesEl.textContent) : {};
+  var source = new EventSource("/events");
+
+  function card(id) {
+    return document.querySelector('[data-chore-id="' + id + '"]');
+  }
+
+  function field(el, name) {
+    return el.querySelector('[data-field="' + name + '"]');
+  }
+
+  function notice(text) {
+    var el = document.getElementById("live-notice");
+    if (!el) {
+      el = document.createElement("div");
+      el.id = "live-notice";
+      el.className = "alert alert-info";
+      document.querySelector(".container").prepend(el);
+    }
+    el.innerHTML = text + ' <a href="" class="alert-link">Refresh</a>';
+  }
+
+  function patch(e) {
+    var data = JSON.parse(e.data);
+    var el = card(data.id);
+    if (!el) return;
+
+    if ("name" in data) field(el, "name").textContent = data.name;
+    if ("assigned_to_id" in data) {
+      field(el, "assigned_to").textContent =
+        data.assigned_to_id === null ? "Unassigned" : names[data.assigned_to_id] || "someone";
+    }
+    if ("due_date" in data) {
+      field(el, "due_date").textContent = data.due_date ? data.due_date.slice(0, 10) : "anytime";
+    }
+    if ("completed" in data) {
+      var body = el.querySelector(".card");
+      body.classList.toggle("bg-success", !!data.completed);
+      body.classList.toggle("bg-secondary", !data.completed);
+      if (data.completed) {
+        field(el, "status").innerHTML = '<span class="badge bg-light text-dark">Completed</span>';
+      }
+    }
+  }
+
+  ["completed", "reassigned", "snoozed", "updated"].forEach(function (type) {
+    source.addEventListener(type, patch);
+  });
+
+  source.addEventListener("deleted", function (e) {
+    var el = card(JSON.parse(e.data).id);
+    if (el) el.remove();
+  });
+
+  source.addEventListener("added", function () {
+    notice("New chores were added.");
+  });
+
+  source.addEventListener("resync", function () {
+    window.location.reload();
+  });
+})();
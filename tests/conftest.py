@@ -0,0 +1,66 @@
+# tests/conftest.py
+
+import os
+import pytest
+from flask import Flask
+
+from config import Config
+from models import db, User, Chore, ChoreHistory
+from utils.db import init_db
+from utils.versioning import init_versioning
+from utils.fragments import fragment_cache
+from services.archive import ensure_archive_schema
+from routes.history import history_bp
+from routes.manage import manage_bp
+from routes.misc import misc_bp
+from routes.views import views_bp
+from routes.stats import stats_bp
+from routes.export import export_bp
+from routes.api import api_bp
+from routes.events import events_bp
+from routes.calendar import calendar_bp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(
+        __name__,
+        template_folder=os.path.join(ROOT, "templates"),
+        static_folder=os.path.join(ROOT, "static"),
+    )
+    app.config.from_object(Config)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'chores.db'}",
+        HISTORY_ARCHIVE_PATH=str(tmp_path / "chores_archive.db"),
+        DATA_VERSION_PATH=str(tmp_path / "data_version"),
+        SSE_VERSION_POLL_SECONDS=0,
+    )
+    init_db(app)
+    init_versioning(app)
+    fragment_cache.clear()
+    for bp in (views_bp, history_bp, manage_bp, misc_bp, stats_bp, export_bp, api_bp, events_bp, calendar_bp):
+        app.register_blueprint(bp)
+    with app.app_context():
+        db.create_all()
+        ensure_archive_schema()
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def household(app):
+    """An admin plus two regular users."""
+    ronnie = User(name="Ronnie", phone="+15550000001", is_admin=True)
+    erica = User(name="Erica", phone="+15550000002")
+    becky = User(name="Becky", phone="+15550000003")
+    db.session.add_all([ronnie, erica, becky])
+    db.session.commit()
+    return ronnie, erica, becky
@@ -0,0 +1,51 @@
+# tests/test_api.py
+
+from datetime import date, datetime
+
+from models import db, Chore, ChoreHistory
+from utils.db import count_queries
+
+
+def _seed(household):
+    _, erica, becky = household
+    db.session.add_all([
+        Chore(name=f"chore {i}", assigned_to_id=erica.id if i % 2 else None,
+              due_date=date(2024, 1, 1 + i), completed=i % 3 == 0)
+        for i in range(12)
+    ])
+    db.session.add_all([
+        ChoreHistory(chore_name="dishes", user_id=becky.id, completed_at=datetime(2024, 2, d))
+        for d in range(1, 6)
+    ])
+    db.session.commit()
+    return erica, becky
+
+
+def test_chores_filters_and_sparse_fields(client, household):
+    erica, _ = _seed(household)
+    resp = client.get(f"/api/v1/chores?assignee={erica.id}&completed=false&fields=name,assigned_to")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data and all(set(row) == {"name", "assigned_to"} for row in data)
+    assert all(row["assigned_to"] == "Erica" for row in data)
+
+
+def test_chores_cursor_walks_every_row_once(client, household):
+    _seed(household)
+    seen, url = [], "/api/v1/chores?per_page=5&fields=id"
+    with count_queries() as queries:
+        while url:
+            body = client.get(url).get_json()
+            seen += [row["id"] for row in body["data"]]
+            url = f"/api/v1/chores?per_page=5&fields=id&after={body['next_cursor']}" if body["next_cursor"] else None
+    assert sorted(seen) == list(range(1, 13))
+    assert queries.count == 3
+
+
+def test_history_due_range_and_bad_input(client, household):
+    _, becky = _seed(household)
+    body = client.get(f"/api/v1/history?assignee={becky.id}&start_date=2024-02-03").get_json()
+    assert [row["completed_at"][:10] for row in body["data"]] == ["2024-02-05", "2024-02-04", "2024-02-03"]
+
+    assert client.get("/api/v1/users?fields=phone").status_code == 400
+    assert client.get("/api/v1/chores?due_from=yesterday").status_code == 400
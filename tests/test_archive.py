@@ -0,0 +1,88 @@
+# tests/test_archive.py
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, func
+
+from models import db, ChoreHistory
+from services.archive import archive_history, archived_history, archived_chore_names
+from utils.versioning import data_version
+from utils.stats import backfill_rollups, record_completion_rollups
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+def _seed(user, days_ago):
+    for i, age in enumerate(days_ago):
+        when = NOW - timedelta(days=age)
+        db.session.add(ChoreHistory(chore_name=["dishes", "laundry"][i % 2], user_id=user.id, completed_at=when))
+        record_completion_rollups(user.id, when)
+    db.session.commit()
+
+
+def test_archive_moves_old_rows_and_compacts_names(household):
+    ronnie = household[0]
+    _seed(ronnie, [400, 390, 380, 370, 10, 5, 1])
+
+    before = data_version.current()
+    moved = archive_history(365, batch_size=3, now=NOW)
+
+    assert moved == 4
+    assert data_version.current() > before
+    assert ChoreHistory.query.count() == 3
+    assert db.session.execute(select(func.count()).select_from(archived_history)).scalar() == 4
+    assert db.session.execute(select(func.count()).select_from(archived_chore_names)).scalar() == 2
+
+
+def test_history_page_spans_archive_for_old_ranges(client, household):
+    ronnie = household[0]
+    _seed(ronnie, [400, 1])
+    archive_history(365, now=NOW)
+
+    recent_start = (NOW - timedelta(days=30)).strftime("%Y-%m-%d")
+    recent = client.get(f"/chore-history?start_date={recent_start}")
+    assert recent.data.count(b"card-title") == 1
+
+    old_start = (NOW - timedelta(days=500)).strftime("%Y-%m-%d")
+    spanning = client.get(f"/chore-history?start_date={old_start}")
+    assert spanning.data.count(b"card-title") == 2
+
+    assert client.get("/chore-history").data.count(b"card-title") == 2
+    old_end = (NOW - timedelta(days=395)).strftime("%Y-%m-%d")
+    assert client.get(f"/chore-history?end_date={old_end}").data.count(b"card-title") == 1
+
+
+def test_archive_ids_are_not_reused_once_hot_table_empties(household):
+    ronnie = household[0]
+    _seed(ronnie, [400, 390])
+    assert archive_history(365, now=NOW) == 2
+    assert ChoreHistory.query.count() == 0
+
+    _seed(ronnie, [380, 1])
+    assert min(h.id for h in ChoreHistory.query) > 2
+    assert archive_history(365, now=NOW) == 1
+    assert db.session.execute(select(func.count()).select_from(archived_history)).scalar() == 3
+
+
+def test_interrupted_batch_is_finished_by_rerun(household):
+    ronnie = household[0]
+    _seed(ronnie, [400, 390])
+    old = ChoreHistory.query.order_by(ChoreHistory.id).first()
+    # A crash between the archive commit and the hot delete leaves the row in both files.
+    db.session.execute(archived_chore_names.insert().values(id=1, name=old.chore_name))
+    db.session.execute(archived_history.insert().values(
+        id=old.id, name_id=1, user_id=old.user_id, completed_at=old.completed_at,
+    ))
+    db.session.commit()
+
+    assert archive_history(365, now=NOW) == 2
+    assert ChoreHistory.query.count() == 0
+    assert db.session.execute(select(func.count()).select_from(archived_history)).scalar() == 2
+
+
+def test_backfill_counts_archived_rows(household):
+    ronnie = household[0]
+    _seed(ronnie, [400, 1])
+    archive_history(365, now=NOW)
+
+    assert backfill_rollups() == 2
@@ -0,0 +1,60 @@
+# tests/test_autoassign.py
+
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from models import db, Chore, ChoreStats
+from services import importer
+from services.autoassign import plan_assignments
+from utils.db import count_queries
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    messages = []
+    monkeypatch.setattr(importer, "send_sms", lambda to, body, urgent=False: messages.append((to, str(body))))
+    return messages
+
+
+def test_plan_balances_load_and_fatigue():
+    chores = [(i, f"chore {i}", None) for i in range(90)]
+    users = [(1, 0), (2, 0), (3, 10)]
+    plan = plan_assignments(chores, users, {1: 10.0}, {}, date(2024, 1, 1))
+    counts = Counter(user_id for _, user_id in plan)
+    # User 1 already holds 10, user 3 carries a 5-point fatigue penalty.
+    assert counts == {1: 25, 2: 35, 3: 30}
+
+
+def test_history_breaks_near_ties():
+    chores = [(1, "dishes", None)]
+    plan = plan_assignments(chores, [(1, 0), (2, 0)], {2: 0.5}, {(2, "dishes"): 10}, date(2024, 1, 1))
+    assert plan == [(1, 2)]
+
+
+def test_route_assigns_everything_in_one_update(client, household, sent):
+    ronnie, erica, becky = household
+    db.session.add_all([Chore(name=f"chore {i}", due_date=date(2024, 1, 1 + i)) for i in range(9)])
+    db.session.add(Chore(name="taken", assigned_to_id=erica.id))
+    db.session.add(ChoreStats(user_id=becky.id, chore_name="chore 0", times_completed=3))
+    db.session.commit()
+
+    with count_queries() as queries:
+        client.post("/auto-assign")
+    assert sum(s.startswith("UPDATE chore") for s in queries.statements) == 1
+
+    assert Chore.query.filter_by(assigned_to_id=None).count() == 0
+    assert Chore.query.filter_by(name="chore 0").one().assigned_to_id == becky.id
+    assert sorted(to for to, _ in sent) == sorted(u.phone for u in household)
+
+
+def test_scheduler_job_sends_the_same_summaries(household, sent):
+    from services.scheduler import auto_assign_unassigned
+
+    db.session.add_all([Chore(name=f"chore {i}") for i in range(3)])
+    db.session.commit()
+
+    auto_assign_unassigned(db)
+    assert Chore.query.filter_by(assigned_to_id=None).count() == 0
+    assert sent and all("new chore(s):" in body for _, body in sent)
@@ -0,0 +1,58 @@
+# tests/test_bulk_actions.py
+
+from datetime import date
+
+import pytest
+
+from models import db, Chore
+from routes import manage
+from utils.db import count_queries
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    messages = []
+    monkeypatch.setattr(manage, "send_sms", lambda to, body: messages.append((to, str(body))))
+    return messages
+
+
+@pytest.fixture
+def chores(household):
+    ronnie, erica, becky = household
+    rows = [
+        Chore(name="dishes", assigned_to_id=erica.id, due_date=date(2024, 5, 1), recurrence="weekly"),
+        Chore(name="laundry", assigned_to_id=erica.id, due_date=date(2024, 5, 1)),
+        Chore(name="vacuum", assigned_to_id=becky.id),
+        Chore(name="mop", assigned_to_id=ronnie.id, due_date=date(2024, 5, 31)),
+    ]
+    db.session.add_all(rows)
+    db.session.commit()
+    return [c.id for c in rows]
+
+
+def _post(client, action, ids, **extra):
+    return client.post("/bulk", data={"action": action, "chore_ids": ids, **extra})
+
+
+def test_snooze_is_one_update(client, chores):
+    with count_queries() as queries:
+        _post(client, "snooze", chores)
+    assert sum(s.startswith("UPDATE chore") for s in queries.statements) == 1
+    due = {c.name: c.due_date for c in Chore.query}
+    assert due == {"dishes": date(2024, 5, 8), "laundry": date(2024, 5, 2),
+                   "vacuum": None, "mop": date(2024, 6, 1)}
+
+
+def test_reassign_sends_one_text_per_recipient(client, household, chores, sent):
+    becky = household[2]
+    _post(client, "reassign", chores, user_id=becky.id)
+    assert {c.assigned_to_id for c in Chore.query} == {becky.id}
+    assert len(sent) == 1
+    assert sent[0][0] == becky.phone and "dishes" in sent[0][1] and "mop" in sent[0][1]
+
+
+def test_unassign_and_delete(client, chores):
+    _post(client, "unassign", chores[:2])
+    assert Chore.query.filter(Chore.assigned_to_id.is_(None)).count() == 2
+    _post(client, "delete", chores[2:])
+    assert Chore.query.count() == 2
@@ -0,0 +1,55 @@
+# tests/test_calendar.py
+
+from datetime import date
+
+from models import db, Chore
+from routes.calendar import feed_token
+from utils.db import count_queries
+from utils.ical import rrule_for
+
+
+def _url(user):
+    return f"/calendar/{user.id}/{feed_token(user.id)}.ics"
+
+
+def test_feed_lists_open_chores_with_rrules(client, household):
+    _, erica, _ = household
+    db.session.add_all([
+        Chore(name="bins, recycling", assigned_to_id=erica.id, due_date=date(2024, 3, 4), recurrence="weekly (Monday)"),
+        Chore(name="done already", assigned_to_id=erica.id, due_date=date(2024, 3, 1), completed=True),
+    ])
+    db.session.commit()
+
+    resp = client.get(_url(erica))
+    body = resp.get_data(as_text=True)
+    assert resp.mimetype == "text/calendar"
+    assert "SUMMARY:bins\\, recycling" in body
+    assert "RRULE:FREQ=WEEKLY;BYDAY=MO" in body
+    assert "done already" not in body
+    assert client.get(f"/calendar/{erica.id}/nope.ics").status_code == 404
+
+
+def test_other_users_changes_keep_the_etag(client, household):
+    _, erica, becky = household
+    db.session.add(Chore(name="dishes", assigned_to_id=erica.id, due_date=date(2024, 3, 4)))
+    db.session.commit()
+    etag = client.get(_url(erica)).headers["ETag"]
+
+    with count_queries() as queries:
+        assert client.get(_url(erica), headers={"If-None-Match": etag}).status_code == 304
+    assert queries.count == 0
+
+    db.session.add(Chore(name="vacuum", assigned_to_id=becky.id, due_date=date(2024, 3, 5)))
+    db.session.commit()
+    assert client.get(_url(erica), headers={"If-None-Match": etag}).status_code == 304
+
+    db.session.add(Chore(name="laundry", assigned_to_id=erica.id, due_date=date(2024, 3, 6)))
+    db.session.commit()
+    resp = client.get(_url(erica), headers={"If-None-Match": etag})
+    assert resp.status_code == 200 and "laundry" in resp.get_data(as_text=True)
+
+
+def test_rrule_mapping():
+    assert rrule_for("biweekly") == "FREQ=WEEKLY;INTERVAL=2"
+    assert rrule_for("Weekly (Monday, Friday)") == "FREQ=WEEKLY;BYDAY=MO,FR"
+    assert rrule_for("whenever") is None
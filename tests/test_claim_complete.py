@@ -0,0 +1,50 @@
+# tests/test_claim_complete.py
+
+import pytest
+from sqlalchemy.orm import Session
+
+from models import db, Chore, ChoreHistory, ChoreStats, User
+from routes import history
+from utils.chores import claim_chore, mark_chore_completed
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    messages = []
+    monkeypatch.setattr(history, "send_sms", lambda to, body: messages.append((to, body)))
+    return messages
+
+
+def test_only_the_first_claim_wins(household):
+    _, erica, becky = household
+    chore = Chore(name="dishes")
+    db.session.add(chore)
+    db.session.commit()
+
+    # Another worker claims it between our read and our write.
+    with Session(db.engine) as other:
+        other.execute(Chore.__table__.update().where(Chore.id == chore.id).values(assigned_to_id=becky.id))
+        other.commit()
+
+    assert chore.assigned_to_id is None  # our stale copy
+    assert claim_chore(chore.id, erica.id) is None
+    db.session.commit()
+    assert db.session.get(Chore, chore.id).assigned_to_id == becky.id
+
+
+def test_double_complete_counts_once(client, household, sent):
+    ronnie, erica, _ = household
+    chore = Chore(name="dishes", assigned_to_id=erica.id)
+    db.session.add(chore)
+    db.session.commit()
+
+    client.get(f"/complete/{chore.id}")
+    resp = client.get(f"/complete/{chore.id}")  # a double click or a retry
+    assert resp.status_code == 302 and resp.location.endswith("/")
+
+    assert ChoreHistory.query.count() == 1
+    assert ChoreStats.query.one().times_completed == 1
+    assert db.session.get(User, erica.id).total_chores_completed == 1
+    assert [to for to, _ in sent] == [ronnie.phone]
+    assert mark_chore_completed(chore.id) is None
+    assert client.get("/complete/9999").status_code == 404
@@ -0,0 +1,37 @@
+# tests/test_conditional_get.py
+
+from models import db, Chore
+from utils.db import count_queries
+
+
+def test_unchanged_dashboard_answers_304_without_queries(client, household):
+    first = client.get("/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    with count_queries() as queries:
+        again = client.get("/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert queries.count == 0
+
+
+def test_writes_change_the_etag(client, household):
+    etag = client.get("/chore-history").headers["ETag"]
+
+    db.session.add(Chore(name="dishes", assigned_to_id=household[1].id))
+    db.session.commit()
+
+    resp = client.get("/chore-history", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_bulk_updates_change_the_etag(client, household):
+    chore = Chore(name="dishes", assigned_to_id=household[1].id)
+    db.session.add(chore)
+    db.session.commit()
+    etag = client.get("/").headers["ETag"]
+
+    client.post("/bulk", data={"action": "unassign", "chore_ids": [chore.id]})
+    client.get("/")  # consume the flash message
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
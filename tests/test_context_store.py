@@ -0,0 +1,71 @@
+# tests/test_context_store.py
+
+import time
+from datetime import datetime
+
+from utils.context.backends import SQLiteBackend
+from utils.context.tracker import ContextTracker, ConversationContext
+
+
+def test_lru_capacity_and_api():
+    store = ConversationContext(max_entries=2, ttl=60)
+    store.set("+1", "add", {"chore": "dishes", "assignee": "erica"})
+    store.set("+2", "add", {"chore": "laundry"})
+    assert store.get_last_chore("+1") == "dishes"  # touching +1 makes +2 the oldest
+    store.set("+3", "list", {})
+
+    assert len(store) == 2
+    assert store.get("+2") is None
+    assert store.get("+1").last_assignee == "erica"
+    assert store.stats()["evictions"] == 1
+
+    store.set_last_intent("+3", "mark_done_waiting_for_chore")
+    assert store.get("+3").last_intent == "mark_done_waiting_for_chore"
+    store.clear("+3")
+    assert store.get_last_chore("+3") is None
+
+
+def test_ttl_expiry_and_sweep():
+    store = ConversationContext(max_entries=10, ttl=0.05)
+    store.put("+1", ContextTracker())
+    store.put("+2", ContextTracker())
+    time.sleep(0.06)
+    store.put("+3", ContextTracker())
+
+    assert store.get("+1") is None      # expired on read
+    assert store.sweep() == 1           # +2 goes in the sweep
+    assert len(store) == 1 and store.get("+3") is not None
+    assert store.stats()["expirations"] == 2
+
+
+def test_records_are_slotted():
+    assert not hasattr(ContextTracker(), "__dict__")
+
+
+def test_sqlite_backend_is_shared_between_workers(tmp_path):
+    path = str(tmp_path / "context.db")
+    worker_a = ConversationContext(SQLiteBackend(path, ttl=60))
+    worker_b = ConversationContext(SQLiteBackend(path, ttl=60))  # another process, same file
+
+    due = datetime(2024, 5, 1, 9, 30)
+    worker_a.set("+1", "add", {"chore": "dishes", "assignee": "erica", "due_date": due})
+    seen = worker_b.get("+1")
+    assert seen.last_intent == "add" and seen.last_chore == "dishes"
+    assert seen.last_due_date == due and seen.last_entities["due_date"] == due
+
+    worker_b.set_last_intent("+1", "done")
+    assert worker_a.get("+1").last_intent == "done"
+    worker_a.clear("+1")
+    assert worker_b.get_last_chore("+1") is None
+
+
+def test_sqlite_backend_ttl_and_cap(tmp_path):
+    store = ConversationContext(SQLiteBackend(str(tmp_path / "context.db"), max_entries=2, ttl=0.05))
+    store.put("+1", ContextTracker())
+    time.sleep(0.06)
+    assert store.get("+1") is None
+    store.backend.ttl = 60
+    for phone in ("+2", "+3", "+4"):
+        store.put(phone, ContextTracker())
+    assert store.sweep() == 2  # the expired +1, and +2 over the cap
+    assert len(store) == 2 and store.get("+2") is None
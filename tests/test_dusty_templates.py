@@ -0,0 +1,68 @@
+# tests/test_dusty_templates.py
+
+import os
+
+from utils.dusty import templates as templates_module
+from utils.dusty.templates import CompiledTemplate, DustyTemplates
+
+
+def _write(path, greeting, mtime):
+    path.write_text(
+        "DUSTY_RESPONSES:\n"
+        f"  greetings:\n    - \"{greeting}\"\n"
+        "  help:\n    default:\n      - \"plain help\"\n    sarcastic:\n      - \"snarky help, {name}\"\n"
+        "DUSTY_SNARK:\n  - \"meh\"\n"
+        "HOLIDAY_SNARK: {}\n"
+    )
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_compiled_template_matches_str_format():
+    t = CompiledTemplate("Hi {name}, {chore!r} is due {due:>5}. {{literal}}")
+    values = {"name": "Erica", "chore": "dishes", "due": "today"}
+    assert t.fields == {"name", "chore", "due"}
+    assert t.render(values) == t.text.format(**values)
+    assert t.render({"name": "Erica"}, {"chore": "x", "due": "y"}) == t.text.format(name="Erica", chore="x", due="y")
+    # A missing field falls back to the raw text.
+    assert t.render({"name": "Erica"}) == t.text
+
+
+def test_tones_and_hot_reload(tmp_path, monkeypatch):
+    monkeypatch.setattr(templates_module, "CHECK_INTERVAL", 0)
+    path = tmp_path / "responses.yaml"
+    _write(path, "hello {name}", 1_000_000_000)
+    engine = DustyTemplates(str(path))
+
+    assert engine.render("greetings", "gentle", {"name": "Becky"}) == "hello Becky"
+    assert engine.render("help", "sarcastic", {"name": "Becky"}) == "snarky help, Becky"
+    assert engine.render("help", "gentle", {}) == "plain help"  # falls back to default tone
+    assert engine.render("not a key: {x}", "default", {"x": 1}) == "not a key: 1"
+
+    _write(path, "howdy {name}", 2_000_000_000)
+    assert engine.render("greetings", "default", {"name": "Becky"}) == "howdy Becky"
+
+    # A broken edit keeps the last good set.
+    path.write_text("DUSTY_RESPONSES: [unclosed")
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    assert engine.render("greetings", "default", {"name": "Becky"}) == "howdy Becky"
+    assert engine.render_stats()["greetings"]["renders"] == 3
+
+
+def test_rendering_returns_updates_instead_of_writing(household, monkeypatch):
+    from models import db
+    from utils.dusty import dusty_response, apply_replies
+    from utils.dusty import dusty as dusty_module
+
+    monkeypatch.setattr(dusty_module.random, "random", lambda: 0.0)  # every optional branch fires
+    erica = household[1]
+    erica.last_roast = None
+    db.session.commit()
+
+    reply = dusty_response("greetings", name=erica.name, user=erica)
+    assert "🔥" in reply.text
+    assert not db.session.dirty and erica.last_roast is None
+    assert [u.field for u in reply.updates] == ["last_roast"]
+
+    assert apply_replies([reply]) is True
+    assert erica.last_roast is not None
+    assert dusty_response("plain text, no user").updates == []
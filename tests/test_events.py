@@ -0,0 +1,82 @@
+# tests/test_events.py
+
+import os
+from datetime import date
+
+from models import db, Chore
+from utils.chores import bulk_snooze
+from utils.pubsub import broker, check_other_workers
+from utils.versioning import data_version
+
+
+def _drain(sub):
+    events = []
+    while (event := sub.get(timeout=0)) is not None:
+        events.append(event)
+    return events
+
+
+def test_committed_changes_become_events(app, household):
+    _, erica, becky = household
+    sub = broker.subscribe(max_subscribers=10)
+    try:
+        chore = Chore(name="dishes", assigned_to_id=erica.id, due_date=date(2024, 1, 1))
+        db.session.add(chore)
+        db.session.commit()
+        chore.assigned_to_id = becky.id
+        db.session.commit()
+        bulk_snooze([chore.id])
+        db.session.commit()
+        chore.completed = True
+        db.session.commit()
+
+        # A rolled-back write is never announced.
+        chore.name = "never mind"
+        db.session.flush()
+        db.session.rollback()
+
+        events = _drain(sub)
+    finally:
+        broker.unsubscribe(sub)
+
+    assert [e["type"] for e in events] == ["added", "reassigned", "snoozed", "completed"]
+    assert events[1]["data"]["assigned_to_id"] == becky.id
+    assert all(e["data"]["id"] == chore.id for e in events)
+
+
+def test_connection_limit(client):
+    app = client.application
+    app.config["SSE_MAX_CONNECTIONS"] = 1
+    sub = broker.subscribe(max_subscribers=1)
+    try:
+        assert client.get("/events").status_code == 503
+    finally:
+        broker.unsubscribe(sub)
+
+
+def test_closing_an_unread_stream_frees_its_slot(client):
+    client.application.config["SSE_MAX_CONNECTIONS"] = 1
+    resp = client.get("/events", buffered=False)
+    assert resp.status_code == 200 and broker.connections == 1
+    resp.close()  # client gone before the first chunk was read
+    assert broker.connections == 0
+
+
+def test_writes_from_other_workers_trigger_a_resync(app, household):
+    sub = broker.subscribe(max_subscribers=10)
+    try:
+        check_other_workers()
+        db.session.add(Chore(name="dishes"))
+        db.session.commit()
+        assert not check_other_workers()  # our own write arrived as an event already
+
+        later = data_version.current() + 1_000_000
+        os.utime(data_version.path, ns=(later, later))  # another worker commits
+        assert check_other_workers()
+        assert not check_other_workers()
+
+        events = _drain(sub)
+    finally:
+        broker.unsubscribe(sub)
+
+    assert [e["type"] for e in events] == ["added", "resync"]
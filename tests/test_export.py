@@ -0,0 +1,44 @@
+# tests/test_export.py
+
+import csv
+import io
+import json
+from datetime import datetime
+
+from models import db, Chore, ChoreHistory
+
+
+def _seed(household):
+    ronnie, erica, _ = household
+    db.session.add_all([
+        ChoreHistory(chore_name=f"chore {i}", user_id=(ronnie if i % 2 else erica).id,
+                     completed_at=datetime(2024, 1, 1 + i))
+        for i in range(20)
+    ])
+    db.session.add(Chore(name="dishes", assigned_to_id=erica.id))
+    db.session.commit()
+    return ronnie, erica
+
+
+def test_history_csv_respects_filters(client, household):
+    _, erica = _seed(household)
+    resp = client.get(f"/export/history.csv?user_id={erica.id}&start_date=2024-01-05")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(resp.get_data(as_text=True))))
+    assert rows and all(r["user_name"] == "Erica" for r in rows)
+    assert min(r["completed_at"] for r in rows) >= "2024-01-05"
+
+
+def test_chores_jsonl_and_cli(app, client, household):
+    _seed(household)
+    lines = client.get("/export/chores.jsonl").get_data(as_text=True).splitlines()
+    assert json.loads(lines[0])["assigned_to"] == "Erica"
+
+    result = app.test_cli_runner().invoke(args=["export", "run", "history", "--format", "jsonl"])
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 20
+
+
+def test_unknown_dataset_is_404(client):
+    assert client.get("/export/passwords.csv").status_code == 404
@@ -0,0 +1,44 @@
+# tests/test_fragments.py
+
+from models import db, Chore
+from utils.fragments import fragment_cache
+
+
+def test_single_update_rerenders_only_that_card(client, household):
+    chores = [Chore(name=f"chore {i}", assigned_to_id=household[1].id) for i in range(10)]
+    db.session.add_all(chores)
+    db.session.commit()
+    client.get("/")
+
+    chores[3].name = "mop the floor"
+    db.session.commit()
+
+    before = fragment_cache.stats()
+    page = client.get("/").get_data(as_text=True)
+    after = fragment_cache.stats()
+
+    assert "mop the floor" in page and "chore 3" not in page
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] >= 9
+
+
+def test_renaming_a_user_refreshes_cards_and_dropdowns(client, household):
+    db.session.add(Chore(name="dishes", assigned_to_id=household[1].id))
+    db.session.commit()
+    client.get("/")
+
+    household[1].name = "Rica"
+    db.session.commit()
+
+    page = client.get("/").get_data(as_text=True)
+    assert "Erica" not in page
+    assert page.count("Rica") >= 3  # card, its dropdown, the bulk dropdown
+
+
+def test_cache_is_bounded():
+    cache = type(fragment_cache)(max_entries=3)
+    for i in range(5):
+        cache.get_or_render(("chore", i), 1, lambda: f"<p>{i}</p>")
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 2
@@ -0,0 +1,78 @@
+# tests/test_import.py
+
+import io
+
+import pytest
+
+from models import Chore
+from services import importer
+from services.importer import import_chores, read_rows
+from utils.db import count_queries
+from utils.pubsub import broker
+from utils.versioning import data_version
+
+CSV = """name,assignee,due_date,recurrence
+dishes,Erica,2024-05-01,daily
+laundry,erica,,weekly
+vacuum,Becky,2024-05-03,
+mop,Nobody,2024-05-03,
+trash,,2024-13-01,
+sweep,,,
+"""
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    messages = []
+    monkeypatch.setattr(importer, "send_sms", lambda to, body, urgent=False: messages.append((to, str(body))))
+    return messages
+
+
+def test_csv_import_batches_inserts_and_summarises_per_assignee(household, sent):
+    with count_queries() as queries:
+        result = import_chores(read_rows(io.StringIO(CSV), "csv"), batch_size=2)
+
+    assert result.created == 4
+    assert [line for line, _ in result.errors] == [5, 6]
+    assert Chore.query.count() == 4
+    inserts = [s for s in queries.statements if s.startswith("INSERT INTO chore")]
+    assert len(inserts) == 2  # 4 rows in batches of 2
+
+    # One summary text each for Erica (2 chores) and Becky (1 chore).
+    assert sorted(to for to, _ in sent) == ["+15550000002", "+15550000003"]
+    erica_text = next(body for to, body in sent if to == "+15550000002")
+    assert "dishes" in erica_text and "laundry" in erica_text
+
+
+def test_jsonl_upload_route(client, household, sent):
+    data = b'{"name": "dishes", "assignee": "Ronnie"}\n\nnot json\n'
+    resp = client.post("/import", data={"file": (io.BytesIO(data), "chores.jsonl")},
+                       content_type="multipart/form-data")
+    assert resp.status_code == 302
+    assert Chore.query.count() == 1
+    assert len(sent) == 1
+
+
+def test_import_bumps_data_version_and_publishes_added(household, sent):
+    before = data_version.current()
+    sub = broker.subscribe(10)
+    try:
+        import_chores(read_rows(io.StringIO(CSV), "csv"), notify=False)
+        events = [sub.get(timeout=0) for _ in range(4)]
+    finally:
+        broker.unsubscribe(sub)
+
+    assert data_version.current() > before
+    assert [e["type"] for e in events] == ["added"] * 4
+    assert {e["data"]["id"] for e in events} == {c.id for c in Chore.query}
+
+
+def test_notified_counts_only_delivered_texts(household, monkeypatch):
+    def send(to, body, urgent=False):
+        assert urgent  # the count has to reflect the actual send
+        if to == "+15550000003":
+            raise RuntimeError("twilio down")
+
+    monkeypatch.setattr(importer, "send_sms", send)
+    result = import_chores(read_rows(io.StringIO(CSV), "csv"))
+    assert result.notified == 1  # Erica's went out, Becky's failed
@@ -0,0 +1,75 @@
+# tests/test_loadtest.py
+
+import pytest
+from flask import request
+
+from models import db, Chore, User
+from services.loadtest import parse_mix, plan_messages, run_load, seed_household
+from services.twilio_tools import outbox, send_sms
+from utils.twilio.fake import FakeTwilioError, FakeTwilioTransport
+
+
+def test_seeding_and_plans_are_deterministic(app):
+    population = seed_household(db.session, users=5, chores_per_user=2, seed=7)
+    assert population[0] == ("Load000", "+15559000000")
+    assert Chore.query.count() == 5 * 2 + 5
+    first = [c.name for c in Chore.query.order_by(Chore.id)]
+
+    mix = parse_mix("list=3,done=1")
+    plan = plan_messages(population, 50, mix, seed=7)
+    assert plan == plan_messages(population, 50, mix, seed=7)
+    assert plan != plan_messages(population, 50, mix, seed=8)
+    assert {body.split()[0] for _, body in plan} <= {"list", "show", "done", "finished"}
+
+    db.session.query(Chore).delete()
+    db.session.query(User).delete()
+    db.session.commit()
+    seed_household(db.session, users=5, chores_per_user=2, seed=7)
+    assert [c.name for c in Chore.query.order_by(Chore.id)] == first
+
+    with pytest.raises(ValueError):
+        parse_mix("dance=1")
+
+
+def test_fake_transport_fails_reproducibly():
+    def outcomes(seed):
+        transport = FakeTwilioTransport(failure_rate=0.5, seed=seed)
+        results = []
+        for i in range(20):
+            try:
+                transport("+1", f"msg {i}")
+                results.append(True)
+            except FakeTwilioError:
+                results.append(False)
+        return transport, results
+
+    transport, results = outcomes(3)
+    assert results == outcomes(3)[1]
+    assert transport.stats() == {"sent": results.count(True), "failed": results.count(False)}
+    assert transport.messages_to("+1")[0].startswith("msg ")
+
+
+def test_run_load_reports_throughput_and_sms(app, household):
+    # A stand-in webhook: writes a row and texts the sender, like the real handlers do.
+    @app.route("/sms", methods=["POST"])
+    def fake_sms():
+        db.session.add(Chore(name=request.form["Body"]))
+        db.session.commit()
+        send_sms(request.form["From"], "ok")
+        return "<Response/>"
+
+    transport = FakeTwilioTransport(latency_ms=1, seed=1)
+    real = outbox.transport
+    outbox.transport = transport
+    try:
+        plan = [(u.phone, f"chore {i}") for i in range(10) for u in household]
+        report = run_load(app, plan, concurrency=4, transport=transport)
+    finally:
+        outbox.transport = real
+
+    assert report["requests"] == 30 and report["statuses"] == {200: 30}
+    assert report["db_lock_errors"] == 0
+    assert report["sms_sent"] == 30 and report["sms_failed"] == 0
+    assert report["throughput_rps"] > 0
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["max"]
+    assert len(transport.messages_to(household[1].phone)) == 10
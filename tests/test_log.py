@@ -0,0 +1,52 @@
+# tests/test_log.py
+
+import io
+import json
+import logging
+
+import pytest
+
+from utils import log as log_module
+from utils.log import configure_logging, get_logger, init_logging, log_event, phone_hash
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Route the dusty loggers to a buffer through a fresh queue listener."""
+    monkeypatch.setattr(log_module, "_listener", None)
+    buf = io.StringIO()
+    configure_logging("INFO", json_lines=True, stream=buf, salt="test")
+    root = logging.getLogger(log_module.ROOT)
+    handler = root.handlers[-1]
+
+    def lines():
+        log_module.shutdown_logging()  # drains the queue
+        return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+    yield lines
+    root.removeHandler(handler)
+    root.propagate = True
+
+
+def test_events_are_structured_and_level_gated(captured):
+    log = get_logger("test")
+    log_event(log, "thing.happened", phone=phone_hash("+15550000001"), ms=1.5)
+    log_event(log, "thing.detail", logging.DEBUG, body="not at INFO")
+
+    (event,) = captured()
+    assert event["event"] == "thing.happened" and event["logger"] == "test" and event["level"] == "info"
+    assert event["ms"] == 1.5
+    assert event["phone"] == phone_hash("+15550000001") and "5550000001" not in event["phone"]
+
+
+def test_request_id_is_attached(app, captured):
+    init_logging(app)
+
+    @app.route("/_log_probe")
+    def probe():
+        log_event(get_logger("test"), "probe")
+        return "ok"
+
+    response = app.test_client().get("/_log_probe", headers={"X-Request-ID": "req-123"})
+    assert response.headers["X-Request-ID"] == "req-123"
+    assert [e["request_id"] for e in captured() if e["event"] == "probe"] == ["req-123"]
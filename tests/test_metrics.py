@@ -0,0 +1,71 @@
+# tests/test_metrics.py
+
+from routes.metrics import metrics_bp
+from utils.metrics import Metrics, init_metrics, metrics
+
+
+def test_counters_and_histograms_render_as_prometheus_text():
+    registry = Metrics()
+    registry.describe("jobs_total", "Jobs run.")
+    registry.inc("jobs_total", job="reminders")
+    registry.inc("jobs_total", 2, job="reminders")
+    registry.observe("phase_seconds", 0.003, phase="parse")
+    registry.observe("phase_seconds", 0.2, phase="parse")
+    with registry.timed("phase_seconds", phase="commit"):
+        pass
+
+    text = registry.render()
+    assert "# HELP jobs_total Jobs run.\n# TYPE jobs_total counter\n" in text
+    assert 'jobs_total{job="reminders"} 3\n' in text
+    assert "# TYPE phase_seconds histogram" in text
+    assert 'phase_seconds_bucket{phase="parse",le="0.005"} 1\n' in text
+    assert 'phase_seconds_bucket{phase="parse",le="+Inf"} 2\n' in text
+    assert 'phase_seconds_count{phase="parse"} 2\n' in text
+    assert 'phase_seconds_count{phase="commit"} 1\n' in text
+
+
+def test_disabled_registry_records_nothing():
+    registry = Metrics(enabled=False)
+    registry.inc("jobs_total")
+    with registry.timed("phase_seconds"):
+        pass
+    assert registry.render() == "\n"
+
+
+def test_metrics_endpoint(app, client, household):
+    init_metrics(app)
+    app.register_blueprint(metrics_bp)
+    metrics.reset()
+
+    assert client.get("/").status_code == 200
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert 'dusty_request_seconds_count{endpoint="views.index"} 1' in body
+    assert "dusty_fragment_cache_misses_total" in body
+    assert "metrics.scrape" not in body
+
+
+def test_collector_families_are_contiguous(app, client, household):
+    from utils.dusty import dusty_response
+
+    app.register_blueprint(metrics_bp)
+    for key in ("greetings", "help", "greetings"):
+        dusty_response(key, name="Erica")
+
+    lines = client.get("/metrics").get_data(as_text=True).splitlines()
+    families, kinds, family = [], {}, None
+    for line in lines:
+        if line.startswith("# TYPE "):
+            family, kind = line.split()[2:4]
+            families.append(family)
+            kinds[family] = kind
+        elif line and not line.startswith("#"):
+            # Every sample belongs to the family declared just above it.
+            name = line.split("{")[0].split(" ")[0]
+            suffixes = ("", "_bucket", "_sum", "_count") if kinds[family] == "histogram" else ("",)
+            assert name in {family + suffix for suffix in suffixes}, line
+    assert len(families) == len(set(families))
+    assert kinds["dusty_template_render_seconds_total"] == "counter"
+    assert not any(name.endswith("_sum") for name, kind in kinds.items() if kind == "counter")
@@ -0,0 +1,49 @@
+# tests/test_outbox.py
+
+from utils.twilio.outbox import Outbox
+
+
+def _outbox(sent, **kwargs):
+    return Outbox(lambda to, body: sent.append((to, body)), **kwargs)
+
+
+def test_messages_to_one_number_are_merged():
+    sent = []
+    outbox = _outbox(sent, window=60, budget=2)
+    outbox.send("+1", "Erica finished dishes.")
+    outbox.send("+2", "Becky, laundry is yours.")
+    outbox.send("+1", "Erica finished trash.")
+    assert sent == []
+
+    outbox.flush()
+    assert sorted(sent) == [
+        ("+1", "Erica finished dishes.\n\nErica finished trash."),
+        ("+2", "Becky, laundry is yours."),
+    ]
+    stats = outbox.stats()
+    assert stats["queued"] == 3 and stats["sent"] == 2 and stats["pending"] == 0
+    assert stats["merge_ratio"] == 1.5
+
+
+def test_merging_respects_segment_budget():
+    sent = []
+    outbox = _outbox(sent, window=60, budget=1)
+    for word in ("a", "b", "c"):
+        outbox.send("+1", word * 70)
+    outbox.flush("+1")
+    # Two 70-character messages plus a separator still fit in 160; the third doesn't.
+    assert [body for _, body in sent] == ["a" * 70 + "\n\n" + "b" * 70, "c" * 70]
+
+
+def test_urgent_and_disabled_bypass_the_window():
+    sent = []
+    outbox = _outbox(sent, window=60)
+    outbox.send("+1", "held")
+    outbox.send("+1", "now", urgent=True)
+    assert sent == [("+1", "now")]
+
+    outbox.configure(window=0)
+    outbox.send("+2", "also now")
+    assert sent[-1] == ("+2", "also now")
+    outbox.flush()
+    assert ("+1", "held") in sent
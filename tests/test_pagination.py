@@ -0,0 +1,67 @@
+# tests/test_pagination.py
+
+from datetime import date, datetime, timedelta
+
+from models import db, Chore, ChoreHistory
+from utils.pagination import keyset_paginate
+
+
+def _walk(query, sort_col, id_col, **kwargs):
+    """Follow next-cursors from the first page to the last; return every page."""
+    pages = [keyset_paginate(query, sort_col, id_col, **kwargs)]
+    while pages[-1].next_cursor:
+        pages.append(keyset_paginate(query, sort_col, id_col, after=pages[-1].next_cursor, **kwargs))
+    return pages
+
+
+def test_history_pages_cover_everything_newest_first(household):
+    ronnie = household[0]
+    start = datetime(2024, 1, 1)
+    # Duplicate timestamps make sure the id tie-breaker is honoured.
+    db.session.add_all([
+        ChoreHistory(chore_name=f"chore {i}", user_id=ronnie.id, completed_at=start + timedelta(hours=i // 2))
+        for i in range(23)
+    ])
+    db.session.commit()
+
+    pages = _walk(ChoreHistory.query, ChoreHistory.completed_at, ChoreHistory.id,
+                  per_page=5, descending=True)
+    seen = [h for page in pages for h in page]
+    expected = ChoreHistory.query.order_by(ChoreHistory.completed_at.desc(), ChoreHistory.id.desc()).all()
+    assert [h.id for h in seen] == [h.id for h in expected]
+    assert [len(p) for p in pages] == [5, 5, 5, 5, 3]
+    assert pages[0].prev_cursor is None
+
+    # Stepping back from the third page lands on the second.
+    back = keyset_paginate(ChoreHistory.query, ChoreHistory.completed_at, ChoreHistory.id,
+                           before=pages[2].prev_cursor, per_page=5, descending=True)
+    assert [h.id for h in back] == [h.id for h in pages[1]]
+
+
+def test_chores_without_due_date_sort_first(household):
+    db.session.add_all(
+        [Chore(name=f"anytime {i}") for i in range(3)]
+        + [Chore(name=f"dated {i}", due_date=date(2024, 5, 1) + timedelta(days=i % 4)) for i in range(8)]
+    )
+    db.session.commit()
+
+    pages = _walk(Chore.query, Chore.due_date, Chore.id, per_page=4, nullable=True)
+    seen = [c.name for page in pages for c in page]
+    assert len(seen) == 11 and len(set(seen)) == 11
+    assert seen[:3] == ["anytime 0", "anytime 1", "anytime 2"]
+
+    back = keyset_paginate(Chore.query, Chore.due_date, Chore.id, before=pages[1].prev_cursor,
+                           per_page=4, nullable=True)
+    assert [c.id for c in back] == [c.id for c in pages[0]]
+    assert back.prev_cursor is None
+
+
+def test_history_page_renders_cursor_links(client, household):
+    ronnie = household[0]
+    db.session.add_all([ChoreHistory(chore_name=f"chore {i}", user_id=ronnie.id) for i in range(4)])
+    db.session.commit()
+
+    resp = client.get("/chore-history?per_page=3")
+    assert resp.status_code == 200
+    assert b"after=" in resp.data
+    assert resp.data.count(b"card-title") == 3
@@ -0,0 +1,38 @@
+# tests/test_query_budget.py
+
+from datetime import date, timedelta
+
+import pytest
+
+from models import db, User, Chore, ChoreHistory
+from utils.db import count_queries
+
+# Max SQL statements per page, independent of how many rows are listed.
+PAGE_BUDGETS = {
+    "/": 3,                 # admin lookup, chores + assignees, user dropdown
+    "/completed": 1,        # chores + assignees
+    "/chore-history": 2,    # history + users, user filter dropdown
+}
+
+
+@pytest.fixture
+def busy_household(household):
+    users = list(household) + [User(name=f"Kid {i}", phone=f"+1555100{i:04d}") for i in range(12)]
+    db.session.add_all(users[3:])
+    db.session.flush()
+    for i in range(40):
+        assignee = users[i % len(users)]
+        db.session.add(Chore(name=f"chore {i}", assigned_to_id=assignee.id,
+                             due_date=date(2024, 1, 1) + timedelta(days=i), completed=i % 2 == 0))
+        db.session.add(ChoreHistory(chore_name=f"chore {i}", user_id=assignee.id))
+    db.session.commit()
+    db.session.expunge_all()
+    return users
+
+
+@pytest.mark.parametrize("path, budget", PAGE_BUDGETS.items())
+def test_listing_pages_stay_within_query_budget(client, busy_household, path, budget):
+    with count_queries() as queries:
+        resp = client.get(path)
+    assert resp.status_code == 200
+    assert queries.count <= budget, f"{path} ran {queries.count} queries:\n" + "\n".join(queries.statements)
@@ -0,0 +1,36 @@
+# tests/test_sms_done.py
+
+import pytest
+
+from models import db, Chore
+from routes import sms
+from utils.context.store import conversation_context
+
+
+@pytest.fixture
+def sms_client(app, monkeypatch):
+    # Only "done" is understood; anything else comes back unknown, like a bare chore name.
+    def parse(text, **kwargs):
+        return [("done", {})] if text.lower() == "done" else [("unknown", {})]
+
+    monkeypatch.setattr(sms, "parse_multiple_intents", parse)
+    monkeypatch.setattr(sms.random, "random", lambda: 1.0)  # no snark asides
+    app.register_blueprint(sms.sms_bp)
+    yield app.test_client()
+    conversation_context.clear("+15550000002")
+
+
+def test_done_then_chore_name_completes_it(sms_client, household):
+    _, erica, _ = household
+    chore = Chore(name="dishes", assigned_to_id=erica.id)
+    db.session.add(chore)
+    db.session.commit()
+
+    sms_client.post("/sms", data={"From": erica.phone, "Body": "done"})
+    assert conversation_context.get(erica.phone).last_intent == sms.WAITING_FOR_CHORE
+    assert not db.session.get(Chore, chore.id).completed
+
+    sms_client.post("/sms", data={"From": erica.phone, "Body": "Dishes!"})
+    db.session.expire_all()
+    assert db.session.get(Chore, chore.id).completed
+    assert conversation_context.get(erica.phone).last_intent == "done"
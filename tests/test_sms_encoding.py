@@ -0,0 +1,64 @@
+# tests/test_sms_encoding.py
+
+from utils.dusty.reply import Reply
+from utils.twilio.encoding import prepare_sms, segment_count, sms_stats, to_gsm7
+
+
+def test_segment_math():
+    assert segment_count("a" * 160) == ("GSM-7", 1)
+    assert segment_count("a" * 161) == ("GSM-7", 2)
+    assert segment_count("[" * 80) == ("GSM-7", 1)   # extended characters take two septets
+    assert segment_count("[" * 81) == ("GSM-7", 2)
+    assert segment_count("a" * 69 + "🤖") == ("UCS-2", 2)  # the emoji is two UTF-16 units
+    assert segment_count("é" * 160) == ("GSM-7", 1)   # in the GSM alphabet
+
+
+def test_gsm7_substitution():
+    text = to_gsm7("[Dusty 🤖] Dusty’s got “opinions” — 🔥 lots…")
+    assert text == "[Dusty] Dusty's got \"opinions\" - lots..."
+    assert segment_count(text)[0] == "GSM-7"
+    assert to_gsm7("Déjà vu, naïve") == "Déjà vu, naive"
+
+
+def test_trims_asides_to_budget():
+    core = "[Dusty 🤖] " + "x" * 120
+    reply = Reply(core).aside(" 💥" + "snark " * 10).aside(" 🎉 holiday!")
+    before = sms_stats()
+
+    assert prepare_sms(reply, gsm_safe=True, budget=1) == to_gsm7(core)
+    assert prepare_sms(reply, gsm_safe=True, budget=0) == to_gsm7(reply.text)  # no budget, no trimming
+
+    # The core message is never cut, even over budget.
+    long = Reply("y" * 400).aside(" extra")
+    assert prepare_sms(long, gsm_safe=True, budget=1) == "y" * 400
+
+    after = sms_stats()
+    assert after["messages"] - before["messages"] == 3
+    assert after["asides_trimmed"] - before["asides_trimmed"] == 3
+    assert after["segments_saved"] > before["segments_saved"]
+
+
+def test_assigned_notice_over_budget_loses_its_aside(household, monkeypatch):
+    from services import importer
+    from services.twilio_tools import outbox
+    from utils.dusty import dusty as dusty_module
+
+    monkeypatch.setattr(dusty_module.random, "random", lambda: 0.0)  # every aside fires
+    sent, replies = [], []
+    monkeypatch.setattr(outbox, "transport", lambda to, body: sent.append(body))
+    monkeypatch.setattr(outbox, "budget", 1)
+    real_response = importer.dusty_response
+
+    def render(*args, **kwargs):
+        replies.append(real_response(*args, **kwargs))
+        return replies[-1]
+
+    monkeypatch.setattr(importer, "dusty_response", render)
+
+    erica = household[1]
+    importer.notify_assignees({erica.id: ["dishes"]}, {"erica": erica})
+
+    reply = replies[0]
+    assert reply.optional and segment_count(to_gsm7(reply.text))[1] > 1
+    assert len(sent) == 1 and segment_count(sent[0])[1] == 1
+    assert to_gsm7(reply.optional[-1]).strip() not in sent[0]  # asides go newest first
@@ -0,0 +1,64 @@
+# tests/test_sqlprofile.py
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from models import db, Chore, User
+from routes.metrics import metrics_bp
+from utils.sqlprofile import SQLProfiler, init_sql_profiling, sql_profiler, statement_shape
+
+
+def test_statement_shape_folds_in_lists():
+    assert statement_shape("SELECT *\n  FROM chore WHERE id IN (?, ?,?)") == "SELECT * FROM chore WHERE id IN (?...)"
+
+
+def test_repeated_statements_are_flagged(app, client, household):
+    ronnie, erica, becky = household
+    for i in range(6):
+        db.session.add(Chore(name=f"chore {i}", assigned_to_id=(erica, becky)[i % 2].id))
+    db.session.commit()
+    db.session.expunge_all()
+
+    sql_profiler.reset()
+    app.config["SQL_REPEAT_THRESHOLD"] = 3
+    init_sql_profiling(app)
+    app.register_blueprint(metrics_bp)
+
+    @app.route("/_repeated")
+    def repeated():
+        # One query for the chores, then the same user lookup once per chore.
+        chores = Chore.query.all()
+        return ",".join(User.query.filter_by(id=chore.assigned_to_id).first().name for chore in chores)
+
+    @app.route("/_single")
+    def single():
+        return str(Chore.query.count())
+
+    try:
+        assert client.get("/_repeated").status_code == 200
+        assert client.get("/_single").status_code == 200
+        summary = client.get("/metrics/sql").get_json()
+    finally:
+        db.session.remove()
+        sql_profiler.repeat_threshold = 5
+
+    worst = summary["routes"][0]
+    assert worst["endpoint"] == "repeated" and worst["requests"] == 1
+    assert worst["avg_queries"] == 7 and worst["repeats"] == 1
+    single_route = next(r for r in summary["routes"] if r["endpoint"] == "single")
+    assert single_route["avg_queries"] == 1 and single_route["repeats"] == 0
+
+
+def test_failed_statements_leave_no_start_times(app):
+    profiler = SQLProfiler()
+    profiler.attach(db.engine)
+    try:
+        with db.engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM no_such_table"))
+            conn.execute(text("SELECT 1"))
+            assert conn.info.get("sql_profile_start") == []
+    finally:
+        profiler.detach(db.engine)
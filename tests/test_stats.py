@@ -0,0 +1,46 @@
+# tests/test_stats.py
+
+from datetime import datetime, timedelta
+
+from models import db, ChoreHistory, UserDailyStats, UserWeeklyStats
+from utils.stats import record_completion_rollups, backfill_rollups, leaderboard, week_start
+
+
+def _rollup_snapshot():
+    daily = {(r.user_id, r.day): r.completions for r in UserDailyStats.query.all()}
+    weekly = {(r.user_id, r.week_start): r.completions for r in UserWeeklyStats.query.all()}
+    return daily, weekly
+
+
+def test_backfill_matches_incremental_rollups(household):
+    ronnie, erica, _ = household
+    start = datetime(2024, 3, 1, 9, 0)
+    for i in range(30):
+        user = ronnie if i % 3 else erica
+        when = start + timedelta(hours=13 * i)
+        db.session.add(ChoreHistory(chore_name=f"chore {i}", user_id=user.id, completed_at=when))
+        record_completion_rollups(user.id, when)
+    db.session.commit()
+    incremental = _rollup_snapshot()
+
+    rows = backfill_rollups(batch_size=7)
+    assert rows == 30
+    assert _rollup_snapshot() == incremental
+    assert sum(incremental[1].values()) == 30
+
+
+def test_leaderboard_reads_current_week(client, household):
+    ronnie, erica, becky = household
+    today = datetime(2024, 6, 12).date()
+    for _ in range(3):
+        record_completion_rollups(erica.id, datetime(2024, 6, 11, 8))
+    record_completion_rollups(ronnie.id, datetime(2024, 6, 12, 8))
+    record_completion_rollups(becky.id, datetime(2024, 6, 3, 8))  # previous week
+    db.session.commit()
+
+    assert leaderboard("week", today=today) == [("Erica", 3), ("Ronnie", 1)]
+    assert leaderboard("day", today=today) == [("Ronnie", 1)]
+    assert week_start(today).weekday() == 0
+
+    resp = client.get("/leaderboard?window=week")
+    assert resp.status_code == 200
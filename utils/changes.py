@@ -0,0 +1,101 @@
+# utils/changes.py
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from utils.log import get_logger
+
+# -------------------------------
+# Committed Write Tracking
+# -------------------------------
+# Every flush records what it wrote on the session; once the transaction
+# commits, the batch is handed to the subscribers (data version, caches,
+# live updates). Rolled-back work is simply dropped. Set-based UPDATE/DELETE
+# statements bypass the unit of work, so their callers report them with note().
+
+PENDING_KEY = "pending_changes"
+
+log = get_logger("changes")
+
+_subscribers = []
+
+
+class Change:
+    __slots__ = ("model", "pk", "op", "changed", "old", "new")
+
+    def __init__(self, model: str, pk, op: str, changed=(), old=None, new=None):
+        self.model = model          # mapped class name, e.g. "Chore"
+        self.pk = pk                # primary key, or None when unknown
+        self.op = op                # "insert" | "update" | "delete"
+        self.changed = frozenset(changed)
+        self.old = old or {}        # previous values of changed columns, where known
+        self.new = new or {}        # current column values
+
+    def __repr__(self):
+        return f"<Change {self.op} {self.model}#{self.pk} {sorted(self.changed)}>"
+
+
+def subscribe(callback):
+    """Register callback(changes: list[Change]) to run after each commit that wrote something."""
+    if callback not in _subscribers:
+        _subscribers.append(callback)
+    return callback
+
+
+def note(session, model: str, pk=None, op: str = "update", changed=(), old=None, new=None):
+    """
+    Record a write made outside the unit of work (bulk UPDATE/DELETE).
+    `changed` defaults to the keys of `old`, then of `new`; pass it when
+    `new` carries extra context columns that did not change.
+    """
+    changed = set(changed) or set(old or ()) or set(new or ())
+    session.info.setdefault(PENDING_KEY, []).append(Change(model, pk, op, changed, old, new))
+
+
+def _columns(state):
+    """Loaded column values only; expired attributes are left out rather than reloaded."""
+    return {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+
+
+def _record(state, op):
+    pk = state.mapper.primary_key_from_instance(state.obj())
+    pk = pk[0] if len(pk) == 1 else tuple(pk)
+    if op == "update":
+        changed, old = [], {}
+        for attr in state.mapper.column_attrs:
+            history = state.attrs[attr.key].history
+            if history.has_changes():
+                changed.append(attr.key)
+                old[attr.key] = history.deleted[0] if history.deleted else None
+        if not changed:
+            return None
+        return Change(state.class_.__name__, pk, op, changed, old, _columns(state))
+    values = _columns(state)
+    return Change(state.class_.__name__, pk, op, values.keys(), new=values)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, _flush_context):
+    pending = session.info.setdefault(PENDING_KEY, [])
+    for objects, op in ((session.new, "insert"), (session.dirty, "update"), (session.deleted, "delete")):
+        for obj in objects:
+            change = _record(inspect(obj), op)
+            if change:
+                pending.append(change)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    changes = session.info.pop(PENDING_KEY, None)
+    if not changes:
+        return
+    for callback in list(_subscribers):
+        try:
+            callback(changes)
+        except Exception as e:
+            # The data is already committed; a broken subscriber must not fail the request.
+            log.exception("changes.subscriber_failed", extra={"fields": {"subscriber": callback.__name__}})
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(PENDING_KEY, None)
@@ -1,11 +1,19 @@
+import logging
 from datetime import datetime, timedelta
-from models import Chore, User, ChoreHistory, db
+from models import Chore, User, ChoreHistory, ChoreStats, db
+from sqlalchemy import case, delete, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import joinedload
+from utils.changes import note
+from utils.log import get_logger, log_event
+from utils.stats import record_completion_rollups
 
 # -------------------------------
 # Chore Utilities
 # -------------------------------
 
+log = get_logger("chores")
+
 def get_assigned_chores(user: User) -> list[Chore]:
     """Return list of incomplete chores assigned to user, ordered by due date."""
     return Chore.query.filter_by(assigned_to_id=user.id, completed=False).order_by(Chore.due_date).all()
@@ -34,9 +42,8 @@ def complete_chore_by_name(chore_name, user):
         Chore.name.ilike(f"%{chore_name.strip()}%"),
         Chore.completed == False
     ).first()
-    if chore:
-        chore.completed = True
-        chore.completed_at = datetime.utcnow()
+    if chore and mark_chore_completed(chore.id):
+        record_completion(user, chore.name, datetime.utcnow())
         db.session.commit()
         return chore
     return None
@@ -58,7 +65,7 @@ def list_user_chores(user, limit=5):
     chores = Chore.query.filter_by(assigned_to_id=user.id, completed=False)\
                 .order_by(Chore.due_date.asc().nullslast())\
                 .limit(limit).all()
-    print(f"[DEBUG] Inside list_user_chores: Found {chores}")
+    log_event(log, "chores.listed", logging.DEBUG, user_id=user.id, count=len(chores))
     return chores
 
 def get_due_chores_message(session) -> str:
@@ -83,3 +90,135 @@ def get_due_chores_message(session) -> str:
         lines.append(f"- {chore.description} (assigned to {name}, due {due_str})")
 
     return "\n".join(lines)
+
+
+# -------------------------------
+# Bulk Chore Actions
+# -------------------------------
+# Each helper is one set-based UPDATE/DELETE; the caller commits. Those
+# statements skip the ORM flush, so each one reports what it touched to
+# utils.changes for the post-commit subscribers.
+
+def _current(chore_ids, *where):
+    """(id, name, assigned_to_id) of the chores a bulk statement is about to touch."""
+    return db.session.query(Chore.id, Chore.name, Chore.assigned_to_id).filter(Chore.id.in_(chore_ids), *where).all()
+
+
+def bulk_unassign(chore_ids) -> int:
+    rows = _current(chore_ids, Chore.assigned_to_id.isnot(None))
+    result = db.session.execute(
+        update(Chore)
+        .where(Chore.id.in_(chore_ids), Chore.assigned_to_id.isnot(None))
+        .values(assigned_to_id=None)
+        .execution_options(synchronize_session="fetch")
+    )
+    for chore_id, name, old_assignee in rows:
+        note(db.session, "Chore", chore_id, old={"assigned_to_id": old_assignee},
+             new={"name": name, "assigned_to_id": None})
+    return result.rowcount
+
+
+def bulk_delete(chore_ids) -> int:
+    rows = _current(chore_ids)
+    result = db.session.execute(
+        delete(Chore).where(Chore.id.in_(chore_ids)).execution_options(synchronize_session="fetch")
+    )
+    for chore_id, name, assignee in rows:
+        note(db.session, "Chore", chore_id, "delete", new={"name": name, "assigned_to_id": assignee})
+    return result.rowcount
+
+
+def bulk_snooze(chore_ids) -> int:
+    """Push due dates back a week for weekly chores, a day for everything else."""
+    step = case((Chore.recurrence == "weekly", "+7 days"), else_="+1 day")
+    result = db.session.execute(
+        update(Chore)
+        .where(Chore.id.in_(chore_ids), Chore.due_date.isnot(None))
+        .values(due_date=func.date(Chore.due_date, step))
+        .returning(Chore.id, Chore.name, Chore.assigned_to_id, Chore.due_date)
+        .execution_options(synchronize_session="fetch")
+    )
+    rows = result.all()
+    for chore_id, name, assignee, due_date in rows:
+        note(db.session, "Chore", chore_id, new={"name": name, "assigned_to_id": assignee, "due_date": due_date},
+             changed=("due_date",))
+    return len(rows)
+
+
+def bulk_reassign(chore_ids, user_id) -> list[str]:
+    """Reassign chores to one user; returns the names of chores that actually moved."""
+    moving = (Chore.assigned_to_id.is_distinct_from(user_id),)
+    rows = _current(chore_ids, *moving)
+    if rows:
+        db.session.execute(
+            update(Chore).where(Chore.id.in_(chore_ids), *moving).values(assigned_to_id=user_id)
+            .execution_options(synchronize_session="fetch")
+        )
+    for chore_id, name, old_assignee in rows:
+        note(db.session, "Chore", chore_id, old={"assigned_to_id": old_assignee},
+             new={"name": name, "assigned_to_id": user_id})
+    return [name for _, name, _ in rows]
+
+
+# -------------------------------
+# Atomic State Transitions
+# -------------------------------
+# Claiming and completing are single conditional UPDATEs. Whichever request
+# matches the WHERE clause first wins; anyone racing it (a second worker, a
+# Twilio retry, a dashboard click) matches no row and gets None back.
+
+def claim_chore(chore_id, user_id):
+    """Assign a chore only if it is still unassigned; returns its name, or None if we lost."""
+    name = db.session.execute(
+        update(Chore)
+        .where(Chore.id == chore_id, Chore.assigned_to_id.is_(None))
+        .values(assigned_to_id=user_id)
+        .returning(Chore.name)
+        .execution_options(synchronize_session="fetch")
+    ).scalar()
+    if name is not None:
+        note(db.session, "Chore", chore_id, old={"assigned_to_id": None},
+             new={"name": name, "assigned_to_id": user_id})
+    return name
+
+
+def mark_chore_completed(chore_id):
+    """Complete a chore only if it is still open; returns (name, assigned_to_id), or None if we lost."""
+    row = db.session.execute(
+        update(Chore)
+        .where(Chore.id == chore_id, Chore.completed.is_(False))
+        .values(completed=True)
+        .returning(Chore.name, Chore.assigned_to_id)
+        .execution_options(synchronize_session="fetch")
+    ).first()
+    if row is None:
+        return None
+    note(db.session, "Chore", chore_id, old={"completed": False},
+         new={"name": row.name, "assigned_to_id": row.assigned_to_id, "completed": True})
+    return row.name, row.assigned_to_id
+
+
+def record_completion(user, chore_name, completed_at):
+    """
+    Credit a completion to `user`: ChoreStats, history, rollups and the
+    user's counters. Counters are bumped in SQL, so concurrent completions
+    don't overwrite each other. Runs in the caller's transaction.
+    """
+    stmt = sqlite_insert(ChoreStats).values(user_id=user.id, chore_name=chore_name, times_completed=1)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id", "chore_name"],
+        set_={"times_completed": ChoreStats.times_completed + 1},
+    ))
+    db.session.add(ChoreHistory(chore_name=chore_name, user_id=user.id, completed=True, completed_at=completed_at))
+    record_completion_rollups(user.id, completed_at)
+
+    user.total_chores_completed = User.total_chores_completed + 1
+    favorite = (
+        db.session.query(ChoreStats.chore_name)
+        .filter(ChoreStats.user_id == user.id)
+        .order_by(ChoreStats.times_completed.desc())
+        .limit(1)
+        .scalar()
+    )
+    if favorite:
+        user.favorite_chore = favorite
@@ -0,0 +1,158 @@
+# utils/context/backends.py
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from utils.context.tracker import ContextTracker
+
+# -------------------------------
+# Conversation Context Backends
+# -------------------------------
+# A backend stores ContextTracker records by phone with a TTL, and offers
+# load / save / delete / sweep / len / stats. Every operation touches one
+# key. MemoryBackend is per process; SQLiteBackend is a small file that all
+# workers on a host open, so a follow-up that lands on another worker
+# still finds the conversation.
+
+
+class MemoryBackend:
+    """Bounded in-process LRU; expired entries go on read or sweep."""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # phone -> (ContextTracker, expires_at)
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def load(self, phone) -> ContextTracker | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(phone)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[phone]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(phone)
+            return entry[0]
+
+    def save(self, phone, context: ContextTracker):
+        with self._lock:
+            self._entries[phone] = (context, time.time() + self.ttl)
+            self._entries.move_to_end(phone)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, phone):
+        with self._lock:
+            self._entries.pop(phone, None)
+
+    def sweep(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [phone for phone, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for phone in expired:
+                del self._entries[phone]
+            self.expirations += len(expired)
+        return len(expired)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class SQLiteBackend:
+    """
+    One row per phone (primary-key lookups) in a WAL-mode SQLite file, with
+    the record as JSON. Each thread keeps its own connection. The sweep also
+    trims the oldest rows beyond max_entries.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS conversation_context ("
+        " phone TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_conversation_context_expires_at ON conversation_context (expires_at)",
+    )
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: float = 300.0, busy_timeout_ms: int = 5000):
+        self.path = os.path.abspath(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        with self._connect() as conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, phone) -> ContextTracker | None:
+        row = self._connect().execute(
+            "SELECT data FROM conversation_context WHERE phone = ? AND expires_at > ?",
+            (phone, time.time()),
+        ).fetchone()
+        return ContextTracker.from_json(row[0]) if row else None
+
+    def save(self, phone, context: ContextTracker):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO conversation_context (phone, data, expires_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(phone) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at",
+                (phone, context.to_json(), time.time() + self.ttl),
+            )
+
+    def delete(self, phone):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM conversation_context WHERE phone = ?", (phone,))
+
+    def sweep(self) -> int:
+        with self._connect() as conn:
+            removed = conn.execute(
+                "DELETE FROM conversation_context WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            removed += conn.execute(
+                "DELETE FROM conversation_context WHERE phone IN ("
+                " SELECT phone FROM conversation_context ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        return removed
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM conversation_context").fetchone()[0]
+
+    def stats(self) -> dict:
+        return {"backend": "sqlite", "path": self.path, "entries": len(self), "max_entries": self.max_entries}
+
+
+def backend_from_config(config):
+    """CONTEXT_BACKEND picks "sqlite" (default, at CONTEXT_DB_PATH) or "memory"."""
+    kind = config.get("CONTEXT_BACKEND", "sqlite")
+    max_entries = config.get("CONTEXT_MAX_ENTRIES", 10000)
+    ttl = config.get("CONTEXT_TTL_SECONDS", 300)
+    if kind == "sqlite":
+        return SQLiteBackend(config.get("CONTEXT_DB_PATH", "conversation_context.db"), max_entries=max_entries, ttl=ttl,
+                             busy_timeout_ms=config.get("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    if kind != "memory":
+        raise ValueError(f"Unknown CONTEXT_BACKEND: {kind!r}")
+    return MemoryBackend(max_entries=max_entries, ttl=ttl)
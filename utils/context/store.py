@@ -1,5 +1,13 @@
 
 # utils/context/store.py
-from utils.context.context_utils import ContextTracker
+from utils.context.tracker import ConversationContext
+from utils.context.backends import backend_from_config
 
-conversation_context = {}  # user.name -> ContextTracker()
+# The one conversation store: phone -> ContextTracker, expiring. In-memory
+# until init_context() picks the configured backend.
+conversation_context = ConversationContext()
+
+
+def init_context(app):
+    conversation_context.use(backend_from_config(app.config))
+    conversation_context.start_sweeper(app.config.get("CONTEXT_SWEEP_SECONDS", 60))
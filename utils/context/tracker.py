@@ -1,40 +1,30 @@
-from datetime import datetime, timedelta
-from collections import defaultdict
+# utils/context/tracker.py
 
-class ConversationContext:
-    def __init__(self):
-        # In-memory context store: phone -> context dict
-        self.store = defaultdict(dict)
-        self.timeout = timedelta(minutes=5)  # Context expires after 5 minutes
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime
+from utils.log import get_logger, log_event
 
-    def get(self, phone):
-        context = self.store.get(phone)
-        if context and datetime.utcnow() - context.get("timestamp", datetime.utcnow()) < self.timeout:
-            return context
-        return None
-
-    def set(self, phone, intent, entities):
-        self.store[phone] = {
-            "intent": intent,
-            "entities": entities,
-            "timestamp": datetime.utcnow()
-        }
-
-    def clear(self, phone):
-        if phone in self.store:
-            del self.store[phone]
+log = get_logger("context")
 
 
 class ContextTracker:
+    """What the last message in a conversation was about. Slotted: one per active phone."""
+    __slots__ = ("last_intent", "last_chore", "last_assignee", "last_due_date", "last_entities", "last_updated")
+
     def __init__(self):
         self.last_intent = None
         self.last_chore = None
         self.last_assignee = None
         self.last_due_date = None
+        self.last_entities = {}
         self.last_updated = datetime.now()
 
     def update(self, intent: str, entities: dict):
         self.last_intent = intent
+        self.last_entities = dict(entities)
         self.last_updated = datetime.now()
         if "chore" in entities:
             self.last_chore = entities["chore"]
@@ -49,4 +39,114 @@ class ContextTracker:
             "chore": self.last_chore,
             "assignee": self.last_assignee,
             "due": self.last_due_date
-        }
\ No newline at end of file
+        }
+
+    # ---- Serialization (for shared backends) ----
+
+    def to_json(self) -> str:
+        return json.dumps({slot: getattr(self, slot) for slot in self.__slots__}, default=_encode)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ContextTracker":
+        context = cls()
+        for slot, value in json.loads(raw, object_hook=_decode).items():
+            if slot in cls.__slots__:
+                setattr(context, slot, value)
+        return context
+
+
+def _encode(value):
+    # Parsed due dates are datetimes (sometimes dates); everything else is plain JSON.
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Can't store {type(value).__name__} in conversation context")
+
+
+def _decode(obj):
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    if "__date__" in obj:
+        return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+# -------------------------------
+# Conversation Store
+# -------------------------------
+# phone -> ContextTracker, expiring ttl seconds after the last write. Where
+# the records live is up to the backend (utils/context/backends.py): a
+# bounded in-process LRU, or a SQLite file every worker on the host shares.
+# A periodic sweep drops expired entries so storage follows the number of
+# *active* conversations rather than every number that ever texted.
+
+class ConversationContext:
+    def __init__(self, backend=None, max_entries: int = 10000, ttl: float = 300.0):
+        if backend is None:
+            from utils.context.backends import MemoryBackend
+            backend = MemoryBackend(max_entries=max_entries, ttl=ttl)
+        self.backend = backend
+        self._sweeper = None
+
+    def use(self, backend):
+        """Swap the backend (at startup); contexts in the old one are dropped."""
+        self.backend = backend
+
+    def get(self, phone) -> ContextTracker | None:
+        """The live context for phone, or None."""
+        return self.backend.load(phone)
+
+    def get_or_create(self, phone) -> ContextTracker:
+        return self.get(phone) or ContextTracker()
+
+    def put(self, phone, context: ContextTracker):
+        """Store (or re-store) a context; its TTL restarts."""
+        self.backend.save(phone, context)
+
+    def set(self, phone, intent, entities):
+        context = self.get_or_create(phone)
+        context.update(intent, entities)
+        self.put(phone, context)
+
+    def clear(self, phone):
+        self.backend.delete(phone)
+
+    def get_last_chore(self, phone) -> str | None:
+        context = self.get(phone)
+        return context.last_chore if context else None
+
+    def set_last_intent(self, phone, intent):
+        context = self.get_or_create(phone)
+        context.last_intent = intent
+        context.last_updated = datetime.now()
+        self.put(phone, context)
+
+    def sweep(self) -> int:
+        """Drop every expired entry; returns how many went."""
+        return self.backend.sweep()
+
+    def start_sweeper(self, interval: float = 60.0):
+        """Sweep on a daemon thread every `interval` seconds (once per store)."""
+        if self._sweeper is not None or interval <= 0:
+            return
+
+        def run():
+            while True:
+                time.sleep(interval)
+                try:
+                    removed = self.sweep()
+                except Exception as e:
+                    log_event(log, "context.sweep_failed", logging.ERROR, error=str(e))
+                    continue
+                if removed:
+                    log_event(log, "context.swept", removed=removed)
+
+        self._sweeper = threading.Thread(target=run, name="context-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def __len__(self):
+        return len(self.backend)
+
+    def stats(self) -> dict:
+        return self.backend.stats()
@@ -0,0 +1,116 @@
+# utils/db.py
+
+import os
+from sqlalchemy import event
+from models import db
+
+# -------------------------------
+# SQLite Engine Tuning
+# -------------------------------
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -20000,       # negative = size in KiB
+    "mmap_size": 128 * 1024 * 1024,
+}
+
+
+def sqlite_pragmas_from_config(config) -> dict:
+    """Build the PRAGMA set for new SQLite connections from a Flask config."""
+    return {
+        "journal_mode": config.get("SQLITE_JOURNAL_MODE", DEFAULT_PRAGMAS["journal_mode"]),
+        "synchronous": config.get("SQLITE_SYNCHRONOUS", DEFAULT_PRAGMAS["synchronous"]),
+        "busy_timeout": config.get("SQLITE_BUSY_TIMEOUT_MS", DEFAULT_PRAGMAS["busy_timeout"]),
+        "cache_size": -abs(config.get("SQLITE_CACHE_SIZE_KB", -DEFAULT_PRAGMAS["cache_size"])),
+        "mmap_size": config.get("SQLITE_MMAP_SIZE", DEFAULT_PRAGMAS["mmap_size"]),
+    }
+
+
+def apply_sqlite_pragmas(engine, pragmas: dict):
+    """Run the given PRAGMAs on every new DBAPI connection of a SQLite engine."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        try:
+            for key, value in pragmas.items():
+                cursor.execute(f"PRAGMA {key}={value}")
+        finally:
+            cursor.close()
+
+
+def attach_sqlite_database(engine, path: str, alias: str):
+    """ATTACH another SQLite file under `alias` on every new connection."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _attach(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        try:
+            cursor.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+        finally:
+            cursor.close()
+
+
+def engine_options_from_config(config) -> dict:
+    """Pool settings for file-backed databases; in-memory SQLite uses its own pool."""
+    uri = config.get("SQLALCHEMY_DATABASE_URI", "")
+    if uri in ("sqlite://", "sqlite:///:memory:"):
+        return {}
+    return {
+        "pool_size": config.get("DB_POOL_SIZE", 5),
+        "pool_timeout": config.get("DB_POOL_TIMEOUT", 30),
+    }
+
+
+def init_db(app):
+    """Bind the SQLAlchemy extension to the app and tune its SQLite engine."""
+    options = engine_options_from_config(app.config)
+    options.update(app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}))
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+    db.init_app(app)
+    with app.app_context():
+        apply_sqlite_pragmas(db.engine, sqlite_pragmas_from_config(app.config))
+        archive_path = app.config.get("HISTORY_ARCHIVE_PATH")
+        if archive_path:
+            if archive_path != ":memory:" and not os.path.isabs(archive_path):
+                os.makedirs(app.instance_path, exist_ok=True)
+                archive_path = os.path.join(app.instance_path, archive_path)
+            attach_sqlite_database(db.engine, archive_path, "archive")
+
+
+# -------------------------------
+# Query Counting
+# -------------------------------
+
+class QueryCounter:
+    """Collects every SQL statement an engine executes while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        return False
+
+
+def count_queries(engine=None) -> QueryCounter:
+    """`with count_queries() as q: ...` then inspect `q.count` / `q.statements`."""
+    return QueryCounter(engine or db.engine)
@@ -1 +1,2 @@
-from .dusty import dusty_response , memory_based_commentary
\ No newline at end of file
+from .dusty import dusty_response , memory_based_commentary
+from .reply import Reply, UserUpdate, apply_replies
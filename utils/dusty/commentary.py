@@ -1,7 +1,9 @@
 import random
 from datetime import datetime, timedelta
+from .reply import Reply
 
-def generate_commentary(context, user, intent, entities):
+def generate_commentary(context, user, intent, entities) -> Reply:
+    """Pick a contextual aside. Reads the conversation context and user; changes neither."""
     comments = []
 
     chore = entities.get("chore")
@@ -43,4 +45,4 @@ def generate_commentary(context, user, intent, entities):
             "Dusty is adding that to your permanent record.",
         ]))
 
-    return random.choice(comments)
\ No newline at end of file
+    return Reply(random.choice(comments))
@@ -1,19 +1,17 @@
-import yaml
 import os
 import random
 from datetime import datetime
-from models import  User, db
+from .templates import DustyTemplates
+from .reply import Reply, UserUpdate
 
 
 # Path assumes dusty.py is in the same dir as dusty_responses.yaml
 RESPONSES_PATH = os.path.join(os.path.dirname(__file__), "data", "dusty_responses.yaml")
 
-with open(RESPONSES_PATH, "r") as f:
-    dusty_config = yaml.safe_load(f)
+# Compiled once, reloaded when the YAML changes (see templates.py)
+templates = DustyTemplates(RESPONSES_PATH)
 
-DUSTY_RESPONSES = dusty_config["DUSTY_RESPONSES"]
-DUSTY_SNARK = dusty_config["DUSTY_SNARK"]
-HOLIDAY_SNARK = dusty_config["HOLIDAY_SNARK"]
+FORMAT_DEFAULTS = {"name": "there", "chore": "something unpleasant", "due": "someday"}
 
 
 # -------------------------------
@@ -24,87 +22,45 @@ def seasonal_greeting() -> str | None:
     """Return a holiday snark message if today is a recognized holiday."""
     today = datetime.utcnow()
     md = today.strftime("%m-%d")
-    return HOLIDAY_SNARK.get(md)
-
-
-
-
-def dusty_response(template_key_or_text, include_seasonal=True, **kwargs) -> str:
-        """Generate a Dusty-style response with personality, memory, fatigue-based snark, and now per-user tone."""
-        user = kwargs.get("user")
-        tone = kwargs.get("tone", "default")
-
-        if user and hasattr(user, "tone_preference"):
-            tone = user.tone_preference or "default"
-
-        if tone == "random":
-            tone = random.choice(["default", "gentle", "sarcastic"])
-
-        # Select base message
-        if template_key_or_text in DUSTY_RESPONSES:
-            responses = DUSTY_RESPONSES[template_key_or_text]
-            if isinstance(responses, dict):
-                message = random.choice(responses.get(tone, responses.get("default", ["..."])))
-            elif isinstance(responses, list):
-                message = random.choice(responses)
-            else:
-                message = str(responses)
-            print(f"[DEBUG] Selected Dusty template: {message}")
-        else:
-            message = template_key_or_text  # literal message
-
-        # Format safely
-        safe_kwargs = {
-            "name": kwargs.get("name", "there"),
-            "chore": kwargs.get("chore", "something unpleasant"),
-            "due": kwargs.get("due", "someday"),
-            **kwargs,
-        }
-        try:
-            formatted = message.format(**safe_kwargs)
-        except KeyError as e:
-            print(f"[WARNING] Missing format key in Dusty response: {e}")
-            formatted = message
-
-
-    # """Generate a Dusty-style response from a category key or literal string, with memory-aware sarcasm."""
-    # print(f"[DEBUG] Dusty called with: {template_key_or_text}")
-
-    # if template_key_or_text in DUSTY_RESPONSES:
-    #     print("[DEBUG] Using category response")
-    #     message = random.choice(DUSTY_RESPONSES[template_key_or_text])
-    #     print(f"[DEBUG] Selected Dusty template: {message}")
-    # else:
-    #     message = template_key_or_text
-
-    # # Safe formatting vars
-    # safe_kwargs = {
-    #     "name": kwargs.get("name", "there"),
-    #     "chore": kwargs.get("chore", "something unpleasant"),
-    #     "due": kwargs.get("due", "someday"),
-    #     **kwargs,
-    # }
-
-    # try:
-    #     formatted = message.format(**safe_kwargs)
-    # except KeyError as e:
-    #     print(f"[WARNING] Missing format key in Dusty response: {e}")
-    #     formatted = message  # fallback
+    return templates.holiday(md)
+
+
+
+
+def dusty_response(template_key_or_text, include_seasonal=True, **kwargs) -> Reply:
+    """
+    Generate a Dusty-style response with personality, memory, fatigue-based
+    snark and per-user tone. Nothing is written: the returned Reply carries
+    the text and the user-state changes the caller applies in its own transaction.
+    """
+    user = kwargs.get("user")
+    tone = kwargs.get("tone", "default")
+
+    if user and hasattr(user, "tone_preference"):
+        tone = user.tone_preference or "default"
+
+    if tone == "random":
+        tone = random.choice(["default", "gentle", "sarcastic"])
+
+    # Select and render the base message (a YAML key, or literal text)
+    formatted = templates.render(template_key_or_text, tone, kwargs, FORMAT_DEFAULTS)
+    updates = []
+    asides = []
+    now = datetime.utcnow()
 
     # --- Memory-based sass injection ---
-        user = kwargs.get("user")
-        if user:
+    if user:
         # Sarcasm from fatigue
-            if getattr(user, "fatigue_level", 0) > 5:
-                formatted += " You alright? You look one chore away from collapse."
+        if (getattr(user, "fatigue_level", 0) or 0) > 5:
+            asides.append(" You alright? You look one chore away from collapse.")
 
         # Roast chore obsession
-            if getattr(user, "favorite_chore", None) and getattr(user, "total_chores_completed", 0) > 10:
-                formatted += f" Also, what's with your {user.favorite_chore} obsession?"
+        if getattr(user, "favorite_chore", None) and (getattr(user, "total_chores_completed", 0) or 0) > 10:
+            asides.append(f" Also, what's with your {user.favorite_chore} obsession?")
 
         # Random roast, max once every 12h
         if random.random() < 0.15 and (
-            not user.last_roast or (datetime.utcnow() - user.last_roast).total_seconds() > 43200
+            not user.last_roast or (now - user.last_roast).total_seconds() > 43200
         ):
             burn = random.choice([
                 "Even a Roomba has more initiative.",
@@ -112,40 +68,40 @@ def dusty_response(template_key_or_text, include_seasonal=True, **kwargs) -> str
                 "If procrastination were a sport, you'd be on the podium.",
             ])
             formatted += f"\n🔥 {burn}"
-            user.last_roast = datetime.utcnow()
-            db.session.commit()
+            updates.append(UserUpdate(user, "last_roast", now))
 
         # Timing-based wit
         if user.last_seen:
-            minutes_ago = (datetime.utcnow() - user.last_seen).total_seconds() / 60
+            minutes_ago = (now - user.last_seen).total_seconds() / 60
             if minutes_ago < 5 and random.random() < 0.5:
-                formatted += f" (Back already? We just talked {int(minutes_ago)} minutes ago.)"
+                asides.append(f" (Back already? We just talked {int(minutes_ago)} minutes ago.)")
             if user.last_intent == template_key_or_text and random.random() < 0.5:
-                formatted += " Déjà vu much?"
-
-        # Seasonal greetings
-        if include_seasonal:
-            holiday = seasonal_greeting()
-        if holiday and random.random() < 0.5:
-            formatted += f" 🎉 {holiday}"
-
-        # Random snark
-        if random.random() < 0.15:
-            formatted += f" 💥{random.choice(DUSTY_SNARK)}"
-
-
-        # Fatigue sass (20% chance)
-        if "user" in kwargs and isinstance(kwargs["user"], User):
-            user = kwargs["user"]
-    
-        if user.fatigue_level and user.fatigue_level >= 7 and random.random() < 0.2:
-            formatted += f" (Dusty’s noticing a fatigue level of {user.fatigue_level}/10. Pace yourself, overachiever.)"
-
-        return f"[Dusty 🤖] {formatted}"
-
-def memory_based_commentary(user, intent):
+                asides.append(" Déjà vu much?")
+
+    # Seasonal greetings
+    holiday = seasonal_greeting() if include_seasonal else None
+    if holiday and random.random() < 0.5:
+        asides.append(f" 🎉 {holiday}")
+
+    # Random snark
+    if random.random() < 0.15:
+        snark = templates.snark()
+        if snark:
+            asides.append(f" 💥{snark}")
+
+    # Fatigue sass (20% chance)
+    if user and user.fatigue_level and user.fatigue_level >= 7 and random.random() < 0.2:
+        asides.append(f" (Dusty’s noticing a fatigue level of {user.fatigue_level}/10. Pace yourself, overachiever.)")
+
+    # The roast is the point; the other asides can be trimmed to save SMS segments.
+    reply = Reply(f"[Dusty 🤖] {formatted}", updates)
+    for piece in asides:
+        reply.aside(piece)
+    return reply
+
+def memory_based_commentary(user, intent) -> Reply:
     if not user:
-        return ""
+        return Reply("")
 
     now = datetime.utcnow()
     minutes_ago = (now - user.last_seen).total_seconds() / 60 if user.last_seen else None
@@ -153,7 +109,7 @@ def memory_based_commentary(user, intent):
     comments = []
 
     # Roast if only adding chores
-    if intent == "add" and user.total_chores_assigned > 10 and random.random() < 0.3:
+    if intent == "add" and (user.total_chores_assigned or 0) > 10 and random.random() < 0.3:
         comments.append("Assigning chores again? Someone’s clearly discovered the joy of management.")
     
     # Repeat intent
@@ -165,22 +121,22 @@ def memory_based_commentary(user, intent):
         comments.append(f"(Back already? We just talked {int(minutes_ago)} minutes ago.)")
 
     # List spamming
-    if intent == "list" and user.last_unassigned_seen >= 5  and random.random() < 0.3:
+    if intent == "list" and (user.last_unassigned_seen or 0) >= 5 and random.random() < 0.3:
         comments.append("Five or more unassigned chores? is everyone on strike?")
 
-        # Fatigue-based snark
-    if user.fatigue_level >= 8 and random.random() < 0.5:
+    # Fatigue-based snark
+    if (user.fatigue_level or 0) >= 8 and random.random() < 0.5:
         fatigue_comments = [
             "You're really out here trying to impress someone, huh?",
             "Slow down, this isn’t a productivity cult.",
             "Ever heard of rest? It's free.",
             "Dusty’s concerned. And Dusty doesn’t do emotions.",
         ]
-        comment += " " + random.choice(fatigue_comments)
+        comments.append(random.choice(fatigue_comments))
     elif user.fatigue_level == 0 and intent == "done" and random.random() < 0.3:
-        comments.append (" Well look at you. One chore and already back to couch mode?")
+        comments.append(" Well look at you. One chore and already back to couch mode?")
 
     if comments:
-        return random.choice(comments).strip()
+        return Reply(random.choice(comments).strip())
     
-    return " "
\ No newline at end of file
+    return Reply(" ")
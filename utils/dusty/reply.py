@@ -0,0 +1,86 @@
+# utils/dusty/reply.py
+
+# -------------------------------
+# Rendered Replies
+# -------------------------------
+# Rendering never touches the database. Anything a reply implies about the
+# user (last roast, last intent, list counter...) comes back as UserUpdate
+# entries next to the text, and the caller applies them inside the
+# transaction it was going to commit anyway.
+
+
+class UserUpdate:
+    __slots__ = ("user", "field", "value", "increment")
+
+    def __init__(self, user, field: str, value, increment: bool = False):
+        self.user = user
+        self.field = field
+        self.value = value
+        self.increment = increment   # add value to the current number instead of setting it
+
+    def apply(self):
+        if self.increment:
+            setattr(self.user, self.field, (getattr(self.user, self.field) or 0) + self.value)
+        else:
+            setattr(self.user, self.field, self.value)
+
+    def __repr__(self):
+        op = "+=" if self.increment else "="
+        return f"<UserUpdate {getattr(self.user, 'name', self.user)}.{self.field} {op} {self.value!r}>"
+
+
+class Reply:
+    """
+    Text plus the user-state changes it implies. `+` joins text and keeps
+    every update. Asides (snark, commentary) are also remembered in
+    `optional`, so they can be trimmed when an SMS runs long.
+    """
+    __slots__ = ("text", "updates", "optional")
+
+    def __init__(self, text: str = "", updates=(), optional=()):
+        self.text = text
+        self.updates = list(updates)
+        self.optional = list(optional)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"<Reply {self.text!r} updates={self.updates}>"
+
+    def __add__(self, other):
+        if isinstance(other, Reply):
+            return Reply(self.text + other.text, self.updates + other.updates, self.optional + other.optional)
+        return Reply(self.text + other, self.updates, self.optional)
+
+    def __radd__(self, other):
+        return Reply(other + self.text, self.updates, self.optional)
+
+    def aside(self, piece: str) -> "Reply":
+        """Append text that may be dropped later to save SMS segments."""
+        self.text += piece
+        self.optional.append(piece)
+        return self
+
+    def without_last_aside(self) -> "Reply":
+        """A copy with the most recently added aside cut out of the text."""
+        if not self.optional:
+            return self
+        piece = self.optional[-1]
+        head, found, tail = self.text.rpartition(piece)
+        text = head + tail if found else self.text
+        return Reply(text, self.updates, self.optional[:-1])
+
+    def apply(self) -> bool:
+        """Write the updates onto the (session-bound) users; returns whether there were any."""
+        for update in self.updates:
+            update.apply()
+        return bool(self.updates)
+
+
+def apply_replies(replies) -> bool:
+    """Apply every reply's updates; True if the caller has something to commit."""
+    changed = False
+    for reply in replies:
+        changed = reply.apply() or changed
+    return changed
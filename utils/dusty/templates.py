@@ -0,0 +1,185 @@
+# utils/dusty/templates.py
+
+import logging
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from string import Formatter
+import yaml
+from utils.log import get_logger, log_event
+
+# -------------------------------
+# Precompiled Dusty Templates
+# -------------------------------
+# dusty_responses.yaml is parsed once into per-key, per-tone tuples of
+# CompiledTemplate. Each template is split into literal text and fields up
+# front, so rendering is a join over the pieces with no str.format parsing
+# and no kwargs copying. The file is re-checked at most every
+# CHECK_INTERVAL seconds and, when its mtime moves, rebuilt and swapped in
+# as a whole; a broken edit keeps the previous set.
+
+CHECK_INTERVAL = 2.0
+log = get_logger("dusty")
+TONES = ("default", "gentle", "sarcastic")
+
+_formatter = Formatter()
+
+
+class CompiledTemplate:
+    __slots__ = ("text", "parts", "fields", "simple")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = []     # (literal, field, conversion, spec)
+        fields = set()
+        simple = True
+        try:
+            for literal, field, spec, conversion in _formatter.parse(text):
+                if field is not None:
+                    if not field.isidentifier():
+                        simple = False  # "{0}", "{user.name}", "{x[0]}": leave to str.format
+                    fields.add(field)
+                self.parts.append((literal, field, conversion, spec))
+        except ValueError:
+            # Unbalanced braces: the text is shown as-is, like before.
+            self.parts = [(text, None, None, None)]
+            fields = set()
+        self.fields = frozenset(fields)
+        self.simple = simple
+
+    def render(self, values: dict, defaults: dict = {}) -> str:
+        """
+        Fill the fields from `values`, then `defaults`; any field missing from
+        both leaves the raw text, as str.format's KeyError did.
+        """
+        if not self.fields:
+            return self.parts[0][0] if len(self.parts) == 1 else "".join(p[0] for p in self.parts)
+        if not self.simple:
+            try:
+                return self.text.format(**{**defaults, **values})
+            except (KeyError, IndexError, AttributeError):
+                return self.text
+        out = []
+        for literal, field, conversion, spec in self.parts:
+            out.append(literal)
+            if field is None:
+                continue
+            if field in values:
+                value = values[field]
+            elif field in defaults:
+                value = defaults[field]
+            else:
+                log_event(log, "dusty.missing_key", logging.WARNING, field=field)
+                return self.text
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            out.append(format(value, spec) if spec else str(value))
+        return "".join(out)
+
+
+@lru_cache(maxsize=512)
+def compile_literal(text: str) -> CompiledTemplate:
+    """Literal (non-key) messages are compiled on first use and memoized."""
+    return CompiledTemplate(text)
+
+
+def _compile_entry(entry):
+    """A YAML entry becomes {tone: (CompiledTemplate, ...)}; untoned lists serve every tone."""
+    if isinstance(entry, dict):
+        table = {tone: tuple(CompiledTemplate(str(t)) for t in (texts or [])) for tone, texts in entry.items()}
+        default = table.get("default") or (CompiledTemplate("..."),)
+        for tone in TONES:
+            table.setdefault(tone, default)
+        return table
+    texts = entry if isinstance(entry, list) else [entry]
+    compiled = tuple(CompiledTemplate(str(t)) for t in texts if t is not None) or (CompiledTemplate("..."),)
+    return {tone: compiled for tone in TONES}
+
+
+class TemplateSet:
+    """One immutable load of the YAML file."""
+    __slots__ = ("responses", "snark", "holidays", "mtime")
+
+    def __init__(self, config: dict, mtime):
+        self.responses = {key: _compile_entry(entry) for key, entry in (config.get("DUSTY_RESPONSES") or {}).items()}
+        self.snark = tuple(config.get("DUSTY_SNARK") or ())
+        self.holidays = dict(config.get("HOLIDAY_SNARK") or {})
+        self.mtime = mtime
+
+
+class DustyTemplates:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._failed_mtime = None
+        self._set = self._load()
+        self._timings = {}  # key -> [renders, total_ns]
+
+    def _load(self) -> TemplateSet:
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, "r") as f:
+            return TemplateSet(yaml.safe_load(f) or {}, mtime)
+
+    def current(self) -> TemplateSet:
+        """The live template set, reloading first if the file changed."""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + CHECK_INTERVAL
+            self._maybe_reload()
+        return self._set
+
+    def _maybe_reload(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime in (self._set.mtime, self._failed_mtime) or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._set = self._load()  # a single reference swap; readers see old or new, never half
+            log_event(log, "dusty.reloaded", path=self.path)
+        except Exception as e:
+            log_event(log, "dusty.reload_failed", logging.ERROR, path=self.path, error=str(e))
+            self._failed_mtime = mtime
+        finally:
+            self._lock.release()
+
+    def has(self, key) -> bool:
+        return key in self.current().responses
+
+    def pick(self, key: str, tone: str = "default") -> CompiledTemplate:
+        """A random template for key/tone, or the key compiled as literal text when it isn't a key."""
+        table = self.current().responses.get(key)
+        if table is None:
+            return compile_literal(key)
+        return random.choice(table.get(tone) or table["default"])
+
+    def render(self, key: str, tone: str, values: dict, defaults: dict = {}) -> str:
+        start = time.perf_counter_ns()
+        text = self.pick(key, tone).render(values, defaults)
+        elapsed = time.perf_counter_ns() - start
+        stat = self._timings.setdefault(key if self.has(key) else "<literal>", [0, 0])
+        stat[0] += 1
+        stat[1] += elapsed
+        return text
+
+    def snark(self) -> str | None:
+        options = self.current().snark
+        return random.choice(options) if options else None
+
+    def holiday(self, month_day: str) -> str | None:
+        return self.current().holidays.get(month_day)
+
+    def render_stats(self) -> dict:
+        """{key: {"renders": n, "avg_us": mean render time}}, for metrics and benchmarks."""
+        return {
+            key: {"renders": n, "avg_us": round(total / n / 1000, 2) if n else 0.0}
+            for key, (n, total) in list(self._timings.items())
+        }
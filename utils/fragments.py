@@ -0,0 +1,109 @@
+# utils/fragments.py
+
+import threading
+from collections import OrderedDict
+from markupsafe import Markup
+from utils.changes import subscribe
+
+# -------------------------------
+# Rendered Fragment Cache
+# -------------------------------
+# Dashboard pieces (one per chore card, one per user <select>) are cached as
+# finished HTML. A fragment's key is its owner ("chore", id) plus a version:
+# the row values it was rendered from. A stale fragment can therefore never
+# be served, even when another worker made the change; the write listener
+# below just frees the memory of fragments whose row has changed.
+
+
+class FragmentCache:
+    """Bounded LRU of rendered HTML with hit/miss counters."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # (owner, version) -> Markup
+        self._by_owner = {}             # owner -> set of keys
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_render(self, owner, version, render) -> Markup:
+        """Return the cached fragment for (owner, version), rendering it on a miss."""
+        key = (owner, version)
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        # Render outside the lock; two requests racing on a miss both render, one wins.
+        html = Markup(render())
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            self._by_owner.setdefault(owner, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._forget(old_key)
+                self.evictions += 1
+        return html
+
+    def _forget(self, key):
+        keys = self._by_owner.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_owner[key[0]]
+
+    def invalidate(self, owner):
+        """Drop every fragment rendered for `owner`."""
+        with self._lock:
+            for key in self._by_owner.pop(owner, ()):
+                self._entries.pop(key, None)
+
+    def invalidate_kind(self, kind: str):
+        """Drop every fragment whose owner is of the given kind, e.g. "chore"."""
+        with self._lock:
+            for owner in [o for o in self._by_owner if o[0] == kind]:
+                for key in self._by_owner.pop(owner):
+                    self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_owner.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+fragment_cache = FragmentCache()
+
+
+@subscribe
+def _evict_on_write(changes):
+    for change in changes:
+        if change.model == "Chore":
+            if change.pk is None:
+                fragment_cache.invalidate_kind("chore")
+            else:
+                fragment_cache.invalidate(("chore", change.pk))
+        elif change.model == "User":
+            # Names show up on every card and in every dropdown.
+            fragment_cache.invalidate_kind("chore")
+            fragment_cache.invalidate_kind("user_options")
+
+
+def init_fragments(app):
+    fragment_cache.max_entries = app.config.get("FRAGMENT_CACHE_SIZE", fragment_cache.max_entries)
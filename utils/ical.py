@@ -0,0 +1,92 @@
+# utils/ical.py
+
+import re
+from datetime import datetime, timedelta
+
+# -------------------------------
+# iCalendar (RFC 5545) Serialization
+# -------------------------------
+
+WEEKDAYS = {
+    "monday": "MO", "tuesday": "TU", "wednesday": "WE", "thursday": "TH",
+    "friday": "FR", "saturday": "SA", "sunday": "SU",
+}
+
+# Labels the SMS parser (utils/nlp/parser.py) and the dashboard produce.
+RRULES = {
+    "daily": "FREQ=DAILY",
+    "weekdays": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "weekends": "FREQ=WEEKLY;BYDAY=SA,SU",
+    "weekly": "FREQ=WEEKLY",
+    "biweekly": "FREQ=WEEKLY;INTERVAL=2",
+    "monthly": "FREQ=MONTHLY",
+    "monthly (specific day)": "FREQ=MONTHLY",
+}
+
+
+def rrule_for(recurrence: str | None) -> str | None:
+    """RRULE value for a chore's recurrence label, or None if it doesn't repeat (or we can't tell)."""
+    if not recurrence:
+        return None
+    label = recurrence.strip().lower()
+    if label in RRULES:
+        return RRULES[label]
+    # "weekly (Monday, Thursday)"
+    match = re.fullmatch(r"weekly \((.+)\)", label)
+    if match:
+        days = [WEEKDAYS.get(d.strip()) for d in match.group(1).split(",")]
+        if all(days):
+            return "FREQ=WEEKLY;BYDAY=" + ",".join(days)
+    return None
+
+
+def _escape(text: str) -> str:
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _fold(line: str) -> str:
+    """Split content lines longer than 75 octets, as the RFC requires."""
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return line
+    parts, start = [], 0
+    while start < len(raw):
+        end = min(start + (75 if not parts else 74), len(raw))
+        while end < len(raw) and (raw[end] & 0xC0) == 0x80:  # don't cut a UTF-8 sequence
+            end -= 1
+        parts.append(raw[start:end].decode("utf-8"))
+        start = end
+    return "\r\n ".join(parts)
+
+
+def build_calendar(name: str, chores, host: str = "dusty-chores") -> bytes:
+    """
+    Serialize chores as all-day events. `chores` is an iterable of
+    (id, name, due_date, recurrence, created_at) tuples; undated chores are left out.
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Dusty//Chores//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for chore_id, chore_name, due_date, recurrence, created_at in chores:
+        if due_date is None:
+            continue
+        stamp = (created_at or datetime(2000, 1, 1)).strftime("%Y%m%dT%H%M%SZ")
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:chore-{chore_id}@{host}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{due_date.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(due_date + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_escape(chore_name)}",
+        ]
+        rule = rrule_for(recurrence)
+        if rule:
+            lines.append(f"RRULE:{rule}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(_fold(line) for line in lines) + "\r\n").encode("utf-8")
@@ -0,0 +1,140 @@
+# utils/log.py
+
+import atexit
+import hashlib
+import json
+import logging
+import queue
+import sys
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, request
+
+# -------------------------------
+# Structured, Off-thread Logging
+# -------------------------------
+# Code logs events: a short dotted name plus fields, e.g.
+#   log_event(log, "sms.received", phone=phone_hash(p), intents=2)
+# Levels gate the call before any field is formatted. Records are put on a
+# queue as-is; a QueueListener thread does the formatting and the stdout
+# write, so the request thread never blocks on I/O. Records made during a
+# request carry its request id.
+
+ROOT = "dusty"
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+_listener = None
+_phone_salt = b""
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields):
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": fields}, stacklevel=2)
+
+
+def phone_hash(phone: str | None) -> str | None:
+    """Stable, non-reversible tag for a phone number, so logs can be correlated without holding PII."""
+    if not phone:
+        return None
+    return hashlib.sha256(_phone_salt + phone.encode()).hexdigest()[:10]
+
+
+class _RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue the record untouched; formatting happens on the listener thread."""
+
+    def prepare(self, record):
+        return record
+
+
+class StructuredFormatter(logging.Formatter):
+    """One line per event: logfmt by default, JSON with json_lines=True."""
+
+    def __init__(self, json_lines: bool = False):
+        super().__init__()
+        self.json_lines = json_lines
+
+    def format(self, record):
+        fields = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname.lower(),
+            "logger": record.name.removeprefix(f"{ROOT}."),
+            "event": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            fields["request_id"] = record.request_id
+        fields.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            fields["exc"] = self.formatException(record.exc_info)
+        if self.json_lines:
+            return json.dumps(fields, default=str)
+        return " ".join(f"{key}={_logfmt(value)}" for key, value in fields.items() if value is not None)
+
+
+def _logfmt(value) -> str:
+    text = str(value)
+    if not text or any(c in text for c in ' ="\n'):
+        return json.dumps(text, ensure_ascii=False)
+    return text
+
+
+def configure_logging(level="INFO", json_lines: bool = False, stream=None, salt: str = ""):
+    """Route the "dusty" loggers through a queue to one listener thread (idempotent)."""
+    global _listener, _phone_salt
+    _phone_salt = salt.encode()
+    root = logging.getLogger(ROOT)
+    root.setLevel(level)
+    if _listener is not None:
+        return
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(StructuredFormatter(json_lines))
+    records = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(records)
+    handler.addFilter(_RequestIdFilter())
+    root.addHandler(handler)
+    root.propagate = False
+    _listener = QueueListener(records, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Write out whatever is still queued and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def init_logging(app):
+    """Configure from LOG_LEVEL / LOG_JSON and tag every request with an id."""
+    configure_logging(app.config.get("LOG_LEVEL", "INFO"), app.config.get("LOG_JSON", False),
+                      salt=app.config.get("SECRET_KEY", ""))
+
+    @app.before_request
+    def _start_request():
+        g.request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex[:12]
+        g.request_id_token = request_id_var.set(g.request_id)
+
+    @app.after_request
+    def _tag_response(response):
+        if "request_id" in g:
+            response.headers["X-Request-ID"] = g.request_id
+        return response
+
+    @app.teardown_request
+    def _end_request(exc):
+        token = g.pop("request_id_token", None)
+        if token is not None:
+            request_id_var.reset(token)
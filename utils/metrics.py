@@ -0,0 +1,184 @@
+# utils/metrics.py
+
+import bisect
+import threading
+import time
+from flask import g, request
+
+# -------------------------------
+# In-process Metrics
+# -------------------------------
+# Counters and fixed-bucket histograms, keyed by (name, labels) and kept
+# per worker. Collectors are callbacks that report existing stats (fragment
+# cache, SMS segments, outbox...) at scrape time. render() emits the
+# Prometheus text format for /metrics. When disabled, inc/observe return
+# straight away and timed() hands back a shared no-op context manager.
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Timed:
+    __slots__ = ("metrics", "name", "labels", "start")
+
+    def __init__(self, metrics, name, labels):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics._observe(self.name, self.labels, time.perf_counter() - self.start)
+
+
+class _NoopTimed:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NOOP = _NoopTimed()
+
+
+class Metrics:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters = {}    # (name, labels) -> float
+        self._histograms = {}  # (name, labels) -> _Histogram
+        self._help = {}
+        self._collectors = []
+
+    def describe(self, name: str, text: str):
+        self._help[name] = text
+
+    def inc(self, name: str, value: float = 1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels):
+        if self.enabled:
+            self._observe(name, tuple(sorted(labels.items())), seconds)
+
+    def _observe(self, name, labels, seconds):
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[(name, labels)] = _Histogram()
+            histogram.observe(seconds)
+
+    def timed(self, name: str, **labels):
+        """`with metrics.timed("x_seconds", phase="parse"):` observes the block's duration."""
+        if not self.enabled:
+            return _NOOP
+        return _Timed(self, name, tuple(sorted(labels.items())))
+
+    def collector(self, func):
+        """Register func() -> [(name, type, labels dict, value)], called on every scrape."""
+        self._collectors.append(func)
+        return func
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                ((key, (list(h.counts), h.sum, h.count)) for key, h in self._histograms.items()),
+            )
+        lines = []
+        typed = set()
+
+        def header(name, kind):
+            if name in typed:
+                return
+            typed.add(name)
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            header(name, "counter")
+            lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        for (name, labels), (counts, total, count) in histograms:
+            header(name, "histogram")
+            cumulative = 0
+            for bound, n in zip(BUCKETS + ("+Inf",), counts):
+                cumulative += n
+                lines.append(f"{name}_bucket{_labels(labels + (('le', str(bound)),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+        for collect in self._collectors:
+            try:
+                samples = collect()
+            except Exception:
+                continue
+            for name, kind, labels, value in samples:
+                header(name, kind)
+                lines.append(f"{name}{_labels(tuple(sorted(labels.items())))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels) -> str:
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+def _number(value) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+metrics = Metrics()
+
+metrics.describe("dusty_request_seconds", "Time spent handling HTTP requests, by endpoint.")
+metrics.describe("dusty_sms_phase_seconds", "Time spent in each phase of an inbound SMS.")
+metrics.describe("dusty_sms_intents_total", "Intents handled from inbound SMS.")
+metrics.describe("dusty_sms_sent_total", "Outbound SMS by result.")
+metrics.describe("dusty_sms_send_seconds", "Time spent in the SMS provider call.")
+metrics.describe("dusty_scheduler_runs_total", "Scheduler job runs by job and result.")
+
+
+def init_metrics(app):
+    """METRICS_ENABLED switches collection; when on, every request is timed by endpoint."""
+    metrics.enabled = app.config.get("METRICS_ENABLED", True)
+    if not metrics.enabled:
+        return
+
+    @app.before_request
+    def _start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.teardown_request
+    def _observe_request(exc):
+        started = g.pop("metrics_started", None)
+        if started is not None and request.endpoint != "metrics.scrape":
+            metrics.observe("dusty_request_seconds", time.perf_counter() - started,
+                            endpoint=request.endpoint or "unknown")
@@ -35,7 +35,14 @@ def detect_follow_up(doc) -> bool:
     pronoun_like = any(token.lower_ in FOLLOW_UP_PRONOUNS for token in doc)
     return verb_like and pronoun_like
 
+AUTO_ASSIGN_PATTERN = re.compile(r"\b(assign (everything|all|the rest)|auto[- ]?assign)\b")
+
+
 def resolve_intent(doc) -> str:
+    # "assign everything" would otherwise read as a follow-up on "assign"
+    if AUTO_ASSIGN_PATTERN.search(doc.text.lower()):
+        return "auto_assign"
+
     # Prioritize known intent keywords first
     for token in doc:
         for intent, keywords in INTENT_KEYWORDS.items():
@@ -0,0 +1,122 @@
+# utils/pagination.py
+
+import base64
+import json
+from datetime import date, datetime
+from flask import current_app, request
+from sqlalchemy import and_, or_
+
+# -------------------------------
+# Keyset (seek) Pagination
+# -------------------------------
+
+class KeysetPage:
+    """One page of results plus opaque cursors for the neighbouring pages."""
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None, per_page=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.per_page = per_page
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+def encode_cursor(values) -> str:
+    payload = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, python_type) -> tuple | None:
+    """Turn a cursor back into (sort_value, id); returns None for garbage input."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        value, row_id = json.loads(raw)
+        if value is not None and python_type in (date, datetime):
+            value = python_type.fromisoformat(value)
+        return value, int(row_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def page_args():
+    """Read ?after=, ?before= and ?per_page= from the current request."""
+    default = current_app.config.get("PAGE_SIZE", 25)
+    maximum = current_app.config.get("MAX_PAGE_SIZE", 100)
+    per_page = request.args.get("per_page", default, type=int)
+    return {
+        "after": request.args.get("after") or None,
+        "before": request.args.get("before") or None,
+        "per_page": max(1, min(per_page, maximum)),
+    }
+
+
+def _seek(sort_col, id_col, value, row_id, forward, nullable):
+    """Rows strictly past (value, row_id) in the direction of travel. NULL sorts lowest, as in SQLite."""
+    def past(col, v):
+        if forward:
+            if v is None:
+                return col.isnot(None) if nullable else None
+            return col > v
+        if v is None:
+            return None
+        return or_(col.is_(None), col < v) if nullable else col < v
+
+    def same(col, v):
+        return col.is_(None) if v is None else col == v
+
+    tie = and_(same(sort_col, value), id_col > row_id if forward else id_col < row_id)
+    beyond = past(sort_col, value)
+    return tie if beyond is None else or_(beyond, tie)
+
+
+def keyset_paginate(query, sort_col, id_col, after=None, before=None, per_page=25,
+                    descending=False, nullable=False) -> KeysetPage:
+    """
+    Page through `query` ordered by (sort_col, id_col) without OFFSET, so every
+    page costs the same regardless of how deep into the listing it is.
+    """
+    python_type = sort_col.type.python_type
+    cursor = decode_cursor(before, python_type) if before else None
+    backward = cursor is not None
+    if not backward:
+        cursor = decode_cursor(after, python_type) if after else None
+
+    # Walking "forward" means moving in the listing's own display order.
+    ascending = descending == backward
+    single = len(query.column_descriptions) == 1
+    q = query.add_columns(sort_col.label("_sort_key"), id_col.label("_id_key"))
+    if cursor:
+        q = q.filter(_seek(sort_col, id_col, cursor[0], cursor[1], ascending, nullable))
+    if ascending:
+        q = q.order_by(sort_col.asc(), id_col.asc())
+    else:
+        q = q.order_by(sort_col.desc(), id_col.desc())
+
+    rows = q.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backward:
+        rows.reverse()
+
+    # Column queries keep their named rows; the two trailing key columns ride along.
+    items = [row[0] if single else row for row in rows]
+    keys = [(row[-2], row[-1]) for row in rows]
+    if not keys:
+        return KeysetPage(items, per_page=per_page)
+
+    if backward:
+        next_cursor = encode_cursor(keys[-1])
+        prev_cursor = encode_cursor(keys[0]) if has_more else None
+    else:
+        next_cursor = encode_cursor(keys[-1]) if has_more else None
+        prev_cursor = encode_cursor(keys[0]) if cursor else None
+    return KeysetPage(items, next_cursor, prev_cursor, per_page)
@@ -0,0 +1,149 @@
+# utils/pubsub.py
+
+import itertools
+import queue
+import threading
+import time
+from utils.changes import subscribe
+from utils.versioning import data_version
+
+# -------------------------------
+# In-process Chore Event Broker
+# -------------------------------
+# Committed chore changes are turned into small events and fanned out to
+# every live /events connection through a bounded queue per subscriber.
+# Publishing never blocks: a subscriber that falls behind gets its backlog
+# replaced with a single "resync" event and reloads the page instead.
+# Commits made by other workers are not seen as events. A watcher thread
+# polls the shared data version instead, and when another process has
+# written it sends this worker's listeners a "resync".
+
+
+class Subscription:
+    __slots__ = ("queue",)
+
+    def __init__(self, maxsize):
+        self.queue = queue.Queue(maxsize=maxsize)
+
+    def get(self, timeout):
+        """Next event, or None if nothing arrived within `timeout` seconds."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class Broker:
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+
+    def subscribe(self, max_subscribers: int):
+        """A new Subscription, or None when max_subscribers are already connected."""
+        with self._lock:
+            if len(self._subscribers) >= max_subscribers:
+                return None
+            sub = Subscription(self.queue_size)
+            self._subscribers.add(sub)
+            return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def connections(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event_type: str, data: dict):
+        event = {"id": next(self._seq), "type": event_type, "data": data}
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.queue.put_nowait(event)
+            except queue.Full:
+                _drain(sub.queue)
+                sub.queue.put_nowait({"id": event["id"], "type": "resync", "data": {}})
+
+
+def _drain(q):
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+broker = Broker()
+
+# Columns a dashboard card shows; anything else changing is not worth an event.
+CARD_FIELDS = ("name", "assigned_to_id", "due_date", "recurrence", "completed")
+
+
+def chore_event(change):
+    """Map a committed Chore change to (event type, payload), or None."""
+    if change.op == "insert":
+        kind = "added"
+    elif change.op == "delete":
+        kind = "deleted"
+    elif change.new.get("completed") and "completed" in change.changed:
+        kind = "completed"
+    elif "assigned_to_id" in change.changed:
+        kind = "reassigned"
+    elif "due_date" in change.changed:
+        kind = "snoozed"
+    elif change.changed & set(CARD_FIELDS):
+        kind = "updated"
+    else:
+        return None
+
+    data = {"id": change.pk}
+    for field in CARD_FIELDS:
+        if field in change.new:
+            value = change.new[field]
+            data[field] = value.isoformat() if hasattr(value, "isoformat") else value
+    return kind, data
+
+
+@subscribe
+def _publish_chore_changes(changes):
+    if not broker.connections:
+        return
+    for change in changes:
+        if change.model != "Chore":
+            continue
+        event = chore_event(change)
+        if event:
+            broker.publish(*event)
+
+
+def check_other_workers() -> bool:
+    """Tell local listeners to resync if another process wrote since the last check."""
+    if data_version.changed_elsewhere() and broker.connections:
+        broker.publish("resync", {})
+        return True
+    return False
+
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def watch_other_workers(interval: float):
+    """Start the version watcher thread once per process; interval <= 0 disables it."""
+    global _watcher
+    if interval <= 0:
+        return
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = threading.Thread(target=_watch, args=(interval,), name="sse-version-watch", daemon=True)
+            _watcher.start()
+
+
+def _watch(interval):
+    while True:
+        time.sleep(interval)
+        check_other_workers()
@@ -0,0 +1,178 @@
+# utils/sqlprofile.py
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from flask import g, request
+from sqlalchemy import event
+from models import db
+from utils.log import get_logger, log_event
+from utils.metrics import metrics
+
+# -------------------------------
+# Per-request SQL Profiling
+# -------------------------------
+# Cursor-level hooks on the engine time every statement. During a request
+# the statements are tallied on a RequestProfile: count, total time, and
+# how often each statement *shape* ran, so a loop that lazy-loads one row
+# per item shows up as the same shape N times. Slow statements are logged
+# with their parameters whenever they happen (scheduler jobs included).
+# Finished requests are folded into per-endpoint totals for worst_routes().
+
+log = get_logger("sql")
+
+_current: ContextVar["RequestProfile | None"] = ContextVar("sql_profile", default=None)
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Whitespace-collapsed statement with expanded IN lists folded to (?...)."""
+    return _IN_LIST.sub("(?...)", _SPACE.sub(" ", statement).strip())
+
+
+class RequestProfile:
+    __slots__ = ("endpoint", "count", "seconds", "shapes")
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int):
+        """[(shape, times)] for shapes run at least `threshold` times."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+class SQLProfiler:
+    def __init__(self, slow_ms: float = 100.0, repeat_threshold: int = 5):
+        self.slow_ms = slow_ms
+        self.repeat_threshold = repeat_threshold
+        self._lock = threading.Lock()
+        self._routes = {}  # endpoint -> {"requests", "queries", "max_queries", "seconds", "repeats"}
+
+    # ---- Engine hooks ----
+
+    def attach(self, engine):
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._error)
+
+    def detach(self, engine):
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+        event.remove(engine, "handle_error", self._error)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("sql_profile_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("sql_profile_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        profile = _current.get()
+        if profile is not None:
+            profile.record(statement, elapsed)
+        if elapsed * 1000 >= self.slow_ms:
+            log_event(log, "sql.slow", logging.WARNING, ms=round(elapsed * 1000, 2),
+                      endpoint=profile.endpoint if profile else None,
+                      statement=_SPACE.sub(" ", statement).strip(), params=_short(parameters))
+
+    def _error(self, context):
+        # after_cursor_execute never fires for a failed statement; drop its start time here.
+        conn = context.connection
+        starts = conn.info.get("sql_profile_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+    # ---- Request lifecycle ----
+
+    def start(self, endpoint):
+        return _current.set(RequestProfile(endpoint))
+
+    def finish(self, token):
+        profile = _current.get()
+        _current.reset(token)
+        if profile is None:
+            return None
+        repeats = profile.repeated(self.repeat_threshold)
+        for shape, times in repeats:
+            log_event(log, "sql.repeated", logging.WARNING, endpoint=profile.endpoint, times=times, statement=shape)
+        with self._lock:
+            route = self._routes.setdefault(
+                profile.endpoint, {"requests": 0, "queries": 0, "max_queries": 0, "seconds": 0.0, "repeats": 0},
+            )
+            route["requests"] += 1
+            route["queries"] += profile.count
+            route["max_queries"] = max(route["max_queries"], profile.count)
+            route["seconds"] += profile.seconds
+            route["repeats"] += len(repeats)
+        metrics.inc("dusty_sql_queries_total", profile.count, endpoint=profile.endpoint)
+        metrics.observe("dusty_sql_request_seconds", profile.seconds, endpoint=profile.endpoint)
+        return profile
+
+    # ---- Summary ----
+
+    def worst_routes(self, limit: int = 10, by: str = "avg_queries") -> list[dict]:
+        """Endpoints ranked by avg_queries, max_queries, avg_ms or repeats."""
+        with self._lock:
+            routes = [(endpoint, dict(totals)) for endpoint, totals in self._routes.items()]
+        rows = [
+            {
+                "endpoint": endpoint,
+                "requests": t["requests"],
+                "avg_queries": round(t["queries"] / t["requests"], 2),
+                "max_queries": t["max_queries"],
+                "avg_ms": round(t["seconds"] * 1000 / t["requests"], 2),
+                "repeats": t["repeats"],
+            }
+            for endpoint, t in routes
+        ]
+        rows.sort(key=lambda row: row.get(by, 0), reverse=True)
+        return rows[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+def _short(parameters, limit: int = 300) -> str:
+    text = repr(parameters)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+sql_profiler = SQLProfiler()
+
+metrics.describe("dusty_sql_queries_total", "SQL statements run while handling requests, by endpoint.")
+metrics.describe("dusty_sql_request_seconds", "Total SQL time per request, by endpoint.")
+
+
+def init_sql_profiling(app):
+    """SQL_PROFILE_ENABLED switches it; SLOW_QUERY_MS and SQL_REPEAT_THRESHOLD tune the warnings."""
+    if not app.config.get("SQL_PROFILE_ENABLED", True):
+        return
+    sql_profiler.slow_ms = app.config.get("SLOW_QUERY_MS", sql_profiler.slow_ms)
+    sql_profiler.repeat_threshold = app.config.get("SQL_REPEAT_THRESHOLD", sql_profiler.repeat_threshold)
+    with app.app_context():
+        sql_profiler.attach(db.engine)
+
+    @app.before_request
+    def _start_sql_profile():
+        g.sql_profile_token = sql_profiler.start(request.endpoint or "unknown")
+
+    @app.teardown_request
+    def _finish_sql_profile(exc):
+        token = g.pop("sql_profile_token", None)
+        if token is not None:
+            sql_profiler.finish(token)
@@ -0,0 +1,92 @@
+# utils/stats.py
+
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models import db, User, UserDailyStats, UserWeeklyStats
+from services.archive import archive_attached, history_source
+
+# -------------------------------
+# Completion Rollups
+# -------------------------------
+
+def week_start(day):
+    """Monday of the week containing `day`."""
+    return day - timedelta(days=day.weekday())
+
+
+def _bump(model, key, value, user_id, amount):
+    stmt = sqlite_insert(model).values(user_id=user_id, completions=amount, **{key: value})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", key],
+        set_={"completions": model.completions + stmt.excluded.completions},
+    )
+    db.session.execute(stmt)
+
+
+def record_completion_rollups(user_id: int, completed_at: datetime | None = None):
+    """
+    Count one completion in the day and week rollups. Runs inside the caller's
+    transaction so the counters commit (or roll back) together with ChoreHistory.
+    """
+    day = (completed_at or datetime.utcnow()).date()
+    _bump(UserDailyStats, "day", day, user_id, 1)
+    _bump(UserWeeklyStats, "week_start", week_start(day), user_id, 1)
+
+
+def leaderboard(window: str = "week", today=None, limit: int = 10):
+    """Return [(user_name, completions)] for today or this week, read only from the rollups."""
+    today = today or datetime.utcnow().date()
+    if window == "day":
+        model, key, value = UserDailyStats, UserDailyStats.day, today
+    else:
+        model, key, value = UserWeeklyStats, UserWeeklyStats.week_start, week_start(today)
+    return (
+        db.session.query(User.name, model.completions)
+        .join(User, User.id == model.user_id)
+        .filter(key == value, model.completions > 0)
+        .order_by(model.completions.desc(), User.name)
+        .limit(limit)
+        .all()
+    )
+
+
+def backfill_rollups(batch_size: int = 1000) -> int:
+    """
+    Rebuild both rollup tables from ChoreHistory, archived rows included.
+    History is streamed in batches, so memory grows with distinct
+    (user, day) pairs, not with rows. Returns the number of history rows read.
+    """
+    daily = Counter()
+    rows = 0
+    source = history_source(include_archive=archive_attached())
+    query = (
+        db.session.query(source.c.user_id, source.c.completed_at)
+        .filter(source.c.completed_at.isnot(None))
+        .yield_per(batch_size)
+    )
+    for user_id, completed_at in query:
+        daily[(user_id, completed_at.date())] += 1
+        rows += 1
+
+    weekly = Counter()
+    for (user_id, day), count in daily.items():
+        weekly[(user_id, week_start(day))] += count
+
+    db.session.query(UserDailyStats).delete()
+    db.session.query(UserWeeklyStats).delete()
+    _insert_batches(UserDailyStats, "day", daily, batch_size)
+    _insert_batches(UserWeeklyStats, "week_start", weekly, batch_size)
+    db.session.commit()
+    return rows
+
+
+def _insert_batches(model, key, counts, batch_size):
+    batch = []
+    for (user_id, value), count in counts.items():
+        batch.append({"user_id": user_id, key: value, "completions": count})
+        if len(batch) >= batch_size:
+            db.session.execute(model.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(model.__table__.insert(), batch)
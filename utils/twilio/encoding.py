@@ -0,0 +1,124 @@
+# utils/twilio/encoding.py
+
+import math
+import re
+import threading
+import unicodedata
+from flask import current_app, has_app_context
+from utils.log import get_logger, log_event
+
+# -------------------------------
+# GSM-7 Aware SMS Rendering
+# -------------------------------
+# A single character outside the GSM 03.38 alphabet (an emoji, a curly
+# quote) sends the whole message as UCS-2: 70 characters per segment
+# instead of 160, 67 instead of 153 once it is split. prepare_sms() runs
+# after Dusty has rendered a reply: in GSM-safe mode it swaps in ASCII
+# equivalents, then drops the reply's optional asides (newest first) until
+# it fits the segment budget, and counts what was billed.
+
+GSM7_BASIC = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+GSM7_EXTENDED = frozenset("^{}\\[~]|€\f")  # escape + char: two septets each
+
+GSM7_LIMITS = (160, 153)  # single-segment, per-segment once concatenated
+UCS2_LIMITS = (70, 67)
+
+log = get_logger("sms")
+
+ASCII_SUBSTITUTIONS = {
+    "‘": "'", "’": "'", "‚": "'", "′": "'",
+    "“": '"', "”": '"', "„": '"', "″": '"',
+    "–": "-", "—": "-", "−": "-", "•": "-",
+    "…": "...", "\u00a0": " ", "\u200b": "", "\ufe0f": "",
+    "✅": "OK", "❌": "X", "→": "->",
+}
+
+
+def is_gsm7(text: str) -> bool:
+    return all(c in GSM7_BASIC or c in GSM7_EXTENDED for c in text)
+
+
+def encoding_for(text: str) -> str:
+    return "GSM-7" if is_gsm7(text) else "UCS-2"
+
+
+def segment_count(text: str) -> tuple[str, int]:
+    """(encoding, billed segments) for a message body."""
+    if not text:
+        return "GSM-7", 1
+    if is_gsm7(text):
+        encoding, (single, multi) = "GSM-7", GSM7_LIMITS
+        units = sum(2 if c in GSM7_EXTENDED else 1 for c in text)
+    else:
+        encoding, (single, multi) = "UCS-2", UCS2_LIMITS
+        units = len(text.encode("utf-16-le")) // 2  # emoji are surrogate pairs
+    return encoding, (1 if units <= single else math.ceil(units / multi))
+
+
+def to_gsm7(text: str) -> str:
+    """
+    Replace what has an ASCII equivalent, strip accents the GSM alphabet
+    lacks and drop the rest (emoji); then tidy the spaces that leaves.
+    """
+    out = []
+    for c in text:
+        if c in GSM7_BASIC or c in GSM7_EXTENDED:
+            out.append(c)
+        elif c in ASCII_SUBSTITUTIONS:
+            out.append(ASCII_SUBSTITUTIONS[c])
+        else:
+            base = unicodedata.normalize("NFKD", c)
+            out.append("".join(ch for ch in base if ch in GSM7_BASIC))
+    text = "".join(out)
+    text = re.sub(r" {2,}", " ", text)
+    text = re.sub(r"\[ +| +\]", lambda m: m.group().strip(), text)
+    text = re.sub(r" +\n", "\n", text)
+    return text.strip(" ")
+
+
+# ---- Segment accounting ----
+
+_stats_lock = threading.Lock()
+_stats = {"messages": 0, "segments": 0, "ucs2_messages": 0, "segments_saved": 0, "asides_trimmed": 0}
+
+
+def sms_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _setting(name, default):
+    return current_app.config.get(name, default) if has_app_context() else default
+
+
+def prepare_sms(reply, gsm_safe: bool | None = None, budget: int | None = None) -> str:
+    """
+    Final body for a Reply (or plain str). Only a Reply's asides can be
+    trimmed; the core message is always sent whole, whatever it costs.
+    """
+    gsm_safe = _setting("SMS_GSM7_SAFE", True) if gsm_safe is None else gsm_safe
+    budget = _setting("SMS_SEGMENT_BUDGET", 2) if budget is None else budget
+
+    text = reply if isinstance(reply, str) else reply.text
+    _, before = segment_count(text)
+    render = to_gsm7 if gsm_safe else (lambda t: t)
+
+    body = render(text)
+    trimmed = 0
+    while budget and segment_count(body)[1] > budget and getattr(reply, "optional", None):
+        reply = reply.without_last_aside()
+        body = render(reply.text)
+        trimmed += 1
+
+    encoding, segments = segment_count(body)
+    with _stats_lock:
+        _stats["messages"] += 1
+        _stats["segments"] += segments
+        _stats["ucs2_messages"] += encoding == "UCS-2"
+        _stats["segments_saved"] += max(before - segments, 0)
+        _stats["asides_trimmed"] += trimmed
+    log_event(log, "sms.segments", segments=segments, encoding=encoding, before=before, trimmed=trimmed)
+    return body
@@ -0,0 +1,50 @@
+# utils/twilio/fake.py
+
+import random
+import threading
+import time
+
+# -------------------------------
+# Fake Twilio Transport
+# -------------------------------
+# Stands in for the Twilio REST call (an Outbox transport: transport(to, body)).
+# Messages are recorded in memory; each send can sleep for a simulated
+# latency and fail at a given rate. Latency and failures come from one
+# seeded RNG, drawn in call order, so with concurrent callers the same
+# draws can land on different messages from run to run.
+
+
+class FakeTwilioError(Exception):
+    pass
+
+
+class FakeTwilioTransport:
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.sent = []      # (to, body)
+        self.failed = 0
+
+    def __call__(self, to: str, body: str):
+        with self._lock:
+            delay = max(self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms), 0.0)
+            fail = self._rng.random() < self.failure_rate
+        if delay:
+            time.sleep(delay / 1000)
+        if fail:
+            with self._lock:
+                self.failed += 1
+            raise FakeTwilioError(f"simulated delivery failure to {to}")
+        with self._lock:
+            self.sent.append((to, body))
+
+    def messages_to(self, to: str) -> list[str]:
+        with self._lock:
+            return [body for number, body in self.sent if number == to]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"sent": len(self.sent), "failed": self.failed}
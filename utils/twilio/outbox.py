@@ -0,0 +1,129 @@
+# utils/twilio/outbox.py
+
+import atexit
+import logging
+import threading
+from utils.dusty.reply import Reply
+from utils.twilio.encoding import prepare_sms, segment_count, to_gsm7
+from utils.log import get_logger, log_event, phone_hash
+from utils.metrics import metrics
+
+# -------------------------------
+# Per-recipient SMS Coalescing
+# -------------------------------
+# The first message to a number opens a short window; anything else for
+# that number during the window is held with it. When the window closes
+# the held messages are joined into as few bodies as fit the segment
+# budget and each body is one Twilio call. Urgent messages skip the queue
+# (and go out synchronously, so the caller still sees delivery errors).
+# Held messages fail quietly: the error is logged and counted in stats().
+# They also live only in memory, so a killed worker loses them. A normal
+# exit flushes them. A window of 0 sends everything straight away.
+
+SEPARATOR = "\n\n"
+
+log = get_logger("outbox")
+
+
+class Outbox:
+    def __init__(self, transport, window: float = 0.0, budget: int = 2, gsm_safe: bool = True):
+        self.transport = transport  # transport(to, body) does the actual send
+        self.window = window
+        self.budget = budget
+        self.gsm_safe = gsm_safe
+        self._lock = threading.Lock()
+        self._pending = {}  # to -> [Reply]
+        self._timers = {}
+        self._stats = {"queued": 0, "urgent": 0, "sent": 0, "failed": 0}
+
+    def configure(self, window=None, budget=None, gsm_safe=None):
+        if window is not None:
+            self.window = window
+        if budget is not None:
+            self.budget = budget
+        if gsm_safe is not None:
+            self.gsm_safe = gsm_safe
+
+    def send(self, to: str, body, urgent: bool = False):
+        """Queue `body` (str or Reply) for `to`, or send it now if urgent or coalescing is off."""
+        if urgent or self.window <= 0:
+            with self._lock:
+                self._stats["urgent" if urgent else "queued"] += 1
+            self._deliver(to, body, raise_errors=True)
+            return
+        reply = body if isinstance(body, Reply) else Reply(body)
+        with self._lock:
+            self._stats["queued"] += 1
+            self._pending.setdefault(to, []).append(reply)
+            if to not in self._timers:
+                timer = threading.Timer(self.window, self.flush, args=(to,))
+                timer.daemon = True
+                self._timers[to] = timer
+                timer.start()
+
+    def flush(self, to: str | None = None):
+        """Send what is held for `to` (or for everyone) now."""
+        with self._lock:
+            targets = [to] if to is not None else list(self._pending)
+            batches = []
+            for number in targets:
+                timer = self._timers.pop(number, None)
+                if timer is not None:
+                    timer.cancel()
+                held = self._pending.pop(number, None)
+                if held:
+                    batches.append((number, held))
+        for number, held in batches:
+            for body in self._merge(held):
+                self._deliver(number, body)
+
+    def _fits(self, reply: Reply) -> bool:
+        text = to_gsm7(reply.text) if self.gsm_safe else reply.text
+        return segment_count(text)[1] <= self.budget
+
+    def _merge(self, held):
+        """Greedily join held messages, in order, while the result stays within budget."""
+        bodies = [held[0]]
+        for reply in held[1:]:
+            merged = bodies[-1] + SEPARATOR + reply
+            if not self.budget or self._fits(merged):
+                bodies[-1] = merged
+            else:
+                bodies.append(reply)
+        return bodies
+
+    def _deliver(self, to, body, raise_errors=False):
+        text = prepare_sms(body, gsm_safe=self.gsm_safe, budget=self.budget)
+        try:
+            with metrics.timed("dusty_sms_send_seconds"):
+                self.transport(to, text)
+        except Exception as e:
+            with self._lock:
+                self._stats["failed"] += 1
+            metrics.inc("dusty_sms_sent_total", result="failed")
+            if raise_errors:
+                raise
+            log_event(log, "outbox.send_failed", logging.ERROR, phone=phone_hash(to), error=str(e))
+            return
+        with self._lock:
+            self._stats["sent"] += 1
+        metrics.inc("dusty_sms_sent_total", result="sent")
+
+    def stats(self) -> dict:
+        """Counts plus merge_ratio: messages handed in per Twilio call made."""
+        with self._lock:
+            stats = dict(self._stats, pending=sum(len(v) for v in self._pending.values()))
+        handed_in = stats["queued"] + stats["urgent"]
+        calls = stats["sent"] + stats["failed"]
+        stats["merge_ratio"] = round(handed_in / calls, 2) if calls else 0.0
+        return stats
+
+
+def init_outbox(app, outbox: Outbox):
+    """Apply the app's SMS settings and make sure nothing held is lost at exit."""
+    outbox.configure(
+        window=app.config.get("SMS_COALESCE_SECONDS", 0),
+        budget=app.config.get("SMS_SEGMENT_BUDGET", 2),
+        gsm_safe=app.config.get("SMS_GSM7_SAFE", True),
+    )
+    atexit.register(outbox.flush)
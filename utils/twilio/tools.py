@@ -1,9 +1,12 @@
 # utils/twilio/tools.py
 
+import logging
 import os
 from twilio.rest import Client
 from twilio.twiml.messaging_response import MessagingResponse
 from dotenv import load_dotenv
+from utils.twilio.encoding import prepare_sms
+from utils.log import get_logger, log_event
 
 load_dotenv()
 
@@ -12,16 +15,18 @@ TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
 
 client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+log = get_logger("twilio")
 
 def send_sms(to: str, body: str):
     client.messages.create(
         to=to,
         from_=TWILIO_PHONE_NUMBER,
-        body=body
+        body=prepare_sms(body)
     )
 
 def _twiml(text: str) -> str:
-    print(f"[Dusty Replying] {text}")
+    text = prepare_sms(text)
+    log_event(log, "sms.reply_body", logging.DEBUG, body=text)
     resp = MessagingResponse()
     resp.message(text)
     return str(resp)
\ No newline at end of file
@@ -1,6 +1,10 @@
+import logging
 import os
 from datetime import datetime
 from models import  User
+from utils.log import get_logger, log_event, phone_hash
+
+log = get_logger("users")
 
 
 
@@ -11,7 +15,7 @@ from models import  User
 def seed_users_from_env(session):
     from sqlalchemy.exc import IntegrityError
 
-    print("🔧 Seeding users from environment variables...")
+    log_event(log, "users.seeding")
     users_added = 0
     for key, value in os.environ.items():
         if key.startswith("USER_"):
@@ -20,7 +24,7 @@ def seed_users_from_env(session):
 
             existing = session.query(User).filter_by(phone=phone).first()
             if existing:
-                print(f"⚠️  Skipping existing user: {name} ({phone})")
+                log_event(log, "users.seed_skipped", logging.DEBUG, name=name, phone=phone_hash(phone))
                 continue
 
             is_admin = name.lower() in ["ronnie", "becky"]  # ← mark admins
@@ -30,10 +34,10 @@ def seed_users_from_env(session):
 
     try:
         session.commit()
-        print(f"✅ Seeded {users_added} user(s).")
+        log_event(log, "users.seeded", added=users_added)
     except IntegrityError as e:
         session.rollback()
-        print(f"❌ Integrity error during seeding: {e}")
+        log_event(log, "users.seed_failed", logging.ERROR, error=str(e))
 
 
 
@@ -0,0 +1,112 @@
+# utils/versioning.py
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from flask import make_response, request, session
+from utils.changes import subscribe
+from utils.log import get_logger, log_event
+
+# -------------------------------
+# Global Data Version + Conditional GET
+# -------------------------------
+# The version is the mtime (ns) of a marker file, so every worker on the
+# host sees a bump as soon as any of them commits, and checking it is a
+# stat() call rather than a database query.
+
+VERSIONED_MODELS = {"Chore", "User", "ChoreHistory", "ChoreStats"}
+
+log = get_logger("version")
+
+
+class DataVersion:
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._local = time.time_ns()    # last version this process wrote
+        self._seen = self._local        # version at the last changed_elsewhere()
+        self._foreign = False           # a bump overwrote another process's write
+
+    def configure(self, path):
+        self.path = path
+        if path and not os.path.exists(path):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            open(path, "a").close()
+            self.bump()
+        with self._lock:
+            self._seen = self.current()
+            self._foreign = False
+
+    def current(self) -> int:
+        if self.path:
+            try:
+                return os.stat(self.path).st_mtime_ns
+            except OSError:
+                pass
+        return self._local
+
+    def bump(self) -> int:
+        with self._lock:
+            current = self.current()
+            if current not in (self._local, self._seen):
+                self._foreign = True
+            version = max(time.time_ns(), current + 1)
+            self._local = version
+            if self.path:
+                try:
+                    os.utime(self.path, ns=(version, version))
+                except OSError as e:
+                    log_event(log, "version.touch_failed", logging.WARNING, path=self.path, error=str(e))
+            return version
+
+    def changed_elsewhere(self) -> bool:
+        """Whether another process has bumped the version since the last call."""
+        with self._lock:
+            current = self.current()
+            changed = self._foreign or current not in (self._local, self._seen)
+            self._foreign = False
+            self._seen = current
+            return changed
+
+
+data_version = DataVersion()
+
+
+@subscribe
+def _bump_on_write(changes):
+    if any(change.model in VERSIONED_MODELS for change in changes):
+        data_version.bump()
+
+
+def init_versioning(app):
+    path = app.config.get("DATA_VERSION_PATH")
+    if path and not os.path.isabs(path):
+        path = os.path.join(app.instance_path, path)
+    data_version.configure(path)
+
+
+def conditional(view):
+    """
+    Answer 304 Not Modified when the client already has the page for the
+    current data version, before the view touches the database or Jinja.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        # Pending flash messages are part of the page even when the data isn't.
+        if session.get("_flashes"):
+            return view(*args, **kwargs)
+
+        version = data_version.current()
+        etag = f"{request.endpoint}-{version:x}"
+        if request.if_none_match.contains_weak(etag):
+            response = make_response("", 304)
+        else:
+            response = make_response(view(*args, **kwargs))
+        response.set_etag(etag, weak=True)
+        response.last_modified = datetime.fromtimestamp(version / 1e9, tz=timezone.utc)
+        response.cache_control.no_cache = True
+        return response
+    return wrapper